@@ -0,0 +1,3 @@
+from .loader import DataLoader
+
+__all__ = ["DataLoader"]
@@ -0,0 +1,205 @@
+import asyncio
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+)
+
+
+class DataLoader:
+    """
+    Coalesces the `load` calls issued during the same iteration of the event
+    loop into a single call to `batch_load`, which receives the list of the
+    requested keys & returns the list of their values, in the same order.
+    A value which is an exception instance fails the load of its key.
+
+    The values are cached by key for the lifetime of the loader, which is
+    meant to live as long as a request: `from_info` returns the loader of
+    the execution a resolver belongs to, created on first use.
+
+    Loaders are either given their `batch_load` coroutine function or
+    subclass `DataLoader` & implement the `batch_load` coroutine.
+    """
+
+    def __init__(
+        self,
+        batch_load: Optional[
+            Callable[[List[Hashable]], Awaitable[List[Any]]]
+        ] = None,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ) -> None:
+        """
+        :param batch_load: coroutine function loading the values of a list
+        of keys, if `batch_load` isn't implemented by a subclass
+        :param max_batch_size: maximum number of keys given to `batch_load`
+        at once, None for no limit
+        :param cache: whether the values are cached, otherwise each `load`
+        is given to `batch_load`
+        :raises TypeError: if neither `batch_load` is given nor implemented
+        """
+        if (
+            batch_load is None
+            and type(self).batch_load is DataLoader.batch_load
+        ):
+            raise TypeError(
+                "< %s > needs either a `batch_load` coroutine function or a "
+                "subclass implementing the `batch_load` coroutine."
+                % type(self).__name__
+            )
+
+        self._batch_load_fn = batch_load
+        self._max_batch_size = max_batch_size
+        self._cache: Optional[Dict[Hashable, asyncio.Future]] = (
+            {} if cache else None
+        )
+        self._queue: List[Any] = []
+        self.loads = 0
+        self.cache_hits = 0
+        self.batches = 0
+        self.batched_keys = 0
+        self.errors = 0
+
+    @classmethod
+    def from_info(cls, info: "Info", *args, **kwargs) -> "DataLoader":
+        """
+        Returns the loader of this class & `batch_load` function bound to the
+        execution of `info`, created with `args` & `kwargs` when it's first
+        requested.
+        :param info: the info given to the resolver
+        :return: the loader of the execution
+        """
+        # Loaders given different `batch_load` functions are distinct
+        batch_load = kwargs.get("batch_load", args[0] if args else None)
+        return info.execution_ctx.get_dataloader(
+            (cls, batch_load), lambda: cls(*args, **kwargs)
+        )
+
+    async def batch_load(self, keys: List[Hashable]) -> List[Any]:
+        """
+        Loads the values of `keys` through the `batch_load` function given
+        to the constructor, unless overridden by a subclass.
+        :param keys: the keys to load
+        :return: the values (or exceptions) of the keys, in the same order
+        """
+        return await self._batch_load_fn(keys)
+
+    def load(self, key: Hashable) -> asyncio.Future:
+        """
+        Returns a future resolved with the value of `key` once the batch it
+        belongs to is loaded. Each call gets its own future, so that a caller
+        cancelling it doesn't cancel the load for the other callers.
+        :param key: the key to load
+        :return: the future value of the key
+        """
+        self.loads += 1
+
+        if self._cache is not None:
+            future = self._cache.get(key)
+            if future is not None and not future.cancelled():
+                self.cache_hits += 1
+                return asyncio.shield(future)
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        if self._cache is not None:
+            self._cache[key] = future
+
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        """
+        Loads the values of several keys.
+        :param keys: the keys to load
+        :return: the values of the keys, in the same order
+        """
+        return await asyncio.gather(*[self.load(key) for key in keys])
+
+    def prime(self, key: Hashable, value: Any) -> "DataLoader":
+        """
+        Caches `value` as the value of `key`, unless `key` is already cached.
+        :param key: the key to prime
+        :param value: the value of the key (or an exception to raise)
+        :return: the loader itself
+        """
+        if self._cache is not None and key not in self._cache:
+            future = asyncio.get_event_loop().create_future()
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+            self._cache[key] = future
+        return self
+
+    def clear(self, key: Hashable) -> "DataLoader":
+        """
+        Removes the value of `key` from the cache.
+        :param key: the key to forget
+        :return: the loader itself
+        """
+        if self._cache is not None:
+            self._cache.pop(key, None)
+        return self
+
+    def clear_all(self) -> "DataLoader":
+        """
+        Empties the cache.
+        :return: the loader itself
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        return self
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "loads": self.loads,
+            "cache_hits": self.cache_hits,
+            "batches": self.batches,
+            "batched_keys": self.batched_keys,
+            "errors": self.errors,
+            "size": len(self._cache) if self._cache is not None else 0,
+        }
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+
+        batch_size = self._max_batch_size or len(queue)
+        for start in range(0, len(queue), batch_size):
+            asyncio.ensure_future(
+                self._load_batch(queue[start : start + batch_size])
+            )
+
+    async def _load_batch(self, batch: List[Any]) -> None:
+        keys = [key for key, _ in batch]
+        self.batches += 1
+        self.batched_keys += len(keys)
+
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    "< batch_load > must return as many values as keys: "
+                    "expected %d values, got %d." % (len(keys), len(values))
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            values = [e] * len(keys)
+
+        for (key, future), value in zip(batch, values):
+            if isinstance(value, Exception):
+                self.errors += 1
+                # Failed loads aren't cached so they can be retried
+                if self._cache is not None and self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(value)
+            elif not future.done():
+                future.set_result(value)
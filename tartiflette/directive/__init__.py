@@ -9,10 +9,14 @@ from .directive import Directive
 from .non_introspectable import NonIntrospectable
 from .skip import Skip
 from .include import Include
+from .defer import Defer
+from .stream import Stream
 
 BUILT_IN_DIRECTIVES = {
     "deprecated": Deprecated,
     "non_introspectable": NonIntrospectable,
     "skip": Skip,
     "include": Include,
+    "defer": Defer,
+    "stream": Stream,
 }
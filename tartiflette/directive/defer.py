@@ -0,0 +1,10 @@
+from .common import CommonDirective
+
+
+class Defer(CommonDirective):
+    """
+    The fields of a fragment marked with `@defer` are delivered in a
+    subsequent payload when the operation is executed incrementally (cf.
+    `tartiflette.executors.incremental`), the directive is ignored
+    otherwise.
+    """
@@ -0,0 +1,11 @@
+from .common import CommonDirective
+
+
+class Stream(CommonDirective):
+    """
+    The items of a list field marked with `@stream` after the first
+    `initialCount` ones are delivered in subsequent payloads when the
+    operation is executed incrementally (cf.
+    `tartiflette.executors.incremental`), the directive is ignored
+    otherwise.
+    """
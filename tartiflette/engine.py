@@ -1,20 +1,50 @@
+import asyncio
+
 from importlib import import_module, invalidate_caches
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from tartiflette.executors import breadth_first, incremental, streaming
 from tartiflette.executors.basic import (
-    execute as basic_execute,
-    subscribe as basic_subscribe,
+    execute_operation,
+    get_operation,
+    subscribe_operation,
 )
+from tartiflette.executors.deadline import get_deadline
+from tartiflette.executors.scheduler import ResolverScheduler
 from tartiflette.parser import TartifletteRequestParser
+from tartiflette.persisted_queries import (
+    InMemoryPersistedQueryStore,
+    PersistedQueryStore,
+    compute_query_hash,
+)
 from tartiflette.resolver.factory import (
     default_error_coercer,
     error_coercer_factory,
 )
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
-from tartiflette.types.exceptions.tartiflette import GraphQLError
+from tartiflette.types.exceptions.tartiflette import (
+    GraphQLError,
+    ImproperlyConfigured,
+    NoQueryProvided,
+    PersistedQueryHashMismatch,
+    PersistedQueryNotFound,
+)
+from tartiflette.utils.cache import LRUCache
+from tartiflette.utils.encoder import encode_json
 from tartiflette.utils.errors import to_graphql_error
 
+_EXECUTORS = ("basic", "breadth_first")
+
 
 def _import_modules(modules):
     if modules:
@@ -23,6 +53,199 @@ def _import_modules(modules):
     return []
 
 
+class PreparedOperation:
+    """
+    An operation of a query parsed, validated & planned once which can be
+    executed any number of times with different variables.
+    """
+
+    def __init__(
+        self,
+        operation: Optional["NodeOperationDefinition"],
+        error_coercer: Callable[[Exception], dict],
+        errors: Optional[List[dict]] = None,
+        jit_threshold: Optional[int] = None,
+        executor: str = "basic",
+        scheduler: Optional[ResolverScheduler] = None,
+        response_encoder: Callable[[dict], bytes] = encode_json,
+    ) -> None:
+        self._operation = operation
+        self._error_coercer = error_coercer
+        self._errors = errors
+        self._jit_threshold = jit_threshold
+        self._executor = executor
+        self._scheduler = scheduler
+        self._response_encoder = response_encoder
+
+    @property
+    def errors(self) -> Optional[List[dict]]:
+        """
+        The coerced errors encountered while preparing the operation, in
+        which case executing it will always return them.
+        """
+        return self._errors
+
+    async def execute(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """
+        Execute the prepared operation.
+        :param variables: the variables used in the GraphQL request
+        :param context: a dict containing anything you need
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
+        :return: a GraphQL response (as dict)
+        """
+        if self._errors:
+            return {"data": None, "errors": list(self._errors)}
+
+        if self._executor == "breadth_first":
+            return await breadth_first.execute_operation(
+                self._operation,
+                request_ctx=context,
+                initial_value=initial_value,
+                error_coercer=self._error_coercer,
+                variables=variables,
+                scheduler=self._scheduler,
+                deadline=get_deadline(timeout),
+            )
+
+        return await execute_operation(
+            self._operation,
+            request_ctx=context,
+            initial_value=initial_value,
+            error_coercer=self._error_coercer,
+            variables=variables,
+            jit_threshold=self._jit_threshold,
+            scheduler=self._scheduler,
+            deadline=get_deadline(timeout),
+        )
+
+    async def execute_to_bytes(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Execute the prepared operation & encode its response.
+        :param variables: the variables used in the GraphQL request
+        :param context: a dict containing anything you need
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
+        :return: a GraphQL response (as encoded by the response encoder)
+        """
+        return self._response_encoder(
+            await self.execute(
+                variables=variables,
+                context=context,
+                initial_value=initial_value,
+                timeout=timeout,
+            )
+        )
+
+    async def execute_to_chunks(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        chunk_size: int = 100,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterable[bytes]:
+        """
+        Execute the prepared operation & yield its encoded response chunk
+        after chunk.
+        :param variables: the variables used in the GraphQL request
+        :param context: a dict containing anything you need
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param chunk_size: the number of items of a list executed & sent at once
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
+        :return: the chunks of the GraphQL response (as encoded by the response encoder)
+        """
+        if self._errors:
+            yield self._response_encoder(
+                {"data": None, "errors": list(self._errors)}
+            )
+            return
+
+        async for chunk in streaming.stream_operation(  # pylint: disable=not-an-iterable
+            self._operation,
+            request_ctx=context,
+            initial_value=initial_value,
+            error_coercer=self._error_coercer,
+            encoder=self._response_encoder,
+            variables=variables,
+            scheduler=self._scheduler,
+            chunk_size=chunk_size,
+            deadline=get_deadline(timeout),
+        ):
+            yield chunk
+
+    async def execute_incremental(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Execute the prepared operation incrementally, delivering the
+        fragments marked with `@defer` & the items of the lists marked with
+        `@stream` in subsequent payloads.
+        :param variables: the variables used in the GraphQL request
+        :param context: a dict containing anything you need
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, in all the payloads, their fields resolving to a `DeadlineExceeded` error
+        :return: the payloads of the GraphQL response (as dict)
+        """
+        if self._errors:
+            yield {"data": None, "errors": list(self._errors)}
+            return
+
+        async for payload in incremental.execute_operation(  # pylint: disable=not-an-iterable
+            self._operation,
+            request_ctx=context,
+            initial_value=initial_value,
+            error_coercer=self._error_coercer,
+            variables=variables,
+            scheduler=self._scheduler,
+            deadline=get_deadline(timeout),
+        ):
+            yield payload
+
+    async def subscribe(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+    ) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Execute the prepared subscription operation.
+        :param variables: the variables used in the GraphQL request
+        :param context: a dict containing anything you need
+        :param initial_value: an initial value corresponding to the root type being executed
+        :return: a GraphQL response (as dict)
+        """
+        if self._errors:
+            yield {"data": None, "errors": list(self._errors)}
+            return
+
+        async for result in subscribe_operation(  # pylint: disable=not-an-iterable
+            self._operation,
+            request_ctx=context,
+            initial_value=initial_value,
+            error_coercer=self._error_coercer,
+            variables=variables,
+            scheduler=self._scheduler,
+        ):
+            yield result
+
+
 class Engine:
     def __init__(
         self,
@@ -32,6 +255,16 @@ class Engine:
         custom_default_resolver: Optional[Callable] = None,
         exclude_builtins_scalars: Optional[List[str]] = None,
         modules: Optional[Union[str, List[str]]] = None,
+        document_cache_size: int = 512,
+        persisted_query_store: Optional[PersistedQueryStore] = None,
+        jit_threshold: Optional[int] = None,
+        max_expanded_fields: Optional[int] = None,
+        offload_parsing_threshold: Optional[int] = None,
+        executor: str = "basic",
+        max_concurrent_resolvers: Optional[int] = None,
+        max_concurrent_resolvers_per_request: Optional[int] = None,
+        resolver_priority: Optional[Callable[["Info"], int]] = None,
+        response_encoder: Callable[[dict], bytes] = encode_json,
     ) -> None:
         """Create an engine by analyzing the SDL and connecting it with the imported Resolver, Mutation,
         Subscription, Directive and Scalar linking them through the schema_name.
@@ -47,7 +280,23 @@ class Engine:
             custom_default_resolver {Optional[Callable]} -- An optional callable that will replace the tartiflette default_resolver (Will be called like a resolver for each UNDECORATED field) (default: {None})
             exclude_builtins_scalars {Optional[List[str]]} -- An optional list of string containing the names of the builtin scalar you don't want to be automatically included, usually it's Date, DateTime or Time scalars (default: {None})
             modules {Optional[Union[str, List[str]]]} -- An optional list of string containing the name of the modules you want the engine to import, usually this modules contains your Resolvers, Directives, Scalar or Subscription code (default: {None})
+            document_cache_size {int} -- The maximum number of parsed & validated query documents kept in the engine LRU cache, 0 disables the cache (default: {512})
+            persisted_query_store {Optional[PersistedQueryStore]} -- The store used to look up the queries sent by their sha256 hash, an in-memory LRU store is used if not provided (default: {None})
+            jit_threshold {Optional[int]} -- The number of executions after which a query operation is compiled into specialized code, None disables the compilation (default: {None})
+            max_expanded_fields {Optional[int]} -- The maximum number of fields of the operations of a query once its fragments are spread, queries exceeding it are rejected before being planned, None disables the limit (default: {None})
+            offload_parsing_threshold {Optional[int]} -- The length from which the queries which aren't in the document cache are parsed & planned in the default executor of the event loop instead of the event loop itself, None disables it (default: {None})
+            executor {str} -- The executor of the query & mutation operations: "basic" executes the children of each field as soon as it's resolved, "breadth_first" executes the operation level after level, dispatching all the fields at a given depth together (default: {"basic"})
+            max_concurrent_resolvers {Optional[int]} -- The maximum number of resolvers invoked at once by all the requests of the engine, None for no limit (default: {None})
+            max_concurrent_resolvers_per_request {Optional[int]} -- The maximum number of resolvers invoked at once by a single request, None for no limit (default: {None})
+            resolver_priority {Optional[Callable[[Info], int]]} -- An optional callable computing from its info the priority of a resolver invocation waiting for a slot, lower first, waiting invocations are served in their order of arrival if not provided (default: {None})
+            response_encoder {Callable[[dict], bytes]} -- The callable encoding the GraphQL responses returned by `execute_to_bytes` & `execute_to_chunks`, which requires it to encode into JSON (default: {encode_json})
         """
+        # pylint: disable=too-many-arguments,too-many-locals
+        if executor not in _EXECUTORS:
+            raise ImproperlyConfigured(
+                "Unknown executor < %s >, expected one of: %s."
+                % (executor, ", ".join(_EXECUTORS))
+            )
 
         if isinstance(modules, str):
             modules = [modules]
@@ -55,19 +304,53 @@ class Engine:
         self._modules = _import_modules(modules)
 
         self._error_coercer = error_coercer_factory(error_coercer)
-        self._parser = TartifletteRequestParser()
+        self._parser = TartifletteRequestParser(max_expanded_fields)
+        self._document_cache = LRUCache(document_cache_size)
+        self._jit_threshold = jit_threshold
+        self._offload_parsing_threshold = offload_parsing_threshold
+        self._executor = executor
+        self._response_encoder = response_encoder
+        self._resolver_scheduler = (
+            ResolverScheduler(
+                max_concurrent_resolvers,
+                max_concurrent_resolvers_per_request,
+                resolver_priority,
+            )
+            if max_concurrent_resolvers is not None
+            or max_concurrent_resolvers_per_request is not None
+            else None
+        )
+        self._persisted_query_store = (
+            persisted_query_store
+            if persisted_query_store is not None
+            else InMemoryPersistedQueryStore()
+        )
         SchemaRegistry.register_sdl(schema_name, sdl, exclude_builtins_scalars)
         self._schema = SchemaBakery.bake(
             schema_name, custom_default_resolver, exclude_builtins_scalars
         )
 
+    @property
+    def resolver_scheduler(self) -> Optional[ResolverScheduler]:
+        return self._resolver_scheduler
+
+    @property
+    def document_cache(self) -> LRUCache:
+        return self._document_cache
+
+    @property
+    def persisted_query_store(self) -> PersistedQueryStore:
+        return self._persisted_query_store
+
     async def execute(
         self,
-        query: str,
+        query: Optional[str] = None,
         operation_name: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> dict:
         """
         Parse and execute a GraphQL request (as string).
@@ -76,28 +359,131 @@ class Engine:
         :param context: a dict containing anything you need
         :param variables: the variables used in the GraphQL request
         :param initial_value: an initial value corresponding to the root type being executed
+        :param query_hash: the sha256 hash of the query, the query can be omitted if it was already persisted under this hash
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
         :return: a GraphQL response (as dict)
         """
-        operations, errors = self._parse_query_to_operations(query, variables)
+        prepared = await self._prepare(query, operation_name, query_hash)
+        return await prepared.execute(
+            variables=variables,
+            context=context,
+            initial_value=initial_value,
+            timeout=timeout,
+        )
 
-        if errors:
-            return errors
+    async def execute_to_bytes(
+        self,
+        query: Optional[str] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Parse and execute a GraphQL request (as string) & encode its
+        response, a compact UTF-8 JSON body by default.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param query_hash: the sha256 hash of the query, the query can be omitted if it was already persisted under this hash
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
+        :return: a GraphQL response (as encoded by the response encoder)
+        """
+        return self._response_encoder(
+            await self.execute(
+                query,
+                operation_name=operation_name,
+                context=context,
+                variables=variables,
+                initial_value=initial_value,
+                query_hash=query_hash,
+                timeout=timeout,
+            )
+        )
 
-        return await basic_execute(
-            operations,
-            operation_name,
-            request_ctx=context,
+    async def execute_to_chunks(
+        self,
+        query: Optional[str] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
+        chunk_size: int = 100,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterable[bytes]:
+        """
+        Parse and execute a GraphQL request (as string) & yield its encoded
+        response chunk after chunk: the items of the root lists are executed
+        & sent `chunk_size` at a time instead of being held until the whole
+        response is executed.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param query_hash: the sha256 hash of the query, the query can be omitted if it was already persisted under this hash
+        :param chunk_size: the number of items of a list executed & sent at once
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, their fields resolving to a `DeadlineExceeded` error
+        :return: the chunks of the GraphQL response (as encoded by the response encoder)
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        prepared = await self._prepare(query, operation_name, query_hash)
+        async for chunk in prepared.execute_to_chunks(  # pylint: disable=not-an-iterable
+            variables=variables,
+            context=context,
             initial_value=initial_value,
-            error_coercer=self._error_coercer,
-        )
+            chunk_size=chunk_size,
+            timeout=timeout,
+        ):
+            yield chunk
+
+    async def execute_incremental(
+        self,
+        query: Optional[str] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Parse and execute a GraphQL request (as string) incrementally: yield
+        the initial payload of the response, then the subsequent payloads
+        delivering the fragments marked with `@defer` & the items of the
+        lists marked with `@stream`.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param query_hash: the sha256 hash of the query, the query can be omitted if it was already persisted under this hash
+        :param timeout: the number of seconds after which the resolvers still running are cancelled, in all the payloads, their fields resolving to a `DeadlineExceeded` error
+        :return: the payloads of the GraphQL response (as dict)
+        """
+        # pylint: disable=too-many-locals
+        prepared = await self._prepare(query, operation_name, query_hash)
+        async for payload in prepared.execute_incremental(  # pylint: disable=not-an-iterable
+            variables=variables,
+            context=context,
+            initial_value=initial_value,
+            timeout=timeout,
+        ):
+            yield payload
 
     async def subscribe(
         self,
-        query: str,
+        query: Optional[str] = None,
         operation_name: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
     ) -> AsyncIterable[Dict[str, Any]]:
         """
         Parse and execute a GraphQL request (as string).
@@ -106,42 +492,158 @@ class Engine:
         :param context: a dict containing anything you need
         :param variables: the variables used in the GraphQL request
         :param initial_value: an initial value corresponding to the root type being executed
+        :param query_hash: the sha256 hash of the query, the query can be omitted if it was already persisted under this hash
         :return: a GraphQL response (as dict)
         """
-        operations, errors = self._parse_query_to_operations(query, variables)
+        prepared = await self._prepare(query, operation_name, query_hash)
+        async for result in prepared.subscribe(  # pylint: disable=not-an-iterable
+            variables=variables, context=context, initial_value=initial_value
+        ):
+            yield result
+
+    def prepare(
+        self, query: str, operation_name: Optional[str] = None
+    ) -> PreparedOperation:
+        """
+        Parse, validate & plan an operation of a GraphQL request once, so
+        that it can then be executed many times without any of this work.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to prepare
+        :return: a PreparedOperation to execute
+        """
+        return self._get_prepared_operation(
+            *self._parse_query_to_operations(query), operation_name
+        )
+
+    async def _prepare(
+        self,
+        query: Optional[str],
+        operation_name: Optional[str] = None,
+        query_hash: Optional[str] = None,
+    ) -> PreparedOperation:
+        query, errors = await self._get_persisted_query(query, query_hash)
+        if errors:
+            # Executing the operation returns the errors of the lookup
+            return self._get_prepared_operation(None, errors, operation_name)
+
+        if (
+            self._offload_parsing_threshold is None
+            or not isinstance(query, str)
+            or len(query) < self._offload_parsing_threshold
+            or query in self._document_cache
+        ):
+            return self.prepare(query, operation_name)
+
+        # Parsing happens outside of the GIL & the planning is interrupted
+        # by the other threads, so that a large query doesn't hold the
+        # event loop for the whole duration of its parsing & planning.
+        operations, errors = await asyncio.get_event_loop().run_in_executor(
+            None, self._parse_query_to_operations, query
+        )
+        return self._get_prepared_operation(operations, errors, operation_name)
 
+    def _get_prepared_operation(
+        self,
+        operations: Optional[Dict[Optional[str], "NodeOperationDefinition"]],
+        errors: Optional[dict],
+        operation_name: Optional[str],
+    ) -> PreparedOperation:
         if errors:
-            yield errors
-        else:
-            async for result in basic_subscribe(  # pylint: disable=not-an-iterable
-                operations,
-                operation_name,
-                request_ctx=context,
-                initial_value=initial_value,
-                error_coercer=self._error_coercer,
-            ):
-                yield result
+            return PreparedOperation(
+                None,
+                self._error_coercer,
+                errors=errors["errors"],
+                response_encoder=self._response_encoder,
+            )
+
+        operation, errors = get_operation(operations, operation_name)
+
+        if errors:
+            return PreparedOperation(
+                None,
+                self._error_coercer,
+                errors=[self._error_coercer(err) for err in errors],
+                response_encoder=self._response_encoder,
+            )
+
+        return PreparedOperation(
+            operation,
+            self._error_coercer,
+            jit_threshold=self._jit_threshold,
+            executor=self._executor,
+            scheduler=self._resolver_scheduler,
+            response_encoder=self._response_encoder,
+        )
+
+    async def _get_persisted_query(
+        self, query: Optional[str], query_hash: Optional[str]
+    ) -> Tuple[Optional[str], Optional[dict]]:
+        if query_hash is None:
+            if query is None:
+                return None, self._build_errors_response([NoQueryProvided()])
+            return query, None
 
-    def _parse_query_to_operations(self, query, variables):
         try:
-            operations, errors = self._parser.parse_and_tartify(
-                self._schema,
-                query,
-                variables=dict(variables) if variables else variables,
+            if query is None:
+                query = await self._persisted_query_store.get(query_hash)
+                if query is None:
+                    raise PersistedQueryNotFound()
+            elif compute_query_hash(query) != query_hash:
+                raise PersistedQueryHashMismatch(query_hash)
+            else:
+                await self._persisted_query_store.set(query_hash, query)
+        except GraphQLError as e:
+            return None, self._build_errors_response([e])
+        except Exception as e:  # pylint: disable=broad-except
+            return (
+                None,
+                self._build_errors_response(
+                    [
+                        to_graphql_error(
+                            e, message="Server encountered an error."
+                        )
+                    ]
+                ),
             )
+
+        return query, None
+
+    def _parse_query(
+        self, query: str
+    ) -> Tuple[
+        Optional[Dict[Optional[str], "NodeOperationDefinition"]],
+        Optional[List[Exception]],
+    ]:
+        # Planned operations only depend on the query text, the engine being
+        # bound to a single schema & variables being bound at execution time.
+        # Errors found while parsing & validating the query are cached too
+        # since they can't change.
+        cached = self._document_cache.get(query)
+        if cached is not None:
+            return cached
+
+        try:
+            cached = self._parser.parse_and_tartify(self._schema, query)
         except GraphQLError as e:
-            errors = [e]
+            cached = None, [e]
+
+        self._document_cache.set(query, cached)
+        return cached
+
+    def _parse_query_to_operations(self, query):
+        try:
+            operations, errors = self._parse_query(query)
         except Exception as e:  # pylint: disable=broad-except
             errors = [
                 to_graphql_error(e, message="Server encountered an error.")
             ]
 
         if errors:
-            return (
-                None,
-                {
-                    "data": None,
-                    "errors": [self._error_coercer(err) for err in errors],
-                },
-            )
+            return None, self._build_errors_response(errors)
         return operations, None
+
+    def _build_errors_response(self, errors: List[Exception]) -> dict:
+        return {
+            "data": None,
+            "errors": [self._error_coercer(err) for err in errors],
+        }
@@ -1,7 +1,8 @@
 import asyncio
 
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
+from tartiflette.executors.compiler import get_compiled_operation
 from tartiflette.executors.types import ExecutionContext
 from tartiflette.types.exceptions.tartiflette import (
     UnknownAnonymousdOperation,
@@ -33,13 +34,17 @@ async def _execute(
         )
 
 
-def _get_datas(root_nodes: List["NodeField"]) -> Optional[dict]:
+def _get_datas(
+    root_nodes: List["NodeField"], execution_ctx: ExecutionContext
+) -> Optional[dict]:
     data = {}
     for node in root_nodes:
-        if node.cant_be_null and node.marshalled is None:
+        if execution_ctx.is_execution_stopped(node):
+            continue
+        marshalled = execution_ctx.get_marshalled(node)
+        if node.cant_be_null and marshalled is None:
             return None
-        if not node.is_execution_stopped:
-            data[node.alias] = node.marshalled
+        data[node.alias] = marshalled
 
     return data or None
 
@@ -62,21 +67,69 @@ def get_operation(operations, operation_name):
         return operations[list(operations.keys())[0]], None
 
 
-async def execute(
-    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
-    operation_name: Optional[str],
+def create_execution_context(
+    operation: "NodeOperationDefinition",
+    variables: Optional[Dict[str, Any]],
+    scheduler: Optional["ResolverScheduler"] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[Optional[ExecutionContext], Optional[List[Exception]]]:
+    variables, errors = operation.coerce_variables(variables)
+
+    if errors:
+        return None, errors
+
+    return (
+        ExecutionContext(
+            variables,
+            len(operation.children),
+            scheduler=scheduler.for_request() if scheduler else None,
+            deadline=deadline,
+        ),
+        None,
+    )
+
+
+async def execute_operation(
+    operation: "NodeOperationDefinition",
     request_ctx: Optional[Dict[str, Any]],
     initial_value: Optional[Any],
     error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    jit_threshold: Optional[int] = None,
+    scheduler: Optional["ResolverScheduler"] = None,
+    deadline: Optional[float] = None,
 ) -> dict:
-    # pylint: disable=too-many-locals
-    execution_ctx = ExecutionContext()
-
-    operation, errors = get_operation(operations, operation_name)
+    execution_ctx, errors = create_execution_context(
+        operation, variables, scheduler, deadline
+    )
 
     if errors:
         return {"data": None, "errors": [error_coercer(err) for err in errors]}
 
+    return await _execute_in_context(
+        operation,
+        execution_ctx,
+        request_ctx,
+        initial_value,
+        error_coercer,
+        jit_threshold,
+    )
+
+
+async def _execute_in_context(
+    operation: "NodeOperationDefinition",
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    jit_threshold: Optional[int],
+) -> dict:
+    # Runs the compiled version of the operation once it's hot enough
+    compiled = get_compiled_operation(operation, jit_threshold)
+    if compiled is not None:
+        await compiled(execution_ctx, request_ctx, initial_value)
+        return build_response(operation.children, execution_ctx, error_coercer)
+
     return await execute_fields(
         operation.children,
         execution_ctx,
@@ -87,31 +140,35 @@ async def execute(
     )
 
 
-async def subscribe(
-    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
-    operation_name: Optional[str],
+async def subscribe_operation(
+    operation: "NodeOperationDefinition",
     request_ctx: Optional[Dict[str, Any]],
     initial_value: Optional[Any],
     error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    scheduler: Optional["ResolverScheduler"] = None,
 ) -> AsyncIterable[Dict[str, Any]]:
-    # pylint: disable=too-many-locals
-    execution_ctx = ExecutionContext()
-
-    operation, errors = get_operation(operations, operation_name)
+    execution_ctx, errors = create_execution_context(
+        operation, variables, scheduler
+    )
 
     if errors:
         yield {"data": None, "errors": [error_coercer(err) for err in errors]}
+        return
 
     root_nodes = operation.children
 
-    source_event_stream = await root_nodes[0].create_source_event_stream(
+    async for message in await root_nodes[0].create_source_event_stream(
         execution_ctx, request_ctx, parent_result=initial_value
-    )
-
-    async for message in source_event_stream:
+    ):
+        # Each event gets its own results & errors
         yield await execute_fields(
             root_nodes,
-            execution_ctx,
+            ExecutionContext(
+                execution_ctx.variables,
+                len(root_nodes),
+                scheduler=execution_ctx.scheduler,
+            ),
             request_ctx,
             initial_value=message,
             error_coercer=error_coercer,
@@ -119,6 +176,54 @@ async def subscribe(
         )
 
 
+async def execute(
+    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
+    operation_name: Optional[str],
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    jit_threshold: Optional[int] = None,
+) -> dict:
+    operation, errors = get_operation(operations, operation_name)
+
+    if errors:
+        return {"data": None, "errors": [error_coercer(err) for err in errors]}
+
+    return await execute_operation(
+        operation,
+        request_ctx,
+        initial_value=initial_value,
+        error_coercer=error_coercer,
+        variables=variables,
+        jit_threshold=jit_threshold,
+    )
+
+
+async def subscribe(
+    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
+    operation_name: Optional[str],
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+) -> AsyncIterable[Dict[str, Any]]:
+    operation, errors = get_operation(operations, operation_name)
+
+    if errors:
+        yield {"data": None, "errors": [error_coercer(err) for err in errors]}
+        return
+
+    async for result in subscribe_operation(  # pylint: disable=not-an-iterable
+        operation,
+        request_ctx,
+        initial_value=initial_value,
+        error_coercer=error_coercer,
+        variables=variables,
+    ):
+        yield result
+
+
 async def execute_fields(
     fields,
     execution_ctx,
@@ -135,8 +240,16 @@ async def execute_fields(
         allow_parallelization=allow_parallelization,
     )
 
+    return build_response(fields, execution_ctx, error_coercer)
+
+
+def build_response(
+    fields: List["NodeField"],
+    execution_ctx: ExecutionContext,
+    error_coercer: Callable[[Exception], dict],
+) -> dict:
     results = {
-        "data": _get_datas(fields),
+        "data": _get_datas(fields, execution_ctx),
         "errors": [error_coercer(err) for err in execution_ctx.errors if err],
     }
 
@@ -0,0 +1,122 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.executors.basic import (
+    build_response,
+    create_execution_context,
+)
+from tartiflette.executors.eager import gather_eagerly
+from tartiflette.executors.types import ExecutionContext, ResultSlot
+
+# A field to execute along with the raw value of its parent, the container
+# of its own value & the slot of this container
+PendingField = Tuple["NodeField", Any, Optional[Any], Optional[ResultSlot]]
+
+
+async def execute_level(
+    level: List[PendingField],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> List[PendingField]:
+    """
+    Resolves all the fields of a level of the response at once & collects
+    the fields of the next level.
+    :param level: the fields to execute
+    :param execution_ctx: the context of the execution
+    :param request_ctx: the context of the request
+    :return: the fields of the next level
+    """
+    next_level: List[PendingField] = []
+
+    async def resolve(
+        node: "NodeField",
+        parent_result: Any,
+        parent_marshalled: Optional[Any],
+        parent_slot: Optional[ResultSlot],
+    ) -> None:
+        resolved = await node.resolve(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_slot=parent_slot,
+        )
+        if resolved is not None:
+            next_level.extend(node.iter_children(execution_ctx, *resolved))
+
+    await gather_eagerly(resolve(*pending) for pending in level)
+    return next_level
+
+
+async def execute_levels(
+    level: List[PendingField],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> None:
+    """
+    Executes fields & their descendants level after level: each level is
+    only executed once all the fields of the previous one are resolved.
+    :param level: the fields to execute
+    :param execution_ctx: the context of the execution
+    :param request_ctx: the context of the request
+    """
+    while level:
+        level = await execute_level(level, execution_ctx, request_ctx)
+
+
+async def execute_roots(
+    operation: "NodeOperationDefinition",
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+) -> None:
+    """
+    Executes the root fields of an operation & their descendants level
+    after level, the root fields of a mutation one after the other.
+    :param operation: the operation to execute
+    :param execution_ctx: the context of the execution
+    :param request_ctx: the context of the request
+    :param initial_value: the value of the root of the operation
+    """
+    roots = [(node, initial_value, None, None) for node in operation.children]
+
+    if operation.allow_parallelization:
+        await execute_levels(roots, execution_ctx, request_ctx)
+    else:
+        # Each root field & its descendants are executed before the next one
+        for root in roots:
+            await execute_levels([root], execution_ctx, request_ctx)
+
+
+async def execute_operation(
+    operation: "NodeOperationDefinition",
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    scheduler: Optional["ResolverScheduler"] = None,
+    deadline: Optional[float] = None,
+) -> dict:
+    """
+    Breadth-first counterpart of `tartiflette.executors.basic.
+    execute_operation`: rather than each field executing its children as
+    soon as it's resolved, all the fields at a given depth of the response
+    are collected & dispatched together.
+    :param operation: the operation to execute
+    :param request_ctx: the context of the request
+    :param initial_value: the value of the root of the operation
+    :param error_coercer: the callable coercing the errors
+    :param variables: the variables of the execution
+    :param scheduler: the scheduler bounding the resolvers invoked at once
+    :param deadline: the time at which the resolvers still running are
+    cancelled
+    :return: a GraphQL response (as dict)
+    """
+    execution_ctx, errors = create_execution_context(
+        operation, variables, scheduler, deadline
+    )
+
+    if errors:
+        return {"data": None, "errors": [error_coercer(err) for err in errors]}
+
+    await execute_roots(operation, execution_ctx, request_ctx, initial_value)
+    return build_response(operation.children, execution_ctx, error_coercer)
@@ -0,0 +1,506 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.executors.eager import gather_eagerly
+from tartiflette.executors.types import ResultSlot
+from tartiflette.types.helpers import get_typename, reduce_type
+from tartiflette.types.object import GraphQLObjectType
+from tartiflette.types.scalar import GraphQLScalarType
+from tartiflette.utils.coercer import _set_typename
+
+# Fields whose resolver flags the execution as an introspection one, which
+# changes how every other field of the execution is resolved.
+_INTROSPECTION_FIELDS = ("__schema", "__type")
+
+
+class _FallBack(Exception):
+    pass
+
+
+class _FieldShape:
+    """
+    Describes the output type of a field which can be compiled:
+    a (possibly non-null) named type, possibly wrapped in a
+    (possibly non-null) list.
+    """
+
+    def __init__(
+        self,
+        named_type: Any,
+        is_not_null: bool,
+        is_list: bool,
+        item_is_not_null: bool,
+    ) -> None:
+        self.named_type = named_type
+        self.is_not_null = is_not_null
+        self.is_list = is_list
+        self.item_is_not_null = item_is_not_null
+
+    @property
+    def is_object(self) -> bool:
+        return isinstance(self.named_type, GraphQLObjectType)
+
+
+def _unwrap_non_null(gql_type: Any) -> Tuple[Any, bool]:
+    if getattr(gql_type, "is_not_null", False):
+        return gql_type.gql_type, True
+    return gql_type, False
+
+
+def _get_named_type(node: "NodeField", gql_type: Any) -> Optional[Any]:
+    if not isinstance(gql_type, str):
+        return None
+
+    try:
+        named_type = node.schema.find_type(reduce_type(gql_type))
+    except KeyError:
+        return None
+
+    # Types holding directives have them run on each output value.
+    if getattr(named_type, "_directives", None):
+        return None
+
+    if isinstance(named_type, GraphQLScalarType):
+        # Same lookup as `tartiflette.utils.coercer.get_coercer`
+        scalar = node.schema.find_scalar(named_type.name)
+        return scalar if scalar and scalar.coerce_output else None
+    if isinstance(named_type, GraphQLObjectType):
+        return named_type
+    return None
+
+
+def _get_field_shape(node: "NodeField") -> Optional[_FieldShape]:
+    field_executor = node.field_executor
+    if (
+        not field_executor.resolves_with_default_resolver
+        or node.arguments
+        or node.execution_directives
+        or field_executor.schema_field.arguments
+    ):
+        return None
+
+    gql_type, is_not_null = _unwrap_non_null(
+        field_executor.schema_field.gql_type
+    )
+
+    is_list = getattr(gql_type, "is_list", False)
+    item_is_not_null = False
+    if is_list:
+        gql_type, item_is_not_null = _unwrap_non_null(gql_type.gql_type)
+
+    named_type = _get_named_type(node, gql_type)
+    if named_type is None:
+        return None
+
+    return _FieldShape(named_type, is_not_null, is_list, item_is_not_null)
+
+
+class _CodeGenerator:
+    """
+    Generates the source of the coroutines executing an operation: one for
+    its root fields & one per field, resolved by the interpreter, having
+    children. Fields which are resolved by the default resolver into a
+    scalar or an object without any argument nor directive are inlined. Any
+    other field, or any inlined field whose value doesn't follow the happy
+    path (null value for a non-null field, coercion error...), is handed
+    over to the interpreter (`NodeField.__call__`) which takes care of it &
+    of its children.
+    """
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            "ResultSlot": ResultSlot,
+            "_FallBack": _FallBack,
+            "gather_eagerly": gather_eagerly,
+            "get_typename": get_typename,
+            "set_typename": _set_typename,
+        }
+        self.interpreted_nodes: List["NodeField"] = []
+        self._lines: List[str] = []
+        self._counter = 0
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self._lines)
+
+    def _bind(self, value: Any, prefix: str) -> str:
+        self._counter += 1
+        name = "%s%d" % (prefix, self._counter)
+        self.namespace[name] = value
+        return name
+
+    def _local(self, prefix: str) -> str:
+        self._counter += 1
+        return "%s%d" % (prefix, self._counter)
+
+    def _emit(self, indent: int, line: str) -> None:
+        self._lines.append("    " * indent + line)
+
+    def add_root_function(self, root_nodes: List["NodeField"]) -> str:
+        self._emit(0, "async def execute(ec, rc, pr):")
+        self._emit(1, "pending = []")
+        for node in root_nodes:
+            self._emit_field(1, node, "pr", "None", "None")
+        self._emit_gather_pending(1)
+        return "execute"
+
+    def add_children_function(self, node: "NodeField") -> str:
+        # Compiled version of `NodeField._execute_children`
+        name = self._local("execute_children")
+        self._emit(0, "async def %s(ec, rc, value, coerced, slot):" % name)
+        self._emit(1, "pending = []")
+        indent = 1
+        if node.shall_produce_list:
+            self._emit(
+                1, "if isinstance(value, list) and isinstance(coerced, list):"
+            )
+            self._emit(
+                2,
+                "for index, (item, item_coerced) in "
+                "enumerate(zip(value, coerced)):",
+            )
+            self._emit(
+                3,
+                "item_slot = ResultSlot(coerced, index, %r, slot)"
+                % (not node.items_cant_be_null),
+            )
+            self._emit(3, "if item_coerced is None:")
+            # The interpreter runs children against null items too
+            self._emit_children(
+                4, node.children, "item", "None", "item_slot", inline=False
+            )
+            self._emit(3, "else:")
+            self._emit_children(
+                4, node.children, "item", "item_coerced", "item_slot"
+            )
+        else:
+            self._emit_children(
+                indent, node.children, "value", "coerced", "slot"
+            )
+        self._emit_gather_pending(1)
+        return name
+
+    def _emit_gather_pending(self, indent: int) -> None:
+        self._emit(indent, "if pending:")
+        self._emit(indent + 1, "await gather_eagerly(pending)")
+
+    def _emit_interpreted_field(
+        self,
+        indent: int,
+        node_name: str,
+        parent_result: str,
+        container: str,
+        parent_slot: str,
+    ) -> None:
+        self._emit(
+            indent,
+            "pending.append(%s(ec, rc, parent_result=%s, "
+            "parent_marshalled=%s, parent_slot=%s))"
+            % (node_name, parent_result, container, parent_slot),
+        )
+
+    def _emit_field(
+        self,
+        indent: int,
+        node: "NodeField",
+        parent_result: str,
+        container: str,
+        parent_slot: str,
+        inline: bool = True,
+    ) -> None:
+        shape = _get_field_shape(node) if inline else None
+        if shape is None:
+            if node.children and node not in self.interpreted_nodes:
+                self.interpreted_nodes.append(node)
+            self._emit_interpreted_field(
+                indent,
+                self._bind(node, "node"),
+                parent_result,
+                container,
+                parent_slot,
+            )
+            return
+
+        self._emit_inlined_field(
+            indent, node, shape, parent_result, container, parent_slot
+        )
+
+    def _emit_inlined_field(
+        self,
+        indent: int,
+        node: "NodeField",
+        shape: _FieldShape,
+        parent_result: str,
+        container: str,
+        parent_slot: str,
+    ) -> None:
+        value = self._local("value")
+        coerced = self._local("coerced")
+
+        self._emit(indent, "try:")
+        self._emit_default_resolver(
+            indent + 1,
+            node.field_executor.schema_field.name,
+            parent_result,
+            value,
+        )
+        self._emit_coercion(indent + 1, shape, value, coerced)
+        self._emit(indent, "except Exception:  # pylint: disable=broad-except")
+        self._emit_interpreted_field(
+            indent + 1,
+            self._bind(node, "node"),
+            parent_result,
+            container,
+            parent_slot,
+        )
+        self._emit(indent, "else:")
+        if container == "None":
+            # Inlined version of `ExecutionContext.set_marshalled`
+            self._emit(
+                indent + 1, "ec.results[%r] = %s" % (node.index, coerced)
+            )
+        else:
+            self._emit(
+                indent + 1, "%s[%r] = %s" % (container, node.alias, coerced)
+            )
+
+        if shape.is_object and node.children:
+            self._emit_object_children(
+                indent + 1, node, shape, value, coerced, container, parent_slot
+            )
+
+    def _emit_default_resolver(
+        self, indent: int, name: str, parent_result: str, value: str
+    ) -> None:
+        # Inlined version of `tartiflette.resolver.factory.default_resolver`
+        self._emit(indent, "try:")
+        self._emit(
+            indent + 1, "%s = getattr(%s, %r)" % (value, parent_result, name)
+        )
+        self._emit(indent, "except AttributeError:")
+        self._emit(indent + 1, "try:")
+        self._emit(indent + 2, "%s = %s[%r]" % (value, parent_result, name))
+        self._emit(indent + 1, "except (KeyError, TypeError):")
+        self._emit(indent + 2, "%s = None" % value)
+
+    def _item_coercion(self, shape: _FieldShape, item: str) -> str:
+        if shape.is_object:
+            return "set_typename(%s, %r) or {}" % (item, shape.named_type.name)
+        return "%s(%s)" % (
+            self._bind(shape.named_type.coerce_output, "coerce_output"),
+            item,
+        )
+
+    def _emit_coercion(
+        self, indent: int, shape: _FieldShape, value: str, coerced: str
+    ) -> None:
+        self._emit(indent, "if %s is None:" % value)
+        if shape.is_not_null:
+            self._emit(indent + 1, "raise _FallBack()")
+        else:
+            self._emit(indent + 1, "%s = None" % coerced)
+
+        if not shape.is_list:
+            self._emit(indent, "else:")
+            self._emit(
+                indent + 1,
+                "%s = %s" % (coerced, self._item_coercion(shape, value)),
+            )
+            return
+
+        # Lists of objects containing null items have their children executed
+        # against these null items by the interpreter, so they aren't inlined.
+        item = self._local("item")
+        self._emit(indent, "elif not isinstance(%s, list):" % value)
+        self._emit(indent + 1, "raise _FallBack()")
+        if shape.item_is_not_null or shape.is_object:
+            self._emit(
+                indent,
+                "elif any(%s is None for %s in %s):" % (item, item, value),
+            )
+            self._emit(indent + 1, "raise _FallBack()")
+            item_coercion = self._item_coercion(shape, item)
+        else:
+            item_coercion = "None if %s is None else %s" % (
+                item,
+                self._item_coercion(shape, item),
+            )
+        self._emit(indent, "else:")
+        self._emit(
+            indent + 1,
+            "%s = [%s for %s in %s]" % (coerced, item_coercion, item, value),
+        )
+
+    def _emit_object_children(
+        self,
+        indent: int,
+        node: "NodeField",
+        shape: _FieldShape,
+        value: str,
+        coerced: str,
+        container: str,
+        parent_slot: str,
+    ) -> None:
+        self._emit(indent, "if %s is not None:" % value)
+        indent += 1
+
+        if container == "None":
+            slot = self._emit_result_slot(
+                indent, "ec.results", repr(node.index), not shape.is_not_null
+            )
+        else:
+            slot = self._emit_result_slot(
+                indent,
+                container,
+                repr(node.alias),
+                not shape.is_not_null,
+                parent_slot,
+            )
+
+        if shape.is_list:
+            value, coerced, slot = self._emit_items_loop(
+                indent, shape, value, coerced, slot
+            )
+            indent += 1
+
+        self._emit_children(indent, node.children, value, coerced, slot)
+
+    def _emit_result_slot(
+        self,
+        indent: int,
+        container: str,
+        key: str,
+        nullable: bool,
+        parent_slot: Optional[str] = None,
+    ) -> str:
+        slot = self._local("slot")
+        arguments = [container, key, repr(nullable)]
+        if parent_slot is not None:
+            arguments.append(parent_slot)
+        self._emit(
+            indent, "%s = ResultSlot(%s)" % (slot, ", ".join(arguments))
+        )
+        return slot
+
+    def _emit_items_loop(
+        self,
+        indent: int,
+        shape: _FieldShape,
+        value: str,
+        coerced: str,
+        slot: str,
+    ) -> Tuple[str, str, str]:
+        # Returns the names of the item, coerced item & slot of the item,
+        # to be used by the body of the loop
+        index = self._local("index")
+        item = self._local("item")
+        item_coerced = self._local("item_coerced")
+        self._emit(
+            indent,
+            "for %s, (%s, %s) in enumerate(zip(%s, %s)):"
+            % (index, item, item_coerced, value, coerced),
+        )
+        return (
+            item,
+            item_coerced,
+            self._emit_result_slot(
+                indent + 1, coerced, index, not shape.item_is_not_null, slot
+            ),
+        )
+
+    def _emit_children(
+        self,
+        indent: int,
+        children: List["NodeField"],
+        value: str,
+        coerced: str,
+        slot: str,
+        inline: bool = True,
+    ) -> None:
+        typename = self._local("typename")
+        if any(child.type_condition for child in children):
+            self._emit(indent, "%s = get_typename(%s)" % (typename, value))
+
+        for child in children:
+            if child.type_condition:
+                self._emit(
+                    indent, "if %s == %r:" % (typename, child.type_condition)
+                )
+                self._emit_field(
+                    indent + 1, child, value, coerced, slot, inline
+                )
+            else:
+                self._emit_field(indent, child, value, coerced, slot, inline)
+
+
+def _is_compilable(operation: "NodeOperationDefinition") -> bool:
+    if operation.type != "Query":
+        return False
+
+    nodes = list(operation.children)
+    while nodes:
+        node = nodes.pop()
+        if node.name in _INTROSPECTION_FIELDS:
+            return False
+        nodes.extend(node.children)
+    return True
+
+
+def compile_operation(
+    operation: "NodeOperationDefinition"
+) -> Optional[Callable]:
+    """
+    Compiles an operation into coroutines specialized for it. The coroutines
+    executing the children of the fields left to the interpreter are set as
+    the `compiled_children` attribute of these fields.
+    :param operation: the operation to compile
+    :return: a coroutine function taking the execution context, the request
+    context & the initial value, or None if the operation can't be compiled
+    """
+    if not _is_compilable(operation):
+        return None
+
+    generator = _CodeGenerator()
+    functions = [(None, generator.add_root_function(operation.children))]
+
+    index = 0
+    while index < len(generator.interpreted_nodes):
+        node = generator.interpreted_nodes[index]
+        functions.append((node, generator.add_children_function(node)))
+        index += 1
+
+    exec(  # pylint: disable=exec-used
+        compile(
+            generator.source,
+            "<compiled operation %s>" % (operation.name,),
+            "exec",
+        ),
+        generator.namespace,
+    )
+
+    for node, function_name in functions[1:]:
+        node.compiled_children = generator.namespace[function_name]
+    return generator.namespace[functions[0][1]]
+
+
+def get_compiled_operation(
+    operation: "NodeOperationDefinition", threshold: Optional[int]
+) -> Optional[Callable]:
+    """
+    Counts the executions of an operation & compiles it once it has been
+    executed `threshold` times.
+    :param operation: the executed operation
+    :param threshold: the number of executions after which the operation is
+    compiled, None disables the compilation
+    :return: the compiled operation if any
+    """
+    if threshold is None:
+        return None
+
+    if operation.compilation_attempted:
+        return operation.compiled
+
+    operation.executions += 1
+    if operation.executions > threshold:
+        operation.compilation_attempted = True
+        operation.compiled = compile_operation(operation)
+    return operation.compiled
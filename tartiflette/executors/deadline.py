@@ -0,0 +1,64 @@
+import asyncio
+
+from typing import Any, Coroutine, Optional
+
+from tartiflette.types.exceptions.tartiflette import DeadlineExceeded
+
+
+def get_deadline(timeout: Optional[float]) -> Optional[float]:
+    """
+    Computes the deadline of an execution starting now, in the time of the
+    event loop.
+    :param timeout: the number of seconds the execution can last
+    :return: the deadline of the execution, None if it has no timeout
+    """
+    if timeout is None:
+        return None
+    return asyncio.get_event_loop().time() + timeout
+
+
+def check_deadline(deadline: float) -> None:
+    """
+    Ensures that the deadline of the execution hasn't expired yet.
+    :param deadline: the deadline of the execution
+    :raises DeadlineExceeded: when the deadline has expired
+    """
+    if asyncio.get_event_loop().time() >= deadline:
+        raise DeadlineExceeded()
+
+
+async def run_until_deadline(coroutine: Coroutine, deadline: float) -> Any:
+    """
+    Runs the invocation of a resolver in its own task, which is cancelled
+    if it's still running when the deadline expires. Invocations started
+    once the deadline has expired aren't run at all.
+    :param coroutine: the invocation of the resolver
+    :param deadline: the deadline of the execution
+    :return: the value returned by the resolver
+    :raises DeadlineExceeded: when the resolver was cancelled by the
+    deadline or wasn't run because of it
+    """
+    try:
+        check_deadline(deadline)
+    except DeadlineExceeded:
+        coroutine.close()
+        raise
+
+    loop = asyncio.get_event_loop()
+    task = asyncio.ensure_future(coroutine)
+    expired = False
+
+    def expire() -> None:
+        nonlocal expired
+        expired = task.cancel()
+
+    handle = loop.call_at(deadline, expire)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if not expired:
+            # The execution itself is cancelled
+            raise
+        raise DeadlineExceeded()
+    finally:
+        handle.cancel()
@@ -0,0 +1,96 @@
+import asyncio
+
+from collections.abc import Coroutine
+from typing import Any, Iterable
+
+_RESUMED = object()
+
+
+def _set_awaited(yielded: Any, awaited: bool) -> None:
+    """
+    Sets the flag through which a future yielded by a coroutine tells the
+    task driving the coroutine that it's awaited. This relies on the
+    protocol between `Future.__await__` & `Task._step` of asyncio (CPython
+    3.5.3+): the future sets its `_asyncio_future_blocking` attribute to
+    True before yielding itself, and the task, which rejects futures
+    yielded without it, resets it to False once it waits for the future.
+    Other yielded values (e.g. None for `asyncio.sleep(0)`) aren't affected.
+    :param yielded: the value yielded by the coroutine
+    :param awaited: the value of the flag
+    """
+    if hasattr(yielded, "_asyncio_future_blocking"):
+        # Part of the asyncio protocol between futures & tasks
+        yielded._asyncio_future_blocking = (  # pylint: disable=protected-access
+            awaited
+        )
+
+
+class _StartedCoroutine(Coroutine):
+    """
+    Coroutine resuming a coroutine which has already been run up to its
+    first suspension: its first step yields again what the coroutine
+    yielded, the next ones are forwarded to the coroutine. Being driven
+    directly by its task, an exception thrown in (e.g. a cancellation)
+    reaches the coroutine even if the task hasn't started yet.
+    """
+
+    __slots__ = ("_coroutine", "_yielded")
+
+    def __init__(self, coroutine: Coroutine, yielded: Any) -> None:
+        self._coroutine = coroutine
+        self._yielded = yielded
+
+    def send(self, value: Any) -> Any:
+        yielded = self._yielded
+        if yielded is _RESUMED:
+            return self._coroutine.send(value)
+
+        self._yielded = _RESUMED
+        # Flags the future as awaited again, as the task expects
+        _set_awaited(yielded, True)
+        return yielded
+
+    def throw(self, typ, val=None, tb=None) -> Any:
+        self._yielded = _RESUMED
+        return self._coroutine.throw(typ, val, tb)
+
+    def close(self) -> None:
+        self._coroutine.close()
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+    def __await__(self) -> "_StartedCoroutine":
+        return self
+
+
+async def gather_eagerly(coroutines: Iterable[Coroutine]) -> None:
+    """
+    Runs the coroutines one after the other up to their first suspension &
+    only schedules the ones which actually suspend, which are then gathered.
+    Coroutines which complete without suspending (most fields of a list
+    whose values are already loaded) cost neither a task nor a round trip
+    through the event loop, and are released as soon as they complete.
+    Coroutines are started in the same order as `asyncio.gather` would.
+    :param coroutines: the coroutines to run, consumed lazily
+    """
+    pending = []
+    try:
+        for coroutine in coroutines:
+            try:
+                yielded = coroutine.send(None)
+            except StopIteration:
+                continue
+            # As a task would, so that other coroutines can await the same
+            # future before this one is scheduled
+            _set_awaited(yielded, False)
+            pending.append(_StartedCoroutine(coroutine, yielded))
+    except Exception:
+        # As with `asyncio.gather`, the coroutines already started keep
+        # running even though the exception is propagated
+        for started in pending:
+            asyncio.ensure_future(started)
+        raise
+
+    if pending:
+        await asyncio.gather(*pending)
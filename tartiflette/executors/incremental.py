@@ -0,0 +1,588 @@
+import asyncio
+
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tartiflette.directive.defer import Defer
+from tartiflette.directive.stream import Stream
+from tartiflette.executors.basic import (
+    create_execution_context,
+    execute_fields,
+)
+from tartiflette.executors.eager import gather_eagerly
+from tartiflette.executors.types import ExecutionContext, ResultSlot
+
+Path = List[Union[str, int]]
+
+
+def _is_reachable(value: Any, slot: Optional[ResultSlot]) -> bool:
+    # Whether a value of the response is still part of it, rather than
+    # having been replaced by a null value propagated from one of its fields
+    while slot is not None:
+        if slot.container[slot.key] is not value:
+            return False
+        value, slot = slot.container, slot.parent
+    return True
+
+
+def _is_built_in(node: "NodeField", name: str, implementation: type) -> bool:
+    # The `@defer` & `@stream` directives defined by the SDL of the schema
+    # in place of the built-in ones aren't the incremental delivery ones
+    return node.schema.find_directive(name).implementation is implementation
+
+
+class IncrementalRecord(ABC):
+    """
+    A payload of an incremental execution: the initial one or the one of a
+    deferred fragment or of a streamed item. A record is only published once
+    the record it depends on has been published, so that the payloads are
+    always delivered after the payload holding their path.
+    """
+
+    __slots__ = (
+        "publisher",
+        "parent",
+        "execution_ctx",
+        "path",
+        "label",
+        "future",
+        "published",
+        "filtered",
+    )
+
+    def __init__(
+        self,
+        publisher: "IncrementalPublisher",
+        parent: Optional["IncrementalRecord"],
+        execution_ctx: ExecutionContext,
+        path: Optional[Path] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        self.publisher = publisher
+        self.parent = parent
+        self.execution_ctx = execution_ctx
+        execution_ctx.incremental = self
+        self.path = path
+        self.label = label
+        self.future: Optional[asyncio.Future] = None
+        self.published = False
+        # Set when the value the record belongs to has been nulled, in which
+        # case the record & the ones depending on it aren't published
+        self.filtered = False
+
+    def defer(
+        self,
+        node: "NodeField",
+        execution_ctx: ExecutionContext,
+        parent_result: Optional[Any],
+        parent_marshalled: Optional[Any],
+        parent_slot: Optional[ResultSlot],
+    ) -> bool:
+        """
+        Defers the execution of a field of a fragment marked with `@defer`
+        to the payload of the fragment, the fields of the fragment at the
+        same place of the response sharing the same payload.
+        :param node: the field to defer
+        :param execution_ctx: the context of the execution
+        :param parent_result: the raw value of the parent field
+        :param parent_marshalled: the coerced value of the parent field
+        :param parent_slot: the slot of the coerced value of the parent
+        :return: whether the field is deferred
+        """
+        arguments = node.get_directive_arguments(
+            "defer", execution_ctx.variables
+        )
+        # The default values of the arguments of a directive are only set
+        # when none of them is given
+        if (
+            arguments is None
+            or not arguments.get("if", True)
+            or not _is_built_in(node, "defer", Defer)
+        ):
+            return False
+
+        self.publisher.defer(
+            self,
+            node,
+            parent_result,
+            parent_marshalled,
+            parent_slot,
+            arguments.get("label"),
+        )
+        return True
+
+    def stream(
+        self,
+        node: "NodeField",
+        execution_ctx: ExecutionContext,
+        raw: Any,
+        coerced: Any,
+        slot: Optional[ResultSlot],
+    ) -> Any:
+        """
+        Removes the items of a list field marked with `@stream` after the
+        first `initialCount` ones from the value of the field, each one of
+        them being delivered in its own payload.
+        :param node: the list field
+        :param execution_ctx: the context of the execution
+        :param raw: the raw value of the field
+        :param coerced: the coerced value of the field
+        :param slot: the slot of the coerced value of the field
+        :return: the raw value of the items to execute along with the field
+        """
+        arguments = node.get_directive_arguments(
+            "stream", execution_ctx.variables
+        )
+        if (
+            arguments is None
+            or not arguments.get("if", True)
+            or not _is_built_in(node, "stream", Stream)
+        ):
+            return raw
+
+        initial_count = max(arguments.get("initialCount") or 0, 0)
+        if (
+            not isinstance(raw, list)
+            or not isinstance(coerced, list)
+            or len(raw) <= initial_count
+        ):
+            return raw
+        self.publisher.stream(
+            self,
+            node,
+            enumerate(
+                zip(raw[initial_count:], coerced[initial_count:]),
+                initial_count,
+            ),
+            slot,
+            arguments.get("label"),
+        )
+        del coerced[initial_count:]
+        return raw[:initial_count]
+
+    @abstractmethod
+    async def execute(self, request_ctx: Optional[Dict[str, Any]]) -> None:
+        """
+        Executes the part of the response delivered by the record.
+        :param request_ctx: the context of the request
+        """
+
+    @abstractmethod
+    def is_reachable(self) -> bool:
+        """
+        Whether the value the record delivers its payload into is still
+        part of the response, rather than having been nulled.
+        """
+
+    @abstractmethod
+    def build_payload(self) -> Dict[str, Any]:
+        """
+        Returns the payload of the record once its execution is done.
+        :return: the payload of the record
+        """
+
+
+class _InitialResponse(IncrementalRecord):
+    __slots__ = ("operation", "initial_value", "error_coercer", "response")
+
+    def __init__(
+        self,
+        publisher: "IncrementalPublisher",
+        execution_ctx: ExecutionContext,
+        operation: "NodeOperationDefinition",
+        initial_value: Optional[Any],
+        error_coercer: Callable[[Exception], dict],
+    ) -> None:
+        super().__init__(publisher, None, execution_ctx)
+        self.operation = operation
+        self.initial_value = initial_value
+        self.error_coercer = error_coercer
+        self.response: Optional[Dict[str, Any]] = None
+
+    async def execute(self, request_ctx: Optional[Dict[str, Any]]) -> None:
+        self.response = await execute_fields(
+            self.operation.children,
+            self.execution_ctx,
+            request_ctx,
+            initial_value=self.initial_value,
+            error_coercer=self.error_coercer,
+            allow_parallelization=self.operation.allow_parallelization,
+        )
+
+    def is_reachable(self) -> bool:
+        # The initial response holds the root of the response
+        return True
+
+    def build_payload(self) -> Dict[str, Any]:
+        return self.response
+
+
+class _DeferredFragment(IncrementalRecord):
+    __slots__ = (
+        "fields",
+        "started",
+        "holder",
+        "parent_marshalled",
+        "parent_slot",
+    )
+
+    def __init__(
+        self,
+        publisher: "IncrementalPublisher",
+        parent: IncrementalRecord,
+        path: Path,
+        label: Optional[str],
+        parent_marshalled: Optional[Any],
+        parent_slot: Optional[ResultSlot],
+    ) -> None:
+        super().__init__(
+            publisher, parent, parent.execution_ctx.fork(), path, label
+        )
+        self.fields: List[Tuple["NodeField", Any]] = []
+        self.started = False
+        self.holder = {"data": {}}
+        self.parent_marshalled = parent_marshalled
+        self.parent_slot = parent_slot
+
+    async def execute(self, request_ctx: Optional[Dict[str, Any]]) -> None:
+        self.started = True
+        slot = ResultSlot(self.holder, "data", True)
+        await gather_eagerly(
+            node(
+                self.execution_ctx,
+                request_ctx,
+                parent_result=parent_result,
+                parent_marshalled=self.holder["data"],
+                parent_slot=slot,
+                defer=False,
+            )
+            for node, parent_result in self.fields
+        )
+
+    def is_reachable(self) -> bool:
+        if self.parent_slot is None:
+            # Deferred root fields depend on the data of the response
+            return self.publisher.data is not None
+        return _is_reachable(self.parent_marshalled, self.parent_slot)
+
+    def build_payload(self) -> Dict[str, Any]:
+        return {"data": self.holder["data"], "path": self.path}
+
+
+class _StreamedItem(IncrementalRecord):
+    __slots__ = ("node", "raw", "holder", "list_value", "list_slot")
+
+    def __init__(
+        self,
+        publisher: "IncrementalPublisher",
+        parent: IncrementalRecord,
+        path: Path,
+        label: Optional[str],
+        node: "NodeField",
+        item: Tuple[Any, Any],
+        list_slot: Optional[ResultSlot],
+    ) -> None:
+        super().__init__(
+            publisher, parent, parent.execution_ctx.fork(), path, label
+        )
+        self.node = node
+        # The raw & coerced values of the item
+        self.raw = item[0]
+        self.holder = {"items": [item[1]]}
+        self.list_value = (
+            list_slot.container[list_slot.key]
+            if list_slot is not None
+            else None
+        )
+        self.list_slot = list_slot
+
+    async def execute(self, request_ctx: Optional[Dict[str, Any]]) -> None:
+        if not self.node.children or self.raw is None:
+            return
+
+        await gather_eagerly(
+            child(
+                self.execution_ctx,
+                request_ctx,
+                parent_result=parent_result,
+                parent_marshalled=container,
+                parent_slot=slot,
+            )
+            for child, parent_result, container, slot in (
+                self.node.iter_children(
+                    self.execution_ctx,
+                    [self.raw],
+                    self.holder["items"],
+                    ResultSlot(self.holder, "items", True),
+                )
+            )
+        )
+
+    def is_reachable(self) -> bool:
+        return _is_reachable(self.list_value, self.list_slot)
+
+    def build_payload(self) -> Dict[str, Any]:
+        return {"items": self.holder["items"], "path": self.path}
+
+
+class IncrementalPublisher:
+    """
+    Executes the deferred fragments & the streamed items of an operation as
+    soon as they're met, each one in its own execution context, & publishes
+    their payloads once the payload they depend on has been published.
+    """
+
+    def __init__(
+        self,
+        operation: "NodeOperationDefinition",
+        request_ctx: Optional[Dict[str, Any]],
+        error_coercer: Callable[[Exception], dict],
+    ) -> None:
+        self._root_aliases = [node.alias for node in operation.children]
+        self._request_ctx = request_ctx
+        self._error_coercer = error_coercer
+        self._pending: List[IncrementalRecord] = []
+        self._fragments: Dict[
+            Tuple[int, Optional[str]], _DeferredFragment
+        ] = {}
+        # Path of the values of the payloads, by id of their container
+        self._paths: Dict[int, Tuple[Any, Path]] = {}
+        # Set once the initial payload is built
+        self.data: Optional[Dict[str, Any]] = None
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def _get_path(self, slot: Optional[ResultSlot]) -> Path:
+        keys = []
+        while slot is not None:
+            try:
+                return self._paths[id(slot.container)][1] + keys[::-1]
+            except KeyError:
+                pass
+            keys.append(slot.key)
+            slot = slot.parent
+
+        if keys:
+            # Root fields are addressed by their index in the operation
+            keys[-1] = self._root_aliases[keys[-1]]
+        return keys[::-1]
+
+    def _add(self, record: IncrementalRecord, container: Any) -> None:
+        self._paths[id(container)] = (container, record.path)
+        self._pending.append(record)
+        record.future = asyncio.ensure_future(
+            record.execute(self._request_ctx)
+        )
+
+    def defer(
+        self,
+        parent: IncrementalRecord,
+        node: "NodeField",
+        parent_result: Optional[Any],
+        parent_marshalled: Optional[Any],
+        parent_slot: Optional[ResultSlot],
+        label: Optional[str],
+    ) -> None:
+        key = (id(parent_marshalled), label)
+        fragment = self._fragments.get(key)
+        if fragment is None or fragment.started:
+            # Started once its fields, met during the same iteration of the
+            # event loop, are all collected
+            fragment = self._fragments[key] = _DeferredFragment(
+                self,
+                parent,
+                self._get_path(parent_slot),
+                label,
+                parent_marshalled,
+                parent_slot,
+            )
+            self._add(fragment, fragment.holder)
+        fragment.fields.append((node, parent_result))
+
+    def stream(
+        self,
+        parent: IncrementalRecord,
+        node: "NodeField",
+        items: Iterable[Tuple[int, Tuple[Any, Any]]],
+        slot: Optional[ResultSlot],
+        label: Optional[str],
+    ) -> None:
+        path = self._get_path(slot)
+        for index, item in items:
+            # Each item is published after the previous one
+            parent = _StreamedItem(
+                self, parent, path + [index], label, node, item, slot
+            )
+            self._add(parent, parent.holder["items"])
+
+    def _build_payload(self, record: IncrementalRecord) -> Dict[str, Any]:
+        payload = record.build_payload()
+        if record.label is not None:
+            payload["label"] = record.label
+
+        errors = [
+            self._error_coercer(err)
+            for err in record.execution_ctx.errors
+            if err
+        ]
+        if errors:
+            payload["errors"] = errors
+        return payload
+
+    def _publish_ready(self) -> List[Dict[str, Any]]:
+        payloads = []
+        published = True
+        while published:
+            published = False
+            for record in list(self._pending):
+                if not record.future.done() or not record.parent.published:
+                    continue
+
+                # Raises the unexpected exceptions of the execution
+                record.future.result()
+
+                self._pending.remove(record)
+                record.published = published = True
+                if record.parent.filtered or not record.is_reachable():
+                    record.filtered = True
+                    continue
+                payloads.append(self._build_payload(record))
+        return payloads
+
+    async def subsequent_payloads(self) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Yields the subsequent payloads of the execution as the records are
+        executed, the ones ready at once being published together.
+        :return: the subsequent payloads
+        """
+        try:
+            while self._pending:
+                payloads = self._publish_ready()
+                if payloads:
+                    yield {
+                        "incremental": payloads,
+                        "hasNext": self.has_pending,
+                    }
+                    continue
+
+                if not self._pending:
+                    # The last records were filtered
+                    yield {"hasNext": False}
+                    return
+
+                await asyncio.wait(
+                    [
+                        record.future
+                        for record in self._pending
+                        if not record.future.done()
+                    ],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            # The client went away or an execution failed
+            for record in self._pending:
+                record.future.cancel()
+
+    def cancel(self) -> None:
+        for record in self._pending:
+            record.future.cancel()
+        self._pending = []
+
+
+async def execute_operation(
+    operation: "NodeOperationDefinition",
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    scheduler: Optional["ResolverScheduler"] = None,
+    deadline: Optional[float] = None,
+) -> AsyncIterable[Dict[str, Any]]:
+    """
+    Executes an operation incrementally: yields the initial payload of the
+    response, without the fragments marked with `@defer` & the items of the
+    lists marked with `@stream`, then the subsequent payloads delivering
+    them as soon as they're executed. Operations which don't use these
+    directives only yield their response.
+    :param operation: the operation to execute
+    :param request_ctx: the context of the request
+    :param initial_value: the value of the root of the operation
+    :param error_coercer: the callable coercing the errors
+    :param variables: the variables of the execution
+    :param scheduler: the scheduler bounding the resolvers invoked at once
+    :param deadline: the time at which the resolvers still running are
+    cancelled
+    :return: the payloads of the response
+    """
+    execution_ctx, errors = create_execution_context(
+        operation, variables, scheduler, deadline
+    )
+
+    if errors:
+        yield {"data": None, "errors": [error_coercer(err) for err in errors]}
+        return
+
+    async for payload in _execute_incrementally(  # pylint: disable=not-an-iterable
+        operation, execution_ctx, request_ctx, initial_value, error_coercer
+    ):
+        yield payload
+
+
+async def _execute_incrementally(
+    operation: "NodeOperationDefinition",
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+) -> AsyncIterable[Dict[str, Any]]:
+    publisher = IncrementalPublisher(operation, request_ctx, error_coercer)
+    initial = _InitialResponse(
+        publisher, execution_ctx, operation, initial_value, error_coercer
+    )
+
+    try:
+        await initial.execute(request_ctx)
+    except BaseException:
+        publisher.cancel()
+        raise
+
+    response = initial.build_payload()
+
+    if (
+        response["data"] is None
+        and publisher.has_pending
+        and all(
+            execution_ctx.is_execution_stopped(node)
+            for node in operation.children
+        )
+    ):
+        # All the root fields are deferred
+        response["data"] = {}
+
+    publisher.data = response["data"]
+    if response["data"] is None:
+        # Nothing left to deliver the payloads into
+        publisher.cancel()
+
+    if not publisher.has_pending:
+        yield response
+        return
+
+    initial.published = True
+    response["hasNext"] = True
+    yield response
+
+    async for payload in publisher.subsequent_payloads():  # pylint: disable=not-an-iterable
+        yield payload
@@ -0,0 +1,149 @@
+import asyncio
+import heapq
+
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds the number of holders of a slot at once. Waiters are given the
+    slots released in increasing order of priority, then in their order of
+    arrival.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("< limit > must be greater or equal to 1.")
+        self._limit = limit
+        self._waiters: List[Any] = []
+        self._arrivals = count()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def waiting(self) -> int:
+        return sum(not waiter[2].done() for waiter in self._waiters)
+
+    async def acquire(self, priority: int = 0) -> None:
+        """
+        Waits for a slot to be available & takes it.
+        :param priority: the priority of the acquisition, lower first
+        """
+        while self._waiters and self._waiters[0][2].done():
+            # Waiters cancelled before being given a slot
+            heapq.heappop(self._waiters)
+
+        if self.in_flight < self._limit and not self._waiters:
+            self._take()
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._arrivals), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Hands the slot over to the next waiter, or frees it.
+        """
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "limit": self._limit,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "waiting": self.waiting,
+        }
+
+
+class RequestScheduler:
+    """
+    Slots of the resolvers of a single request: a slot of the request
+    limiter, then one of the limiter shared by all the requests of the
+    engine.
+    """
+
+    __slots__ = ("limiters", "_priority")
+
+    def __init__(
+        self,
+        limiters: List[ConcurrencyLimiter],
+        priority: Optional[Callable[["Info"], int]] = None,
+    ) -> None:
+        self.limiters = limiters
+        self._priority = priority
+
+    async def acquire(self, info: "Info") -> None:
+        priority = self._priority(info) if self._priority else 0
+        acquired = []
+        try:
+            for limiter in self.limiters:
+                await limiter.acquire(priority)
+                acquired.append(limiter)
+        except BaseException:
+            for limiter in reversed(acquired):
+                limiter.release()
+            raise
+
+    def release(self) -> None:
+        for limiter in reversed(self.limiters):
+            limiter.release()
+
+
+class ResolverScheduler:
+    """
+    Bounds the number of resolvers invoked at once, by each request and by
+    all the requests of an engine. The invocations waiting for a slot are
+    served in their order of arrival, or by `priority` (lower first) when
+    given, which computes the priority of an invocation from its info.
+    Only the invocation of the resolver holds a slot, not the execution of
+    the children of its field.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_concurrent_per_request: Optional[int] = None,
+        priority: Optional[Callable[["Info"], int]] = None,
+    ) -> None:
+        self.limiter = (
+            ConcurrencyLimiter(max_concurrent)
+            if max_concurrent is not None
+            else None
+        )
+        self._max_concurrent_per_request = max_concurrent_per_request
+        self._priority = priority
+
+    def for_request(self) -> RequestScheduler:
+        """
+        Returns the scheduler of a new request.
+        :return: the scheduler of the request
+        """
+        limiters = []
+        if self._max_concurrent_per_request is not None:
+            limiters.append(
+                ConcurrencyLimiter(self._max_concurrent_per_request)
+            )
+        if self.limiter is not None:
+            limiters.append(self.limiter)
+        return RequestScheduler(limiters, self._priority)
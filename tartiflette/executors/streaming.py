@@ -0,0 +1,202 @@
+import asyncio
+
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from tartiflette.executors.basic import create_execution_context
+from tartiflette.executors.eager import gather_eagerly
+from tartiflette.executors.types import ExecutionContext, ResultSlot
+
+# The raw value, coerced value & slot of a root field whose children are
+# executed while its response is streamed
+StreamedField = Tuple[List[Any], List[Any], ResultSlot]
+
+
+async def _execute_children(
+    children: Iterator[Tuple["NodeField", Any, Any, Optional[ResultSlot]]],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> None:
+    await gather_eagerly(
+        child(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=container,
+            parent_slot=slot,
+        )
+        for child, parent_result, container, slot in children
+    )
+
+
+async def _execute_root_field(
+    node: "NodeField",
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    streamed: Optional[Dict["NodeField", StreamedField]],
+) -> None:
+    resolved = await node.resolve(
+        execution_ctx, request_ctx, parent_result=initial_value
+    )
+    if resolved is None:
+        return
+
+    raw, coerced, slot = resolved
+    # The items of a list can only be sent before the rest of the list is
+    # executed if none of them can null the whole list
+    if (
+        streamed is not None
+        and node.shall_produce_list
+        and not node.items_cant_be_null
+        and isinstance(raw, list)
+        and isinstance(coerced, list)
+    ):
+        streamed[node] = resolved
+        return
+
+    await _execute_children(
+        node.iter_children(execution_ctx, raw, coerced, slot),
+        execution_ctx,
+        request_ctx,
+    )
+
+
+def _encode_items(encoder: Callable[[Any], bytes], items: List[Any]) -> bytes:
+    """
+    Encodes a chunk of the items of a streamed list, without the brackets
+    of the list, so that the chunks can be joined into the whole list.
+    :param encoder: the callable encoding each value of the response
+    :param items: the items to encode
+    :return: the encoded items
+    :raises ValueError: when the encoder doesn't encode lists into JSON
+    arrays
+    """
+    encoded = encoder(items).strip()
+    if not (encoded.startswith(b"[") and encoded.endswith(b"]")):
+        raise ValueError(
+            "Responses can only be streamed with a < response_encoder > "
+            "encoding them into JSON."
+        )
+    return encoded[1:-1]
+
+
+async def stream_operation(
+    operation: "NodeOperationDefinition",
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    encoder: Callable[[Any], bytes],
+    variables: Optional[Dict[str, Any]] = None,
+    scheduler: Optional["ResolverScheduler"] = None,
+    chunk_size: int = 100,
+    deadline: Optional[float] = None,
+) -> AsyncIterable[bytes]:
+    """
+    Executes an operation & yields its encoded response chunk after chunk.
+
+    The root fields are resolved first, then the items of the root fields
+    which are lists of nullable items are executed `chunk_size` at a time:
+    each chunk of items is encoded & released as soon as its subtree is
+    executed, so that only one chunk of the list is held at once. The other
+    root fields are fully executed before the first chunk is sent.
+    :param operation: the operation to execute
+    :param request_ctx: the context of the request
+    :param initial_value: the value of the root of the operation
+    :param error_coercer: the callable coercing the errors
+    :param encoder: the callable encoding each value of the response, into
+    JSON since the chunks are joined by JSON delimiters
+    :param variables: the variables of the execution
+    :param scheduler: the scheduler bounding the resolvers invoked at once
+    :param chunk_size: the number of items of a list executed at once
+    :param deadline: the time at which the resolvers still running are
+    cancelled
+    :return: the chunks of the encoded response
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    execution_ctx, errors = create_execution_context(
+        operation, variables, scheduler, deadline
+    )
+
+    if errors:
+        yield encoder(
+            {"data": None, "errors": [error_coercer(err) for err in errors]}
+        )
+        return
+
+    streamed: Dict["NodeField", StreamedField] = {}
+    if operation.allow_parallelization:
+        await asyncio.gather(
+            *[
+                _execute_root_field(
+                    node, execution_ctx, request_ctx, initial_value, streamed
+                )
+                for node in operation.children
+            ]
+        )
+    else:
+        # Each mutation is executed with its children before the next one
+        for node in operation.children:
+            await _execute_root_field(
+                node, execution_ctx, request_ctx, initial_value, None
+            )
+
+    nodes = [
+        node
+        for node in operation.children
+        if not execution_ctx.is_execution_stopped(node)
+    ]
+
+    chunk = [b'{"data":']
+    if not nodes or any(
+        node.cant_be_null and execution_ctx.get_marshalled(node) is None
+        for node in nodes
+    ):
+        chunk.append(b"null")
+    else:
+        for position, node in enumerate(nodes):
+            chunk.append(b"{" if position == 0 else b",")
+            chunk.append(encoder(node.alias))
+            chunk.append(b":")
+
+            if node not in streamed:
+                chunk.append(encoder(execution_ctx.get_marshalled(node)))
+                continue
+
+            raw, coerced, slot = streamed.pop(node)
+            chunk.append(b"[")
+            for start in range(0, len(coerced), chunk_size):
+                stop = min(start + chunk_size, len(coerced))
+                await _execute_children(
+                    node.iter_children(
+                        execution_ctx, raw, coerced, slot, start, stop
+                    ),
+                    execution_ctx,
+                    request_ctx,
+                )
+
+                if start:
+                    chunk.append(b",")
+                chunk.append(_encode_items(encoder, coerced[start:stop]))
+                # Sent, so that they can be released
+                coerced[start:stop] = [None] * (stop - start)
+
+                yield b"".join(chunk)
+                chunk = []
+            chunk.append(b"]")
+        chunk.append(b"}")
+
+    errors = [error_coercer(err) for err in execution_ctx.errors if err]
+    if errors:
+        chunk.append(b',"errors":')
+        chunk.append(encoder(errors))
+    chunk.append(b"}")
+    yield b"".join(chunk)
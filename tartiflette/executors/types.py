@@ -1,11 +1,50 @@
-from typing import Any, List
+import asyncio
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
 
 
 class ExecutionContext:
-    # See if we should keep it here or move it to the visitor ?
-    def __init__(self) -> None:
+    # Holds everything related to a single execution so that the nodes of an
+    # operation can be shared between concurrent executions. The results of
+    # the root fields are addressed by their index in the operation, the
+    # results of their children live in the values built by the execution.
+    __slots__ = (
+        "_errors",
+        "is_introspection",
+        "variables",
+        "results",
+        "_stopped",
+        "_dataloaders",
+        "scheduler",
+        "infos",
+        "incremental",
+        "deadline",
+    )
+
+    def __init__(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        nb_root_fields: int = 0,
+        scheduler: Optional["RequestScheduler"] = None,
+        deadline: Optional[float] = None,
+        dataloaders: Optional[Dict[Hashable, "DataLoader"]] = None,
+    ) -> None:
         self._errors: List[Exception] = []
         self.is_introspection: bool = False
+        self.variables: Dict[str, Any] = variables or {}
+        self.results: List[Any] = [None] * nb_root_fields
+        self._stopped: List[bool] = [False] * nb_root_fields
+        self._dataloaders: Dict[Hashable, "DataLoader"] = (
+            dataloaders if dataloaders is not None else {}
+        )
+        self.scheduler: Optional["RequestScheduler"] = scheduler
+        self.infos: Dict["NodeField", "Info"] = {}
+        # The record of the payload being executed when the operation is
+        # executed incrementally (cf. `executors.incremental`)
+        self.incremental: Optional["IncrementalRecord"] = None
+        # The time of the event loop at which the resolvers still running
+        # are cancelled (cf. `executors.deadline`)
+        self.deadline: Optional[float] = deadline
 
     @property
     def errors(self) -> List[Exception]:
@@ -14,8 +53,100 @@ class ExecutionContext:
     def add_error(self, error: Exception) -> None:
         self._errors.append(error)
 
+    def get_marshalled(self, node: "NodeField") -> Any:
+        return self.results[node.index]
+
+    def set_marshalled(self, node: "NodeField", value: Any) -> None:
+        self.results[node.index] = value
+
+    def stop_execution(self, node: "NodeField") -> None:
+        self._stopped[node.index] = True
+
+    def is_execution_stopped(self, node: "NodeField") -> bool:
+        return self._stopped[node.index]
+
+    def time_remaining(self) -> Optional[float]:
+        """
+        Returns the number of seconds left before the deadline of the
+        execution, so that resolvers can pass it on to their backends.
+        :return: the seconds left (0 once expired), None without deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(self.deadline - asyncio.get_event_loop().time(), 0.0)
+
+    def fork(self) -> "ExecutionContext":
+        """
+        Returns a context sharing the variables, loaders, scheduler &
+        deadline of this one, but with its own errors & infos (bound to the
+        new context), to execute a part of the response delivered on its own.
+        :return: the new execution context
+        """
+        execution_ctx = ExecutionContext(
+            self.variables,
+            len(self.results),
+            scheduler=self.scheduler,
+            deadline=self.deadline,
+            dataloaders=self._dataloaders,
+        )
+        execution_ctx.is_introspection = self.is_introspection
+        return execution_ctx
+
+    def get_dataloader(
+        self, key: Hashable, factory: Callable[[], "DataLoader"]
+    ) -> "DataLoader":
+        # Loaders live as long as the execution so that their cache is
+        # scoped to a single request
+        try:
+            return self._dataloaders[key]
+        except KeyError:
+            dataloader = self._dataloaders[key] = factory()
+            return dataloader
+
+
+class ResultSlot:
+    """
+    Location of a value of the response: the key of a dict or the index of
+    a list, along with the slot of the value holding this dict or list.
+    """
+
+    __slots__ = ("container", "key", "nullable", "parent")
+
+    def __init__(
+        self,
+        container: Union[Dict[str, Any], List[Any]],
+        key: Union[str, int],
+        nullable: bool,
+        parent: Optional["ResultSlot"] = None,
+    ) -> None:
+        self.container = container
+        self.key = key
+        self.nullable = nullable
+        self.parent = parent
+
+    def bubble_null(self) -> None:
+        """
+        Sets to null the value of this slot if it's nullable, else the one
+        of the closest nullable slot holding it (or of the root field).
+        """
+        slot = self
+        while not slot.nullable and slot.parent is not None:
+            slot = slot.parent
+        slot.container[slot.key] = None
+
 
 class Info:
+    # Shared by all the invocations of a field of the query within an
+    # execution, the items of a list included
+    __slots__ = (
+        "query_field",
+        "schema_field",
+        "schema",
+        "path",
+        "location",
+        "execution_ctx",
+    )
+
     def __init__(
         self,
         query_field: "NodeField",
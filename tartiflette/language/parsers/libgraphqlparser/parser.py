@@ -26,6 +26,8 @@ void graphql_error_free(const char *error);
 void graphql_node_free(struct GraphQLAstNode *node);
 
 const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
+
+void free(void *ptr);
 """
 )
 
@@ -42,6 +44,9 @@ try:
 except OSError:
     _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
 
+# The JSON returned by `graphql_ast_to_json` is allocated by `strdup`
+_LIBC = _FFI.dlopen(None)
+
 
 class ParsedData:
     """
@@ -88,12 +93,17 @@ class ParsedData:
         self._destroy_cb(self._c_parsed)
 
 
-def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
+def _parse_context_manager(
+    query: Union[str, bytes], experimental_schema_support: bool = True
+) -> ParsedData:
     """
     Parses the query with the libgraphqlparser library and returns a ParsedData
     instance.
     :param query: query to parse with libgraphqlparser
+    :param experimental_schema_support: whether or not the query may contain
+    type system definitions
     :type query: Union[str, bytes]
+    :type experimental_schema_support: bool
     :return: a ParsedData instance which is a context manager
     :rtype: ParsedData
     :raises GraphQLSyntaxError: raised when the libgraphqlparser library
@@ -104,11 +114,14 @@ def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
 
     errors = _FFI.new("char **")
 
+    parse_string = (
+        _LIB.graphql_parse_string_with_experimental_schema_support
+        if experimental_schema_support
+        else _LIB.graphql_parse_string
+    )
+
     parsed_data = ParsedData(
-        _LIB.graphql_parse_string_with_experimental_schema_support(
-            _FFI.new("char[]", query), errors
-        ),
-        _LIB.graphql_node_free,
+        parse_string(_FFI.new("char[]", query), errors), _LIB.graphql_node_free
     )
 
     if errors[0] != _FFI.NULL:
@@ -122,24 +135,40 @@ def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
     return parsed_data
 
 
-def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
+def _parse_to_json_ast(
+    query: Union[str, bytes], experimental_schema_support: bool = True
+) -> bytes:
     """
     Parses the query and returns its AST JSON representation as bytes.
     :param query: query to parse
+    :param experimental_schema_support: whether or not the query may contain
+    type system definitions
     :type query: Union[str, bytes]
+    :type experimental_schema_support: bool
     :return: bytes AST JSON representation of the query
     :rtype: bytes
     """
-    with _parse_context_manager(query) as parsed:
-        return _FFI.string(_LIB.graphql_ast_to_json(parsed))
-
-
-def parse_to_document(query: Union[str, bytes]) -> "DocumentNode":
+    with _parse_context_manager(
+        query, experimental_schema_support=experimental_schema_support
+    ) as parsed:
+        json_ast = _LIB.graphql_ast_to_json(parsed)
+        try:
+            return _FFI.string(json_ast)
+        finally:
+            _LIBC.free(json_ast)
+
+
+def parse_to_document(
+    query: Union[str, bytes], experimental_schema_support: bool = True
+) -> "DocumentNode":
     """
     Returns a DocumentNode instance which represents the query after being
     parsed.
     :param query: query to parse and transform into a DocumentNode
+    :param experimental_schema_support: whether or not the query may contain
+    type system definitions, executable requests are parsed without it
     :type query: Union[str, bytes]
+    :type experimental_schema_support: bool
     :return: a DocumentNode representing the query
     :rtype: DocumentNode
 
@@ -157,4 +186,10 @@ def parse_to_document(query: Union[str, bytes]) -> "DocumentNode":
     >>>   }
     >>> }''')
     """
-    return document_from_ast_json(json.loads(_parse_to_json_ast(query)))
+    return document_from_ast_json(
+        json.loads(
+            _parse_to_json_ast(
+                query, experimental_schema_support=experimental_schema_support
+            )
+        )
+    )
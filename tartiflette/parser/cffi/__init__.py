@@ -237,6 +237,8 @@ void graphql_node_visit(const struct GraphQLAstNode *node,
 
 
 const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
+
+void free(void *ptr);
 """
 
 TYPES_LIBGRAPHQL = [
@@ -576,12 +578,18 @@ try:
 except OSError:
     _LIB = _FFI.dlopen("%s/libgraphqlparser.dylib" % _LIB_DIR)
 
+# The JSON returned by `graphql_ast_to_json` is allocated by `strdup`
+_LIBC = _FFI.dlopen(None)
+
 
 class LibGraphqlParser:
     def __init__(self):
         self._ffi = _FFI
         self._lib = _LIB
         self._lib_dir = _LIB_DIR
+        # Only read once created, the visitor being given to the callbacks
+        # through the `udata` handle of each visit: a parser can thus visit
+        # several documents at once from different threads.
         self._lib_callbacks = self._ffi.new(
             "struct GraphQLAstVisitorCallbacks *"
         )
@@ -651,17 +659,14 @@ class LibGraphqlParser:
                 self._set_enter_callback(typee)
                 self._set_exit_callback(typee)
 
-    def _parse(self, query: Union[str, bytes]) -> _ParsedData:
+    def _parse_to_ast(self, query: Union[str, bytes]) -> "CData":
         if isinstance(query, str):
             query = query.encode("UTF-8")
 
         errors = self._ffi.new("char **")
 
         c_query = self._ffi.new("char[]", query)
-        parsed_data = _ParsedData(
-            self._lib.graphql_parse_string(c_query, errors),
-            self._lib.graphql_node_free,
-        )
+        c_parsed = self._lib.graphql_parse_string(c_query, errors)
 
         if errors[0] != self._ffi.NULL:
             # TODO Parse libgraphql error string and fill location
@@ -671,21 +676,35 @@ class LibGraphqlParser:
             self._lib.graphql_error_free(errors[0])
             raise e
 
-        return parsed_data
+        return c_parsed
+
+    def _parse(self, query: Union[str, bytes]) -> _ParsedData:
+        return _ParsedData(
+            self._parse_to_ast(query), self._lib.graphql_node_free
+        )
+
+    def visit(
+        self, parsed: "CData", visitor: Optional["TartifletteVisitor"] = None
+    ) -> None:
+        if not visitor:
+            visitor = self._default_visitor_cls()
+
+        self._lib.graphql_node_visit(
+            parsed, self._lib_callbacks, self._ffi.new_handle(visitor)
+        )
 
     def parse_and_visit(
         self,
         query: Union[str, bytes],
         visitor: Optional["TartifletteVisitor"] = None,
     ) -> None:
-        if not visitor:
-            visitor = self._default_visitor_cls()
-
         with self._parse(query) as parsed:
-            self._lib.graphql_node_visit(
-                parsed, self._lib_callbacks, self._ffi.new_handle(visitor)
-            )
+            self.visit(parsed, visitor)
 
     def parse_and_jsonify(self, query: Union[str, bytes]) -> bytes:
         with self._parse(query) as parsed:
-            return self._ffi.string(self._lib.graphql_ast_to_json(parsed))
+            json_ast = self._lib.graphql_ast_to_json(parsed)
+            try:
+                return self._ffi.string(json_ast)
+            finally:
+                _LIBC.free(json_ast)
@@ -0,0 +1,287 @@
+from typing import Any, Optional
+
+from tartiflette.language.ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumValueNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListTypeNode,
+    ListValueNode,
+    NamedTypeNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.parser.cffi import Visitor
+from tartiflette.types.location import Location
+
+
+def _get_name(node: Any) -> Optional[str]:
+    name = getattr(node, "name", None)
+    return name.value if name is not None else None
+
+
+class _DocumentElement:
+    """
+    Pure Python counterpart of `tartiflette.parser.cffi._VisitorElement`
+    backed by a DocumentNode node instead of a libgraphqlparser one.
+    """
+
+    __slots__ = ("libgraphql_type", "name", "_node")
+
+    def __init__(self, libgraphql_type: str, node: Any) -> None:
+        self.libgraphql_type = libgraphql_type
+        self.name = _get_name(node)
+        self._node = node
+
+    def get_location(self) -> Location:
+        location = self._node.location
+        return Location(
+            location.line,
+            location.column,
+            location.line_end,
+            location.column_end,
+        )
+
+
+class _DocumentElementValue(_DocumentElement):
+    __slots__ = ()
+
+    def get_value(self) -> Any:
+        return self._node.value
+
+
+class _DocumentElementNullValue(_DocumentElement):
+    __slots__ = ()
+
+    @staticmethod
+    def get_value() -> None:
+        return None
+
+
+class _DocumentElementFragmentDefinition(_DocumentElement):
+    __slots__ = ()
+
+    def get_type_condition(self) -> Optional[str]:
+        return _get_name(self._node.type_condition)
+
+
+class _DocumentElementOperationDefinition(_DocumentElement):
+    __slots__ = ()
+
+    def get_operation(self) -> str:
+        return self._node.operation_type.capitalize()
+
+
+class _DocumentElementField(_DocumentElement):
+    __slots__ = ()
+
+    def get_alias(self) -> Optional[str]:
+        alias = self._node.alias
+        return alias.value if alias is not None else None
+
+    def get_selection_set_size(self) -> int:
+        selection_set = self._node.selection_set
+        if selection_set is not None:
+            return len(selection_set.selections)
+        return 0
+
+
+class _DocumentElementInlineFragment(_DocumentElement):
+    __slots__ = ()
+
+    def get_named_type(self) -> Optional[str]:
+        type_condition = self._node.type_condition
+        if type_condition is not None:
+            return _get_name(type_condition)
+        return None
+
+
+class _DocumentElementSelectionSet(_DocumentElement):
+    __slots__ = ()
+
+    def get_selections_size(self) -> int:
+        return len(self._node.selections)
+
+
+class DocumentVisitor:
+    """
+    Walks a DocumentNode in the same order as libgraphqlparser walks its own
+    AST and sends the same `IN` & `OUT` events to the visitor, without any
+    round trip between C & Python for each node.
+    """
+
+    def __init__(self, visitor: Visitor) -> None:
+        self._visitor = visitor
+        self._walkers = {
+            ArgumentNode: ("Argument", _DocumentElement, self._walk_argument),
+            BooleanValueNode: ("BooleanValue", _DocumentElementValue, None),
+            DirectiveNode: (
+                "Directive",
+                _DocumentElement,
+                self._walk_arguments,
+            ),
+            DocumentNode: ("Document", _DocumentElement, self._walk_document),
+            EnumValueNode: ("EnumValue", _DocumentElementValue, None),
+            FieldNode: ("Field", _DocumentElementField, self._walk_field),
+            FloatValueNode: ("FloatValue", _DocumentElementValue, None),
+            FragmentDefinitionNode: (
+                "FragmentDefinition",
+                _DocumentElementFragmentDefinition,
+                self._walk_fragment_definition,
+            ),
+            FragmentSpreadNode: (
+                "FragmentSpread",
+                _DocumentElement,
+                self._walk_directives,
+            ),
+            InlineFragmentNode: (
+                "InlineFragment",
+                _DocumentElementInlineFragment,
+                self._walk_inline_fragment,
+            ),
+            IntValueNode: ("IntValue", _DocumentElementValue, None),
+            ListTypeNode: ("ListType", _DocumentElement, self._walk_type),
+            ListValueNode: (
+                "ListValue",
+                _DocumentElement,
+                self._walk_list_value,
+            ),
+            NamedTypeNode: ("NamedType", _DocumentElement, None),
+            NonNullTypeNode: (
+                "NonNullType",
+                _DocumentElement,
+                self._walk_type,
+            ),
+            NullValueNode: ("NullValue", _DocumentElementNullValue, None),
+            ObjectFieldNode: (
+                "ObjectField",
+                _DocumentElement,
+                self._walk_argument,
+            ),
+            ObjectValueNode: (
+                "ObjectValue",
+                _DocumentElement,
+                self._walk_object_value,
+            ),
+            OperationDefinitionNode: (
+                "OperationDefinition",
+                _DocumentElementOperationDefinition,
+                self._walk_operation_definition,
+            ),
+            SelectionSetNode: (
+                "SelectionSet",
+                _DocumentElementSelectionSet,
+                self._walk_selection_set,
+            ),
+            StringValueNode: ("StringValue", _DocumentElementValue, None),
+            VariableDefinitionNode: (
+                "VariableDefinition",
+                _DocumentElement,
+                self._walk_variable_definition,
+            ),
+            VariableNode: ("Variable", _DocumentElement, None),
+        }
+
+    def visit(self, node: Any) -> None:
+        """
+        Sends the events of the node & of its children to the visitor.
+        Children of a node aren't visited & its `OUT` event isn't sent if the
+        visitor unsets its `continue_child` flag, as libgraphqlparser does.
+        :param node: node to visit
+        """
+        if node is None:
+            return
+
+        libgraphql_type, element_class, walk_children = self._walkers[
+            type(node)
+        ]
+        element = element_class(libgraphql_type, node)
+
+        visitor = self._visitor
+        visitor.update(Visitor.IN, element)
+        if visitor.continue_child and walk_children is not None:
+            walk_children(node)
+
+        if visitor.continue_child:
+            visitor.update(Visitor.OUT, element)
+        else:
+            visitor.continue_child = 1
+
+    def _visit_all(self, nodes: Optional[list]) -> None:
+        for node in nodes or []:
+            self.visit(node)
+
+    def _walk_document(self, node: DocumentNode) -> None:
+        self._visit_all(node.definitions)
+
+    def _walk_operation_definition(
+        self, node: OperationDefinitionNode
+    ) -> None:
+        self._visit_all(node.variable_definitions)
+        self._visit_all(node.directives)
+        self.visit(node.selection_set)
+
+    def _walk_variable_definition(self, node: VariableDefinitionNode) -> None:
+        self.visit(node.variable)
+        self.visit(node.type)
+        self.visit(node.default_value)
+
+    def _walk_fragment_definition(self, node: FragmentDefinitionNode) -> None:
+        self.visit(node.type_condition)
+        self._visit_all(node.directives)
+        self.visit(node.selection_set)
+
+    def _walk_inline_fragment(self, node: InlineFragmentNode) -> None:
+        self.visit(node.type_condition)
+        self._visit_all(node.directives)
+        self.visit(node.selection_set)
+
+    def _walk_selection_set(self, node: SelectionSetNode) -> None:
+        self._visit_all(node.selections)
+
+    def _walk_field(self, node: FieldNode) -> None:
+        self._visit_all(node.arguments)
+        self._visit_all(node.directives)
+        self.visit(node.selection_set)
+
+    def _walk_arguments(self, node: DirectiveNode) -> None:
+        self._visit_all(node.arguments)
+
+    def _walk_directives(self, node: FragmentSpreadNode) -> None:
+        self._visit_all(node.directives)
+
+    def _walk_argument(self, node: ArgumentNode) -> None:
+        self.visit(node.value)
+
+    def _walk_list_value(self, node: ListValueNode) -> None:
+        self._visit_all(node.values)
+
+    def _walk_object_value(self, node: ObjectValueNode) -> None:
+        self._visit_all(node.fields)
+
+    def _walk_type(self, node: ListTypeNode) -> None:
+        self.visit(node.type)
+
+
+def visit_document(document: DocumentNode, visitor: Visitor) -> None:
+    """
+    Visits a DocumentNode with a visitor built for libgraphqlparser's
+    visit (e.g. `TartifletteVisitor`).
+    :param document: the document to visit
+    :param visitor: the visitor to send the events to
+    """
+    DocumentVisitor(visitor).visit(document)
@@ -1,9 +1,23 @@
+from typing import Any, Dict
+
 from tartiflette.types.location import Location
 
 from .node import Node
+from .variable import bind_value
 
 
 class NodeArgument(Node):
+    __slots__ = ("value", "has_variables")
+
     def __init__(self, path: str, location: Location, name: str) -> None:
         super().__init__(path, "Argument", location, name)
         self.value = None
+        self.has_variables = False
+
+    def bind(self, variables: Dict[str, Any]) -> "NodeArgument":
+        if not self.has_variables:
+            return self
+
+        bound = NodeArgument(self.path, self.location, self.name)
+        bound.value = bind_value(self.value, variables)
+        return bound
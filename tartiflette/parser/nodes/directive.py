@@ -6,6 +6,9 @@ from .node import Node
 
 
 class NodeDirective(Node):
+    __slots__ = ("arguments", "has_variables")
+
     def __init__(self, path: str, location: Location, name: str) -> None:
         super().__init__(path, "Directive", location, name)
         self.arguments: Dict[str, Any] = {}
+        self.has_variables = False
@@ -1,9 +1,8 @@
-import asyncio
-
 from functools import partial
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from tartiflette.executors.types import ExecutionContext, Info
+from tartiflette.executors.eager import gather_eagerly
+from tartiflette.executors.types import ExecutionContext, Info, ResultSlot
 from tartiflette.schema import GraphQLSchema
 from tartiflette.types.exceptions.tartiflette import (
     GraphQLError,
@@ -12,13 +11,28 @@ from tartiflette.types.exceptions.tartiflette import (
 )
 from tartiflette.types.helpers import get_typename
 from tartiflette.types.location import Location
-from tartiflette.utils.arguments import coerce_arguments
+from tartiflette.utils.arguments import UNDEFINED_VALUE, coerce_arguments
 from tartiflette.utils.errors import is_coercible_exception
 
 from .node import Node
+from .variable import bind_directives
 
 
 class NodeField(Node):
+    __slots__ = (
+        "schema",
+        "field_executor",
+        "arguments",
+        "type_condition",
+        "alias",
+        "subscribe",
+        "execution_directives",
+        "has_variables",
+        "index",
+        "compiled_children",
+        "_resolves_synchronously",
+    )
+
     def __init__(
         self,
         name: str,
@@ -37,16 +51,26 @@ class NodeField(Node):
         self.field_executor = field_executor
         self.arguments: Dict[str, Any] = {}
         self.type_condition = type_condition
-        self.marshalled: Dict[str, Any] = {}
         self.alias = alias or self.name
         self.subscribe = subscribe
-        self.is_execution_stopped = False
         self.execution_directives = []
+        self.has_variables = False
+        # Position of the field among the root fields of its operation, which
+        # addresses its result in the `ExecutionContext` (None if not a root)
+        self.index: Optional[int] = None
+        # Set once the operation is compiled (cf. `executors.compiler`)
+        self.compiled_children: Optional[Callable] = None
+        # Computed on the first execution, once the field has been planned
+        self._resolves_synchronously: Optional[bool] = None
 
     @property
     def cant_be_null(self) -> bool:
         return self.field_executor.cant_be_null
 
+    @property
+    def items_cant_be_null(self) -> bool:
+        return self.field_executor.items_cant_be_null
+
     @property
     def contains_not_null(self) -> bool:
         return self.field_executor.contains_not_null
@@ -55,43 +79,153 @@ class NodeField(Node):
     def shall_produce_list(self) -> bool:
         return self.field_executor.shall_produce_list
 
+    @property
+    def resolves_synchronously(self) -> bool:
+        """
+        Whether the field is a leaf resolved by the default resolver without
+        any argument nor directive, which its parent can resolve & coerce
+        without going through `__call__`.
+        """
+        if self._resolves_synchronously is None:
+            self._resolves_synchronously = (
+                not self.children
+                and not self.arguments
+                and not self.execution_directives
+                and self.field_executor.resolves_synchronously
+            )
+        return self._resolves_synchronously
+
     def add_directive(
         self, directive: Dict[str, Union["Directive", Dict[str, Any]]]
     ):
+        if "defaults" in directive:
+            self.has_variables = True
         self.execution_directives.append(directive)
 
-    def bubble_error(self) -> None:
-        if self.cant_be_null is False:
-            # mean i can be null
-            if self.parent and self.parent.marshalled is not None:
-                self.parent.marshalled[self.alias] = None
-            else:
-                self.marshalled = None
-        else:
-            if self.parent:
-                self.parent.bubble_error()
-            else:
-                self.marshalled = None
-
-    def _get_coroutz_from_child(
+    def bind_variables(
+        self, variables: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Returns the arguments & directives of the field with the variables
+        they reference replaced by their value for the current execution.
+        """
+        if not self.has_variables:
+            return self.arguments, self.execution_directives
+
+        arguments = {}
+        for name, argument in self.arguments.items():
+            argument = argument.bind(variables)
+            if argument.value is not UNDEFINED_VALUE:
+                arguments[name] = argument
+
+        return arguments, bind_directives(self.execution_directives, variables)
+
+    def get_directive_arguments(
+        self, name: str, variables: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the arguments of the directive of the field named `name`,
+        bound to the variables of the execution. The directives of an inline
+        fragment are also set on the fields nested into its fields, only its
+        own fields are considered as having them.
+        :param name: the name of the directive
+        :param variables: the variables of the execution
+        :return: the arguments of the directive, None if the field doesn't
+        have it
+        """
+        parent_directives = (
+            self.parent.execution_directives
+            if isinstance(self.parent, NodeField)
+            else []
+        )
+
+        for directive in self.execution_directives:
+            if directive.get("name") != name or any(
+                directive is parent_directive
+                for parent_directive in parent_directives
+            ):
+                continue
+
+            if "defaults" in directive:
+                return bind_directives([directive], variables)[0]["args"]
+            return directive["args"]
+        return None
+
+    def _iter_children_of_value(
         self,
-        execution_ctx: "ExecutionContext",
-        request_ctx: Optional[Dict[str, Any]],
+        execution_ctx: ExecutionContext,
         result: Optional[Any],
         coerced: Optional[Any],
-        raw_typename: str,
-    ) -> List[Coroutine]:
-        return [
-            child(
+        slot: Optional[ResultSlot],
+    ) -> Iterator[Tuple["NodeField", Any, Any, Optional[ResultSlot]]]:
+        raw_typename = get_typename(result)
+        resolve_sync = (
+            coerced is not None and not execution_ctx.is_introspection
+        )
+
+        for child in self.children:
+            if child.type_condition and child.type_condition != raw_typename:
+                continue
+
+            if resolve_sync and child.resolves_synchronously:
+                try:
+                    coerced[child.alias] = child.field_executor.resolve_sync(
+                        result
+                    )
+                    continue
+                except Exception:  # pylint: disable=broad-except
+                    # Null value of a non-null field, coercion error... are
+                    # reported by the regular execution of the field
+                    pass
+
+            yield child, result, coerced, slot
+
+    def iter_children(
+        self,
+        execution_ctx: ExecutionContext,
+        result: Optional[Any],
+        coerced: Optional[Any],
+        slot: Optional[ResultSlot],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple["NodeField", Any, Any, Optional[ResultSlot]]]:
+        """
+        Yields the children of the field to execute against its value (once
+        per item for a list), along with the value of their parent, the
+        container of their own value & its slot. The children which can be
+        resolved synchronously are resolved on the fly instead.
+        :param execution_ctx: the context of the execution
+        :param result: the raw value of the field
+        :param coerced: the coerced value of the field
+        :param slot: the slot of the coerced value of the field
+        :param start: for a list, the index of the first item to execute
+        :param stop: for a list, the index after the last item to execute,
+        None for the end of the list
+        :return: the children to execute & their parent value, container &
+        slot, created lazily
+        """
+        if not self.shall_produce_list:
+            yield from self._iter_children_of_value(
+                execution_ctx, result, coerced, slot
+            )
+            return
+
+        # A value which isn't a list is coerced to null & reported by the
+        # coercer of the field, it has no items to execute
+        if not isinstance(result, list) or not isinstance(coerced, list):
+            return
+
+        items_nullable = not self.items_cant_be_null
+        if stop is None or stop > len(result):
+            stop = len(result)
+
+        for index in range(start, stop):
+            yield from self._iter_children_of_value(
                 execution_ctx,
-                request_ctx,
-                parent_result=result,
-                parent_marshalled=coerced,
+                result[index],
+                coerced[index],
+                ResultSlot(coerced, index, items_nullable, slot),
             )
-            for child in self.children
-            if (child.type_condition and child.type_condition == raw_typename)
-            or not child.type_condition
-        ]
 
     async def _execute_children(
         self,
@@ -99,27 +233,53 @@ class NodeField(Node):
         request_ctx: Optional[Dict[str, Any]],
         result: Optional[Any],
         coerced: Optional[Any],
+        slot: Optional[ResultSlot],
     ) -> None:
-        coroutz = []
-        if self.shall_produce_list:
-            # TODO Better manage of None values here. (Should be transformed by coerce)
-            if isinstance(result, list) and isinstance(coerced, list):
-                for index, raw in enumerate(result):
-                    raw_typename = get_typename(raw)
-                    coroutz = coroutz + self._get_coroutz_from_child(
-                        execution_ctx,
-                        request_ctx,
-                        raw,
-                        coerced[index],
-                        raw_typename,
-                    )
-        else:
-            raw_typename = get_typename(result)
-            coroutz = self._get_coroutz_from_child(
-                execution_ctx, request_ctx, result, coerced, raw_typename
+        compiled = self.compiled_children
+        if compiled is not None:
+            # Set by `executors.compiler`, pylint only infers its None default
+            await compiled(  # pylint: disable=not-callable
+                execution_ctx, request_ctx, result, coerced, slot
+            )
+            return
+
+        # Created lazily, item after item for a list, so that only the
+        # coroutines which suspend are kept alive
+        await gather_eagerly(
+            child(
+                execution_ctx,
+                request_ctx,
+                parent_result=child_parent_result,
+                parent_marshalled=child_container,
+                parent_slot=child_slot,
             )
+            for (
+                child,
+                child_parent_result,
+                child_container,
+                child_slot,
+            ) in self.iter_children(execution_ctx, result, coerced, slot)
+        )
 
-        await asyncio.gather(*coroutz, return_exceptions=False)
+    def get_info(self, execution_ctx: ExecutionContext) -> Info:
+        """
+        Returns the info given to the resolver of the field, created once
+        per execution.
+        :param execution_ctx: the context of the execution
+        :return: the info of the field
+        """
+        try:
+            return execution_ctx.infos[self]
+        except KeyError:
+            info = execution_ctx.infos[self] = Info(
+                query_field=self,
+                schema_field=self.field_executor.schema_field,
+                schema=self.schema,
+                path=self.path,
+                location=self.location,
+                execution_ctx=execution_ctx,
+            )
+            return info
 
     async def create_source_event_stream(
         self,
@@ -133,20 +293,15 @@ class NodeField(Node):
                 "provide a source event stream with < @Subscription >."
             )
 
-        info = Info(
-            query_field=self,
-            schema_field=self.field_executor.schema_field,
-            schema=self.schema,
-            path=self.path,
-            location=self.location,
-            execution_ctx=execution_ctx,
-        )
+        info = self.get_info(execution_ctx)
+
+        arguments, _ = self.bind_variables(execution_ctx.variables)
 
         return self.subscribe(
             parent_result,
             await coerce_arguments(
                 self.field_executor.schema_field.arguments,
-                self.arguments,
+                arguments,
                 request_ctx,
                 info,
             ),
@@ -154,51 +309,160 @@ class NodeField(Node):
             info,
         )
 
-    async def __call__(
+    async def resolve(
         self,
         execution_ctx: ExecutionContext,
         request_ctx: Optional[Dict[str, Any]],
         parent_result: Optional[Any] = None,
         parent_marshalled: Optional[Any] = None,
-    ) -> None:
-        try:
-            raw, coerced = await self.field_executor(
+        parent_slot: Optional[ResultSlot] = None,
+        defer: bool = True,
+    ) -> Optional[Tuple[Any, Any, Optional[ResultSlot]]]:
+        """
+        Resolves & coerces the value of the field, stores it into the value
+        of its parent (into the execution context for a root field) &
+        reports its errors, without executing its children.
+        :param execution_ctx: the context of the execution
+        :param request_ctx: the context of the request
+        :param parent_result: the raw value of the parent field
+        :param parent_marshalled: the coerced value of the parent field
+        :param parent_slot: the slot of the coerced value of the parent
+        :param defer: whether the field can be deferred by `@defer`
+        :return: the raw & coerced values of the field along with their slot
+        when its children have to be executed, None otherwise
+        """
+        if (
+            defer
+            and execution_ctx.incremental is not None
+            and self.execution_directives
+            and execution_ctx.incremental.defer(
+                self,
+                execution_ctx,
                 parent_result,
-                self.arguments,
-                request_ctx,
-                Info(
-                    query_field=self,
-                    schema_field=self.field_executor.schema_field,
-                    schema=self.schema,
-                    path=self.path,
-                    location=self.location,
-                    execution_ctx=execution_ctx,
-                ),
-                execution_directives=self.execution_directives,
+                parent_marshalled,
+                parent_slot,
+            )
+        ):
+            if parent_marshalled is None and self.index is not None:
+                execution_ctx.stop_execution(self)
+            return None
+
+        try:
+            raw, coerced = await self._resolve_value(
+                execution_ctx, request_ctx, parent_result
             )
         except SkipExecution:
-            self.is_execution_stopped = True
-            return  # field_executor asked execution to be stopped for this branch
+            if self.index is not None:
+                execution_ctx.stop_execution(self)
+            # field_executor asked execution to be stopped for this branch
+            return None
 
+        return self._complete_value(
+            execution_ctx, raw, coerced, parent_marshalled, parent_slot
+        )
+
+    async def _resolve_value(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any],
+    ) -> Tuple[Any, Any]:
+        """
+        Resolves & coerces the value of the field.
+        :param execution_ctx: the context of the execution
+        :param request_ctx: the context of the request
+        :param parent_result: the raw value of the parent field
+        :return: the raw & coerced values of the field
+        """
+        arguments, directives = self.bind_variables(execution_ctx.variables)
+        return await self.field_executor(
+            parent_result,
+            arguments,
+            request_ctx,
+            self.get_info(execution_ctx),
+            execution_directives=directives,
+        )
+
+    def _complete_value(
+        self,
+        execution_ctx: ExecutionContext,
+        raw: Any,
+        coerced: Any,
+        parent_marshalled: Optional[Any],
+        parent_slot: Optional[ResultSlot],
+    ) -> Optional[Tuple[Any, Any, Optional[ResultSlot]]]:
+        """
+        Stores the coerced value of the field into the value of its parent
+        (into the execution context for a root field) & reports its errors.
+        :param execution_ctx: the context of the execution
+        :param raw: the raw value of the field
+        :param coerced: the coerced value of the field
+        :param parent_marshalled: the coerced value of the parent field
+        :param parent_slot: the slot of the coerced value of the parent
+        :return: the raw & coerced values of the field along with their slot
+        when its children have to be executed, None otherwise
+        """
+        slot = None
         if parent_marshalled is not None:
             parent_marshalled[self.alias] = coerced
-        else:
-            self.marshalled = coerced
+            slot = ResultSlot(
+                parent_marshalled,
+                self.alias,
+                not self.cant_be_null,
+                parent_slot,
+            )
+        elif self.index is not None:
+            execution_ctx.set_marshalled(self, coerced)
+            slot = ResultSlot(
+                execution_ctx.results, self.index, not self.cant_be_null
+            )
 
         if isinstance(raw, Exception):
-            if (
-                (self.cant_be_null or self.contains_not_null)
-                and self.parent
-                and self.cant_be_null
-            ):
-                self.parent.bubble_error()
+            if self.cant_be_null and parent_slot is not None:
+                parent_slot.bubble_null()
 
             _add_errors_to_execution_context(
                 execution_ctx, raw, self.path, self.location
             )
-        elif self.children and raw is not None:
+            return None
+
+        incremental = execution_ctx.incremental
+        if (
+            incremental is not None
+            and self.execution_directives
+            and self.shall_produce_list
+        ):
+            raw = incremental.stream(self, execution_ctx, raw, coerced, slot)
+
+        if self.children and raw is not None:
+            return raw, coerced, slot
+        return None
+
+    async def __call__(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Any] = None,
+        parent_slot: Optional[ResultSlot] = None,
+        defer: bool = True,
+    ) -> None:
+        resolved = await self.resolve(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_slot=parent_slot,
+            defer=defer,
+        )
+        if resolved is not None:
+            # The raw & coerced values of the field along with their slot
             await self._execute_children(
-                execution_ctx, request_ctx, result=raw, coerced=coerced
+                execution_ctx,
+                request_ctx,
+                result=resolved[0],
+                coerced=resolved[1],
+                slot=resolved[2],
             )
 
 
@@ -1,10 +1,128 @@
+from copy import copy
+from typing import Any, Dict, List, Optional, Tuple
+
 from .definition import NodeDefinition
 
+# Stand for the directives which depend on where the fragment is spread: the
+# ones of the inline fragment holding the spread & the ones of the spread
+SITE_DIRECTIVES: Dict[str, Any] = {}
+SPREAD_DIRECTIVES: Dict[str, Any] = {}
+
 
 class NodeFragmentDefinition(NodeDefinition):
+    __slots__ = (
+        "callbacks",
+        "type_condition",
+        "selection_size",
+        "spreads",
+        "plans",
+    )
+
     def __init__(
         self, path: str, location: "Location", name: str, type_condition: str
     ) -> None:
         super().__init__(path, "FragmentDefinition", location, name)
         self.callbacks = []
         self.type_condition = type_condition
+        # Fields & fragment spreads of the fragment, from which the size of
+        # the operations once their fragments are spread is computed
+        self.selection_size = 0
+        self.spreads: List["_VisitorElement"] = []
+        # Plans of the fragment by type of the field it's spread into (and
+        # whether or not the spread is in an inline fragment), None while
+        # being planned or when the fragment has to be replayed
+        self.plans: Dict[Tuple[str, bool], Optional["FragmentPlan"]] = {}
+
+
+class FragmentPlan:
+    """
+    Fields of a fragment resolved & validated once for a given parent type.
+    Each spread of the fragment into a field of that type gets its own copy
+    of these fields, without replaying the events of the fragment.
+    """
+
+    def __init__(
+        self,
+        nodes: List["NodeField"],
+        field_path: List[str],
+        variable_usages: List[str],
+        directives: List[Dict[str, Any]],
+        inline_fragment_directives: List[Dict[str, Any]],
+    ) -> None:
+        self.nodes = nodes
+        self._prefix_length = len(field_path)
+        self._variable_usages = variable_usages
+        self._directives = directives
+        self._inline_fragment_directives = inline_fragment_directives
+
+    def spread(
+        self,
+        parent: "NodeField",
+        field_path: List[str],
+        operation: "NodeOperationDefinition",
+        inline_fragment_info: Optional["FragmentData"],
+        spread_directives: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Adds a copy of the fields of the fragment to the field it's spread
+        into.
+        :param parent: the field the fragment is spread into
+        :param field_path: the path of this field
+        :param operation: the operation the fragment is spread into
+        :param inline_fragment_info: the inline fragment holding the spread
+        :param spread_directives: directives of the spread
+        """
+        self._add_usages(parent, operation)
+
+        replacements = {
+            id(SITE_DIRECTIVES): list(inline_fragment_info.directives)
+            if inline_fragment_info
+            else [],
+            id(SPREAD_DIRECTIVES): spread_directives,
+        }
+        for node in self.nodes:
+            parent.add_child(
+                self._copy_node(node, parent, field_path, replacements)
+            )
+
+        # Directives of the fragment met while the inline fragment holding
+        # the spread is the current one are added to this inline fragment
+        for directive in self._inline_fragment_directives:
+            inline_fragment_info.add_directive(directive)
+
+    def _add_usages(
+        self, parent: "NodeField", operation: "NodeOperationDefinition"
+    ) -> None:
+        for var_name in self._variable_usages:
+            operation.add_variable_usage(var_name)
+
+        for directive in self._directives:
+            parent.add_directive(directive)
+
+    def _copy_node(
+        self,
+        node: "NodeField",
+        parent: "NodeField",
+        field_path: List[str],
+        replacements: Dict[int, List[Dict[str, Any]]],
+    ) -> "NodeField":
+        node_copy = copy(node)
+        node_copy.parent = parent
+        node_copy.path = field_path + node.path[self._prefix_length :]
+
+        if any(
+            id(directive) in replacements
+            for directive in node.execution_directives
+        ):
+            node_copy.execution_directives = []
+            for directive in node.execution_directives:
+                for spread_directive in replacements.get(
+                    id(directive), [directive]
+                ):
+                    node_copy.add_directive(spread_directive)
+
+        node_copy.children = [
+            self._copy_node(child, node_copy, field_path, replacements)
+            for child in node.children
+        ]
+        return node_copy
@@ -2,6 +2,15 @@ from typing import List, Union
 
 
 class Node:
+    __slots__ = (
+        "path",
+        "parent",
+        "children",
+        "libgraphql_type",
+        "location",
+        "name",
+    )
+
     def __init__(
         self,
         path: Union[str, List[str]],
@@ -1,13 +1,68 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.types.exceptions.tartiflette import UnknownVariableException
+
 from .definition import NodeDefinition
 
 
 class NodeOperationDefinition(NodeDefinition):
+    __slots__ = (
+        "type",
+        "variable_definitions",
+        "variable_usages",
+        "executions",
+        "compilation_attempted",
+        "compiled",
+    )
+
     def __init__(
         self, path: str, location: "Location", name: str, operation_type: str
     ) -> None:
         super().__init__(path, "OperationDefinition", location, name)
         self.type = operation_type
+        self.variable_definitions: List["NodeVariableDefinition"] = []
+        self.variable_usages: List[str] = []
+        # JIT compilation (cf. `tartiflette.executors.compiler`)
+        self.executions = 0
+        self.compilation_attempted = False
+        self.compiled: Optional[Callable] = None
 
     @property
     def allow_parallelization(self) -> bool:
         return self.type != "Mutation"
+
+    def add_variable_definition(
+        self, variable_definition: "NodeVariableDefinition"
+    ) -> None:
+        self.variable_definitions.append(variable_definition)
+
+    def add_variable_usage(self, var_name: str) -> None:
+        self.variable_usages.append(var_name)
+
+    def coerce_variables(
+        self, variables: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], List[Exception]]:
+        """
+        Binding step of the operation: validates the given variables against
+        the variable definitions of the operation & applies default values.
+        :param variables: the variables given for the execution
+        :return: the variables to execute the operation with & the errors
+        encountered
+        """
+        coerced_variables = dict(variables) if variables else {}
+        errors = []
+
+        for variable_definition in self.variable_definitions:
+            value, variable_errors = variable_definition.coerce(
+                coerced_variables
+            )
+            if variable_errors:
+                errors.extend(variable_errors)
+                continue
+            coerced_variables[variable_definition.var_name] = value
+
+        for var_name in self.variable_usages:
+            if var_name not in coerced_variables:
+                errors.append(UnknownVariableException(var_name))
+
+        return coerced_variables, errors
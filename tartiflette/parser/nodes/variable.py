@@ -0,0 +1,75 @@
+from typing import Any, Dict, List
+
+from tartiflette.types.location import Location
+from tartiflette.utils.arguments import UNDEFINED_VALUE
+
+from .node import Node
+
+
+class NodeVariable(Node):
+    """
+    Reference to a variable used as (or inside) an argument value. It's only
+    resolved at execution time so that the same plan can be executed with
+    different variables.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, path: str, location: Location, name: str) -> None:
+        super().__init__(path, "Variable", location, name)
+
+    def bind(self, variables: Dict[str, Any]) -> Any:
+        try:
+            return variables[self.name]
+        except KeyError:
+            pass
+        return UNDEFINED_VALUE
+
+
+def bind_value(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, NodeVariable):
+        return value.bind(variables)
+
+    if isinstance(value, dict):
+        bound = {}
+        for key, item in value.items():
+            item = bind_value(item, variables)
+            if item is not UNDEFINED_VALUE:
+                bound[key] = item
+        return bound
+
+    if isinstance(value, list):
+        return [
+            None if item is UNDEFINED_VALUE else item
+            for item in (bind_value(item, variables) for item in value)
+        ]
+
+    return value
+
+
+def bind_directives(
+    directives: List[Dict[str, Any]], variables: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    bound_directives = []
+    for directive in directives:
+        try:
+            defaults = directive["defaults"]
+        except KeyError:
+            bound_directives.append(directive)
+            continue
+
+        args = {}
+        for name, value in directive["args"].items():
+            value = bind_value(value, variables)
+            args[name] = (
+                defaults.get(name) if value is UNDEFINED_VALUE else value
+            )
+
+        bound_directives.append(
+            {
+                "name": directive["name"],
+                "callables": directive["callables"],
+                "args": args,
+            }
+        )
+    return bound_directives
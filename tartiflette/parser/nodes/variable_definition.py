@@ -1,12 +1,78 @@
+from typing import Any, Dict, List, Tuple
+
+from tartiflette.types.exceptions.tartiflette import (
+    InvalidType,
+    UnknownVariableException,
+)
 from tartiflette.utils.arguments import UNDEFINED_VALUE
 
 from .definition import NodeDefinition
 
 
 class NodeVariableDefinition(NodeDefinition):
+    __slots__ = ("var_name", "default_value", "is_nullable", "is_list")
+
     def __init__(self, path: str, location: "Location", name: str) -> None:
         super().__init__(path, "VariableDefinition", location, name)
         self.var_name = None
         self.default_value = UNDEFINED_VALUE
         self.is_nullable = True
         self.is_list = False
+
+    def _validate_type(self, a_value: Any) -> List[Exception]:
+        if self.is_nullable and a_value is None:
+            return []
+
+        try:
+            if not isinstance(a_value, self.var_type):
+                return [
+                    InvalidType(
+                        "Given value for < %s > is not type < %s >"
+                        % (self.var_name, self.var_type),
+                        locations=[self.location],
+                    )
+                ]
+        except TypeError:
+            # TODO remove this, and handle the case it's an InputValue
+            # (look at registered input values and compare fields)
+            pass
+        return []
+
+    def coerce(self, variables: Dict[str, Any]) -> Tuple[Any, List[Exception]]:
+        """
+        Validates the value given for this variable, or falls back to its
+        default value if none was given.
+        :param variables: the variables given for the execution
+        :return: the value to bind to the variable & the errors encountered
+        """
+        try:
+            a_value = variables[self.var_name]
+        except KeyError:
+            if (
+                self.default_value is None
+                or self.default_value is UNDEFINED_VALUE
+            ) and not self.is_nullable:
+                return (
+                    UNDEFINED_VALUE,
+                    [UnknownVariableException(self.var_name)],
+                )
+            return self.default_value, []
+
+        if self.is_list:
+            if not isinstance(a_value, list):
+                return (
+                    a_value,
+                    [
+                        InvalidType(
+                            "Expecting List for < %s > values" % self.var_name,
+                            locations=[self.location],
+                        )
+                    ],
+                )
+
+            errors = []
+            for val in a_value:
+                errors.extend(self._validate_type(val))
+            return a_value, errors
+
+        return a_value, self._validate_type(a_value)
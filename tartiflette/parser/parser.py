@@ -1,21 +1,48 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
 from tartiflette.parser.cffi import LibGraphqlParser
+from tartiflette.parser.document import visit_document
 from tartiflette.parser.visitor import TartifletteVisitor
 from tartiflette.schema import GraphQLSchema
 
 
 class TartifletteRequestParser(LibGraphqlParser):
+    def __init__(self, max_expanded_fields: Optional[int] = None) -> None:
+        """
+        :param max_expanded_fields: maximum number of fields of the
+        operations of a query once its fragments are spread, None disables
+        the limit
+        """
+        super().__init__()
+        self._max_expanded_fields = max_expanded_fields
+
     def parse_and_tartify(
-        self,
-        schema: GraphQLSchema,
-        query: str,
-        variables: Optional[Dict[str, Any]] = None,
+        self, schema: GraphQLSchema, query: str
+    ) -> Tuple[
+        Optional[Dict[str, List["NodeField"]]], Optional[List[Exception]]
+    ]:
+        """
+        Parses & validates the query against the schema and returns its
+        executable operations. Operations doesn't depend on any variables
+        which are bound at execution time, so they can be reused.
+        """
+        return self.tartify_document(
+            schema, parse_to_document(query, experimental_schema_support=False)
+        )
+
+    def tartify_document(
+        self, schema: GraphQLSchema, document: "DocumentNode"
     ) -> Tuple[
         Optional[Dict[str, List["NodeField"]]], Optional[List[Exception]]
     ]:
-        visitor = TartifletteVisitor(schema, variables)
-        self.parse_and_visit(query, visitor)
+        """
+        Validates the DocumentNode of a query against the schema and returns
+        its executable operations.
+        """
+        visitor = TartifletteVisitor(schema, self._max_expanded_fields)
+        visit_document(document, visitor)
+
         if visitor.exceptions:
             return None, visitor.exceptions  # pylint: disable=raising-bad-type
         return visitor.operations, None
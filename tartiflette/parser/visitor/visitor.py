@@ -1,3 +1,4 @@
+from copy import copy
 from functools import partial
 from typing import Any, Dict, List, Optional, Union
 
@@ -19,10 +20,16 @@ from tartiflette.parser.cffi import (
 from tartiflette.parser.nodes.argument import NodeArgument
 from tartiflette.parser.nodes.directive import NodeDirective
 from tartiflette.parser.nodes.field import NodeField
-from tartiflette.parser.nodes.fragment_definition import NodeFragmentDefinition
+from tartiflette.parser.nodes.fragment_definition import (
+    SITE_DIRECTIVES,
+    SPREAD_DIRECTIVES,
+    FragmentPlan,
+    NodeFragmentDefinition,
+)
 from tartiflette.parser.nodes.operation_definition import (
     NodeOperationDefinition,
 )
+from tartiflette.parser.nodes.variable import NodeVariable
 from tartiflette.parser.nodes.variable_definition import NodeVariableDefinition
 from tartiflette.parser.visitor.list_value import ListValue
 from tartiflette.parser.visitor.object_value import ObjectValue
@@ -30,20 +37,20 @@ from tartiflette.parser.visitor.visitor_context import InternalVisitorContext
 from tartiflette.schema import GraphQLSchema
 from tartiflette.types.exceptions.tartiflette import (
     AlreadyDefined,
-    InvalidType,
+    FragmentCycle,
     MissingRequiredArgument,
     MultipleRootNodeOnSubscriptionOperation,
     NotALeafType,
     NotAnObjectType,
     NotLoneAnonymousOperation,
     NotUniqueOperationName,
+    TooManyExpandedFields,
     UndefinedDirectiveArgument,
     UndefinedFieldArgument,
     UndefinedFragment,
     UniqueArgumentNames,
     UnknownSchemaFieldResolver,
     UnknownTypeDefinition,
-    UnknownVariableException,
     UnusedFragment,
 )
 from tartiflette.types.helpers import reduce_type, transform_directive
@@ -60,11 +67,38 @@ class FragmentData:
         self.directives.append(directive)
 
 
+class _OperationUsages:
+    """
+    Stands for the operation while a fragment is planned, in order to
+    collect the variables used by the fragment.
+    """
+
+    def __init__(self, operation: NodeOperationDefinition) -> None:
+        self.name = operation.name
+        self.type = operation.type
+        self.variable_usages: List[str] = []
+
+    def add_variable_usage(self, var_name: str) -> None:
+        self.variable_usages.append(var_name)
+
+
+class _Selections:
+    """
+    Fields & fragment spreads of the operations of the document, the
+    `NodeFragmentDefinition` counterpart for the selections which aren't
+    part of a fragment.
+    """
+
+    def __init__(self) -> None:
+        self.selection_size = 0
+        self.spreads: List[_VisitorElement] = []
+
+
 class TartifletteVisitor(Visitor):
     # pylint: disable=too-many-instance-attributes
 
     def __init__(
-        self, schema: GraphQLSchema, variables: Optional[Dict[str, Any]] = None
+        self, schema: GraphQLSchema, max_expanded_fields: Optional[int] = None
     ):
         super().__init__()
         self._events = [
@@ -112,7 +146,6 @@ class TartifletteVisitor(Visitor):
         self.operations = {}
         self._named_operations = {}
         self._anonymous_operations = []
-        self._vars = variables or {}
         self._fragments = {}
         self._used_fragments = set()
         self.schema: GraphQLSchema = schema
@@ -121,6 +154,8 @@ class TartifletteVisitor(Visitor):
         self._internal_ctx = InternalVisitorContext()
         self._in_fragment_spread_context = False
         self._error_path = None
+        self._selections = _Selections()
+        self._max_expanded_fields = max_expanded_fields
 
     def _add_exception(self, exception: Exception) -> None:
         self.continue_child = 0
@@ -253,15 +288,21 @@ class TartifletteVisitor(Visitor):
             or self._internal_ctx.node
         )
         if destination:
-            destination.add_directive(
-                transform_directive(
-                    directive,
-                    args={
-                        x.name: x.value
-                        for x in self._internal_ctx.directive.arguments.values()
-                    },
-                )
+            node_directive = transform_directive(
+                directive,
+                args={
+                    x.name: x.value
+                    for x in self._internal_ctx.directive.arguments.values()
+                },
             )
+            if self._internal_ctx.directive.has_variables:
+                # Arguments bound to undefined variables will fall back to
+                # their default value at execution time.
+                node_directive["defaults"] = {
+                    argument.name: argument.default_value
+                    for argument in directive.arguments.values()
+                }
+            destination.add_directive(node_directive)
         self._internal_ctx.directive = None
 
     def _add_argument_to_parent(self):
@@ -343,19 +384,25 @@ class TartifletteVisitor(Visitor):
             self._internal_ctx.node.var_name = element.name
             return
 
-        var_name = element.name
-        try:
-            if self._internal_ctx.current_object_value is not None:
-                self._internal_ctx.current_object_value.set_value(
-                    self._vars[var_name]
-                )
-                return
+        # Variables are only referenced here, their values are bound at
+        # execution time (cf. `NodeOperationDefinition.coerce_variables`).
+        variable = NodeVariable(
+            self._internal_ctx.path, element.get_location(), element.name
+        )
+        self._internal_ctx.operation.add_variable_usage(variable.name)
 
-            self._internal_ctx.argument.value = self._vars[var_name]
-            self._add_argument_to_parent()
+        self._internal_ctx.argument.has_variables = True
+        if self._internal_ctx.directive:
+            self._internal_ctx.directive.has_variables = True
+        else:
+            self._internal_ctx.node.has_variables = True
 
-        except KeyError:
-            self._add_exception(UnknownVariableException(var_name))
+        if self._internal_ctx.current_object_value is not None:
+            self._internal_ctx.current_object_value.set_value(variable)
+            return
+
+        self._internal_ctx.argument.value = variable
+        self._add_argument_to_parent()
 
     def _on_field_in(
         self,
@@ -436,9 +483,11 @@ class TartifletteVisitor(Visitor):
         self._internal_ctx.node = node
 
         if self._internal_ctx.depth == 1:
-            self.operations[self._internal_ctx.operation.name].children.append(
-                node
-            )
+            root_nodes = self.operations[
+                self._internal_ctx.operation.name
+            ].children
+            node.index = len(root_nodes)
+            root_nodes.append(node)
 
     def _on_field_out(self, *_args, **_kwargs) -> None:
         for argument in self._internal_ctx.current_field.arguments.values():
@@ -465,66 +514,11 @@ class TartifletteVisitor(Visitor):
         node.set_parent(self._internal_ctx.node)
         self._internal_ctx.node = node
 
-    def _validate_type(
-        self, varname: str, a_value: Any, a_type: Any, is_nullable: bool
-    ) -> None:
-        if is_nullable and a_value is None:
-            return
-
-        try:
-            if not isinstance(a_value, a_type):
-                self._add_exception(
-                    InvalidType(
-                        "Given value for < %s > is not type < %s >"
-                        % (varname, a_type),
-                        path=self._internal_ctx.field_path[:],
-                        locations=[self._internal_ctx.node.location],
-                    )
-                )
-        except TypeError:
-            # TODO remove this, and handle the case it's an InputValue
-            # (look at registered input values and compare fields)
-            pass
-
-    def _validates_vars(self) -> None:
-        # validate given var are okay
-        name = self._internal_ctx.node.var_name
-        if name not in self._vars:
-            default_values = self._internal_ctx.node.default_value
-            if (
-                default_values is None or default_values is UNDEFINED_VALUE
-            ) and not self._internal_ctx.node.is_nullable:
-                self._add_exception(UnknownVariableException(name))
-                return
-
-            self._vars[name] = default_values
-            return
-
-        a_type = self._internal_ctx.node.var_type
-        is_nullable = self._internal_ctx.node.is_nullable
-        a_value = self._vars[name]
-
-        if self._internal_ctx.node.is_list:
-            if not isinstance(a_value, list):
-                self._add_exception(
-                    InvalidType(
-                        "Expecting List for < %s > values" % name,
-                        path=self._internal_ctx.field_path[:],
-                        locations=[self._internal_ctx.node.location],
-                    )
-                )
-                return
-
-            for val in a_value:
-                self._validate_type(name, val, a_type, is_nullable)
-            return
-
-        self._validate_type(name, a_value, a_type, is_nullable)
-        return
-
     def _on_variable_definition_out(self, *_args, **_kwargs) -> None:
-        self._validates_vars()
-        # now the VariableDefinition Node is useless so kill it
+        # Given variables are validated against the definition at execution
+        self._internal_ctx.operation.add_variable_definition(
+            self._internal_ctx.node
+        )
         self._internal_ctx.node = self._internal_ctx.node.parent
 
     def _on_named_type_in(
@@ -601,6 +595,25 @@ class TartifletteVisitor(Visitor):
             )
             return
 
+        plan = self._get_fragment_plan(cfd)
+        if plan is None:
+            self._replay_fragment(cfd, directives)
+        else:
+            plan.spread(
+                ctx.node,
+                ctx.field_path,
+                ctx.operation,
+                ctx.inline_fragment_info,
+                directives,
+            )
+
+        self._internal_ctx = _ctx
+
+    def _replay_fragment(
+        self,
+        cfd: NodeFragmentDefinition,
+        directives: Optional[List[Dict[str, Any]]],
+    ) -> None:
         depth = self._internal_ctx.depth
         self._internal_ctx.type_condition = cfd.type_condition
 
@@ -616,7 +629,86 @@ class TartifletteVisitor(Visitor):
         self._in_fragment_spread_context = False
 
         self._internal_ctx.type_condition = None
-        self._internal_ctx = _ctx
+
+    def _get_fragment_plan(
+        self, cfd: NodeFragmentDefinition
+    ) -> Optional[FragmentPlan]:
+        # Fragments spread at the root of an operation are replayed
+        if self._internal_ctx.node is None:
+            return None
+
+        # The inline fragment holding the spread, if any, takes part in the
+        # resolution of the directives of the fragment
+        key = (
+            str(self._get_parent_type(self._internal_ctx.node)),
+            self._internal_ctx.inline_fragment_info is not None,
+        )
+        try:
+            return cfd.plans[key]
+        except KeyError:
+            pass
+
+        cfd.plans[key] = None
+        cfd.plans[key] = self._plan_fragment(cfd)
+        return cfd.plans[key]
+
+    def _plan_fragment(
+        self, cfd: NodeFragmentDefinition
+    ) -> Optional[FragmentPlan]:
+        """
+        Replays the fragment once into a detached copy of the field it's
+        spread into, nested spreads included. Fragments raising errors are
+        replayed on each spread so that errors are located at each of them.
+        """
+        ctx = self._internal_ctx
+        state = (self.continue_child, self._error_path, self._to_call_later)
+        nb_exceptions = len(self.exceptions)
+
+        parent = copy(ctx.node)
+        parent.children = []
+        parent.execution_directives = []
+        operation = _OperationUsages(ctx.operation)
+
+        site_ctx = ctx.clone()
+        site_ctx.node = parent
+        site_ctx.operation = operation
+        inline_fragment_info = None
+        if ctx.inline_fragment_info:
+            inline_fragment_info = FragmentData(
+                None, ctx.inline_fragment_info.depth
+            )
+            inline_fragment_info.add_directive(SITE_DIRECTIVES)
+            site_ctx.inline_fragment_info = inline_fragment_info
+
+        self._replay_fragment_at_site(cfd, site_ctx)
+
+        self._internal_ctx = ctx
+        self.continue_child, self._error_path, self._to_call_later = state
+
+        if len(self.exceptions) > nb_exceptions:
+            del self.exceptions[nb_exceptions:]
+            return None
+
+        return FragmentPlan(
+            parent.children,
+            ctx.field_path,
+            operation.variable_usages,
+            parent.execution_directives,
+            inline_fragment_info.directives[1:]
+            if inline_fragment_info
+            else [],
+        )
+
+    def _replay_fragment_at_site(
+        self, cfd: NodeFragmentDefinition, site_ctx: InternalVisitorContext
+    ) -> None:
+        # Replays the fragment & the spreads it contains into the detached
+        # field of `site_ctx`
+        self._to_call_later = []
+        self._internal_ctx = site_ctx
+        self._replay_fragment(cfd, [SPREAD_DIRECTIVES])
+        for saved_callback in self._to_call_later:
+            saved_callback()
 
     def _on_fragment_spread_in(self, _: _VisitorElement, *_args, **_kwargs):
         self._internal_ctx.fragment_spread = FragmentData(None, None)
@@ -682,18 +774,107 @@ class TartifletteVisitor(Visitor):
         self._internal_ctx.inline_fragment_info = None
         self._internal_ctx.type_condition = None
 
-    def _on_document_out(self, *_args, **_kwargs) -> None:
-        for saved_callback in self._to_call_later:
-            saved_callback()
+    def _compute_fragment_size(self, name: str, sizes: Dict[str, int]) -> bool:
+        """
+        Computes the number of fields of a fragment & of the fragments it
+        spreads once all of them are spread. The spreads are walked depth
+        first without recursion so that long chains of fragments can't
+        exceed the recursion limit.
+        :param name: name of the fragment
+        :param sizes: sizes of the fragments already computed, filled in
+        :return: False if a fragment is spread within itself
+        """
+        path = [name]
+        on_path = {name}
+        path_spreads = [None]
+        spreads = [iter(self._fragments[name].spreads)]
+        totals = [self._fragments[name].selection_size]
+
+        while path:
+            for element in spreads[-1]:
+                if element.name in sizes:
+                    totals[-1] += sizes[element.name]
+                elif element.name in on_path:
+                    self._add_fragment_cycle(
+                        element, path_spreads[path.index(element.name) + 1 :]
+                    )
+                    return False
+                elif element.name in self._fragments:
+                    path.append(element.name)
+                    on_path.add(element.name)
+                    path_spreads.append(element)
+                    spreads.append(iter(self._fragments[element.name].spreads))
+                    totals.append(self._fragments[element.name].selection_size)
+                    break
+            else:
+                on_path.discard(path[-1])
+                sizes[path[-1]] = totals.pop()
+                path_spreads.pop()
+                spreads.pop()
+                if totals:
+                    totals[-1] += sizes[path[-1]]
+                path.pop()
+        return True
+
+    def _add_fragment_cycle(
+        self, element: _VisitorElement, cycle_spreads: List[_VisitorElement]
+    ) -> None:
+        """
+        Reports a fragment spread within itself.
+        :param element: the spread closing the cycle
+        :param cycle_spreads: the spreads leading from the fragment to it
+        """
+        self._add_exception(
+            FragmentCycle(
+                "Cannot spread fragment < %s > within itself." % element.name,
+                locations=[spread.get_location() for spread in cycle_spreads]
+                + [element.get_location()],
+            )
+        )
 
-        unused_fragments = set(self._fragments) - self._used_fragments
-        for unused_fragment in unused_fragments:
+    def _check_fragment_expansion(self) -> bool:
+        """
+        Checks, before spreading any fragment, that fragments aren't spread
+        within themselves & that the operations won't have more than
+        `max_expanded_fields` fields once their fragments are spread.
+        :return: whether or not the fragments can be spread
+        """
+        sizes: Dict[str, int] = {}
+        for name in self._fragments:
+            if name not in sizes and not self._compute_fragment_size(
+                name, sizes
+            ):
+                return False
+
+        if self._max_expanded_fields is None:
+            return True
+
+        expanded_fields = self._selections.selection_size + sum(
+            sizes.get(element.name, 0) for element in self._selections.spreads
+        )
+        if expanded_fields > self._max_expanded_fields:
             self._add_exception(
-                UnusedFragment(
-                    "Fragment < %s > is never used." % unused_fragment,
-                    locations=[self._fragments[unused_fragment].location],
+                TooManyExpandedFields(
+                    "Document expands to more than < %d > fields."
+                    % self._max_expanded_fields
                 )
             )
+            return False
+        return True
+
+    def _on_document_out(self, *_args, **_kwargs) -> None:
+        if self._check_fragment_expansion():
+            for saved_callback in self._to_call_later:
+                saved_callback()
+
+            unused_fragments = set(self._fragments) - self._used_fragments
+            for unused_fragment in unused_fragments:
+                self._add_exception(
+                    UnusedFragment(
+                        "Fragment < %s > is never used." % unused_fragment,
+                        locations=[self._fragments[unused_fragment].location],
+                    )
+                )
 
         if self._anonymous_operations and (
             len(self._anonymous_operations) > 1 or self._named_operations
@@ -732,7 +913,7 @@ class TartifletteVisitor(Visitor):
             and not self.continue_child
             and self._error_path
         ):
-            if self._internal_ctx.path.startswith(self._error_path):
+            if self._internal_ctx.is_within(self._error_path):
                 self._internal_ctx.move_in(element)
                 return
             self._reset_error_path_and_continue_child()
@@ -756,7 +937,7 @@ class TartifletteVisitor(Visitor):
             and not self.continue_child
             and self._error_path
         ):
-            if self._internal_ctx.path.startswith(self._error_path):
+            if self._internal_ctx.is_within(self._error_path):
                 self._internal_ctx.move_out()
                 return
             self._reset_error_path_and_continue_child()
@@ -770,10 +951,25 @@ class TartifletteVisitor(Visitor):
         finally:
             self._internal_ctx.move_out()
 
+    def _add_selection(self, element: _VisitorElement) -> None:
+        selections = self._internal_ctx.fragment_definition or self._selections
+        if element.libgraphql_type == "Field":
+            selections.selection_size += 1
+        else:
+            selections.spreads.append(element)
+
     def update(self, event: int, element: _VisitorElement) -> None:
         self.continue_child = 1
         self.event = event
 
+        if event == self.IN and element.libgraphql_type in (
+            "Field",
+            "FragmentSpread",
+        ):
+            # Fragments are only spread once the whole document is visited,
+            # their sizes are computed beforehand from these selections
+            self._add_selection(element)
+
         if (
             not self._internal_ctx.fragment_definition
             or element.libgraphql_type == "FragmentDefinition"
@@ -1,5 +1,7 @@
-from copy import deepcopy
-from typing import Dict, List, Optional
+from itertools import count
+from typing import List, Optional
+
+_NODE_IDS = count(1)
 
 
 def _create_node_name(gql_type: str, name: Optional[str] = None):
@@ -9,6 +11,42 @@ def _create_node_name(gql_type: str, name: Optional[str] = None):
     return node_name
 
 
+class VisitorPath:
+    """
+    Position of the visitor in the document, as a linked list going from the
+    visited node up to the root of the document. Cells are never modified,
+    so cloned contexts share them, and each of them gets its own integer id
+    identifying the visited node.
+    """
+
+    __slots__ = ("parent", "node_id", "depth", "libgraphql_type", "name")
+
+    def __init__(
+        self,
+        parent: Optional["VisitorPath"],
+        libgraphql_type: str,
+        name: Optional[str] = None,
+    ) -> None:
+        self.parent = parent
+        self.node_id = next(_NODE_IDS)
+        self.depth = parent.depth + 1 if parent is not None else 1
+        self.libgraphql_type = libgraphql_type
+        self.name = name
+
+    def __str__(self) -> str:
+        node_names = []
+        path = self
+        while path is not None:
+            node_names.append(
+                _create_node_name(path.libgraphql_type, path.name)
+            )
+            path = path.parent
+        return "".join("/" + node_name for node_name in reversed(node_names))
+
+    def __repr__(self) -> str:
+        return "VisitorPath(%s)" % self
+
+
 class InternalVisitorContext:
     #  pylint: disable=too-many-locals,too-many-instance-attributes
     def __init__(
@@ -21,9 +59,9 @@ class InternalVisitorContext:
         fragment_definition: Optional["NodeFragmentDefinition"] = None,
         inline_fragment_info: Optional["FragmentData"] = None,
         depth: int = 0,
-        path: Optional[str] = None,
+        path: Optional[VisitorPath] = None,
         field_path: Optional[List[str]] = None,
-        fields: Optional[Dict[str, "GraphQLField"]] = None,
+        fields: Optional[List["GraphQLField"]] = None,
     ) -> None:
         # pylint: disable=too-many-arguments
         self._operation = operation
@@ -34,9 +72,10 @@ class InternalVisitorContext:
         self._fragment_definition = fragment_definition
         self._inline_fragment_info = inline_fragment_info
         self._depth = depth
-        self._path = path or ""
+        self._path = path
         self._field_path = field_path or []
-        self._fields = fields or {}
+        # Schema fields of the fields of `field_path`
+        self._fields = fields or []
         self._current_object_value = None
         self._fragment_spread = None
 
@@ -51,8 +90,8 @@ class InternalVisitorContext:
             self._inline_fragment_info,
             self._depth,
             self._path,
-            deepcopy(self._field_path),
-            dict(self._fields),
+            list(self._field_path),
+            list(self._fields),
         )
 
     @property
@@ -132,11 +171,11 @@ class InternalVisitorContext:
         return len(self.field_path)
 
     @property
-    def path(self) -> str:
+    def path(self) -> Optional[VisitorPath]:
         return self._path
 
     @path.setter
-    def path(self, val: str) -> None:
+    def path(self, val: VisitorPath) -> None:
         self._path = val
 
     @property
@@ -147,36 +186,39 @@ class InternalVisitorContext:
     def field_path(self, val: List[str]) -> None:
         self._field_path = val
 
-    @property
-    def _hashed_field_path(self) -> str:
-        return "/".join(self._field_path)
-
     @property
     def current_field(self) -> Optional["GraphQLField"]:
-        try:
-            return self._fields[self._hashed_field_path]
-        except KeyError:
-            pass
-        return None
+        return self._fields[-1] if self._fields else None
+
+    def is_within(self, path: VisitorPath) -> bool:
+        """
+        Whether the visited node is the node of `path` or one of its
+        descendants.
+        """
+        current = self._path
+        while current is not None and current.depth > path.depth:
+            current = current.parent
+        return current is not None and current.node_id == path.node_id
 
     def move_in(self, element: "_VisitorElement") -> None:
-        self._path = self._path + "/%s" % _create_node_name(
-            element.libgraphql_type, element.name
+        self._path = VisitorPath(
+            self._path, element.libgraphql_type, element.name
         )
 
     def move_out(self) -> None:
-        self._path = "/".join(self._path.split("/")[:-1])
+        if self._path is not None:
+            self._path = self._path.parent
 
     def move_in_field(
         self, element: "_VisitorElement", field: "GraphQLField"
     ) -> None:
         self._field_path.append(element.name)
-        self._fields[self._hashed_field_path] = field
+        self._fields.append(field)
 
     def move_out_field(self) -> None:
-        self._fields.pop(self._hashed_field_path, None)
         if self.depth > 0:
             self._field_path.pop()
+            self._fields.pop()
             self.node = self.node.parent
 
     def compute_type_cond(self, type_cond_depth: int) -> Optional[str]:
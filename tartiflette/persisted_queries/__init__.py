@@ -0,0 +1,13 @@
+from .store import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    PersistedQueryStore,
+    compute_query_hash,
+)
+
+__all__ = [
+    "FilePersistedQueryStore",
+    "InMemoryPersistedQueryStore",
+    "PersistedQueryStore",
+    "compute_query_hash",
+]
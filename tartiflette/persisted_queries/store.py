@@ -0,0 +1,101 @@
+import hashlib
+import os
+import re
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from tartiflette.utils.cache import LRUCache
+
+_QUERY_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def compute_query_hash(query: str) -> str:
+    """
+    Computes the hash under which a query is persisted.
+    :param query: the GraphQL query as string
+    :return: the hexadecimal sha256 digest of the UTF-8 encoded query
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryStore(ABC):
+    """
+    Base class of the stores used by the engine to look up the queries sent
+    by their hash. Subclasses have to implement the `get` & `set` coroutines.
+    """
+
+    @abstractmethod
+    async def get(self, query_hash: str) -> Optional[str]:
+        """
+        Returns the query registered under `query_hash`, if any.
+        :param query_hash: the sha256 hash of the query
+        :return: the registered query or None
+        """
+
+    @abstractmethod
+    async def set(self, query_hash: str, query: str) -> None:
+        """
+        Registers `query` under `query_hash`.
+        :param query_hash: the sha256 hash of the query
+        :param query: the query to register
+        """
+
+
+class InMemoryPersistedQueryStore(PersistedQueryStore):
+    """
+    Keeps the persisted queries in a LRU cache, thus only the `maxsize` most
+    recently used queries are kept.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.cache = LRUCache(maxsize)
+
+    async def get(self, query_hash: str) -> Optional[str]:
+        return self.cache.get(query_hash)
+
+    async def set(self, query_hash: str, query: str) -> None:
+        self.cache.set(query_hash, query)
+
+
+class FilePersistedQueryStore(PersistedQueryStore):
+    """
+    Keeps each persisted query in a `<query_hash>.graphql` file of the
+    `directory` directory, so that they survive restarts & can be shared
+    between processes. Queries can also be deployed ahead of time by
+    dropping their files in the directory.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, query_hash: str) -> Optional[str]:
+        # The hash comes from the client, it mustn't be able to target
+        # files outside of the directory.
+        if not _QUERY_HASH_PATTERN.match(query_hash):
+            return None
+        return os.path.join(self.directory, "%s.graphql" % query_hash)
+
+    async def get(self, query_hash: str) -> Optional[str]:
+        path = self._get_path(query_hash)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as query_file:
+                return query_file.read()
+        except FileNotFoundError:
+            return None
+
+    async def set(self, query_hash: str, query: str) -> None:
+        path = self._get_path(query_hash)
+        if path is None or os.path.exists(path):
+            return
+
+        # Writes to a temporary file first so that a concurrent reader never
+        # sees a partially written query.
+        tmp_path = "%s.%d.tmp" % (path, os.getpid())
+        with open(tmp_path, "w", encoding="utf-8") as query_file:
+            query_file.write(query)
+        os.replace(tmp_path, path)
@@ -1,9 +1,15 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+import asyncio
 
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from tartiflette.dataloader import DataLoader
+from tartiflette.executors.deadline import check_deadline, run_until_deadline
 from tartiflette.types.exceptions.tartiflette import SkipExecution
 from tartiflette.types.helpers import wraps_with_directives
 from tartiflette.utils.arguments import coerce_arguments
-from tartiflette.utils.coercer import get_coercer
+from tartiflette.utils.coercer import get_coercer, get_sync_coercer
 
 
 async def _execute_introspection_directives(
@@ -37,13 +43,107 @@ def _shall_return_a_list(field_type: Union[str, "GraphQLType"]) -> bool:
     return False
 
 
+def _list_items_cant_be_null(field_type: Union[str, "GraphQLType"]) -> bool:
+    try:
+        if field_type.is_not_null:
+            field_type = field_type.gql_type
+        return field_type.gql_type.is_not_null
+    except AttributeError:
+        pass
+    return False
+
+
+def _is_coroutine_function(func: Callable) -> bool:
+    while isinstance(func, partial):
+        func = func.func
+    return iscoroutinefunction(func) or iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def _awaitable_resolver(func: Callable) -> Callable:
+    async def func_wrapper(
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Optional[Any]:
+        result = func(parent_result, args, ctx, info)
+        if isawaitable(result):
+            result = await result
+        return result
+
+    return func_wrapper
+
+
+def _executor_resolver(func: Callable) -> Callable:
+    async def func_wrapper(
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Optional[Any]:
+        result = await asyncio.get_event_loop().run_in_executor(
+            None, partial(func, parent_result, args, ctx, info)
+        )
+        if isawaitable(result):
+            result = await result
+        return result
+
+    return func_wrapper
+
+
+def _batch_resolver(func: Callable, run_in_executor: bool) -> Callable:
+    async def load_batch(
+        ctx: Optional[Dict[str, Any]], info: "Info", keys: List[tuple]
+    ) -> List[Any]:
+        parent_results = [parent_result for parent_result, _ in keys]
+        arguments = [args for _, args in keys]
+        if _is_coroutine_function(func):
+            return await func(parent_results, arguments, ctx, info)
+        if run_in_executor:
+            results = await asyncio.get_event_loop().run_in_executor(
+                None, partial(func, parent_results, arguments, ctx, info)
+            )
+        else:
+            results = func(parent_results, arguments, ctx, info)
+        if isawaitable(results):
+            results = await results
+        return results
+
+    async def func_wrapper(
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Optional[Any]:
+        # The parents of a given field of the query resolved during the
+        # same iteration of the event loop are given to a single call
+        batcher = info.execution_ctx.get_dataloader(
+            (func_wrapper, info.query_field),
+            lambda: DataLoader(partial(load_batch, ctx, info), cache=False),
+        )
+        return await batcher.load((parent_result, args))
+
+    return func_wrapper
+
+
 class _ResolverExecutor:
     def __init__(self, func: Callable, schema_field: "GraphQLField") -> None:
         self._raw_func = func
+        self._run_in_executor = False
+        self._batch = False
+        # Set at bake time to the resolver when it's a plain function
+        # called without directives, None otherwise
+        self._sync_func: Optional[Callable] = None
         self._directivated_func = func
         self._schema_field = schema_field
         self._coercer = get_coercer(schema_field)
+        self._sync_coercer: Optional[Callable] = None
         self._shall_produce_list = _shall_return_a_list(schema_field.gql_type)
+        self._items_cant_be_null = _list_items_cant_be_null(
+            schema_field.gql_type
+        )
 
     async def _introspection(self, element: Any, ctx, info) -> Optional[Any]:
         if isinstance(element, list):
@@ -58,6 +158,90 @@ class _ResolverExecutor:
             pass
         return None
 
+    @staticmethod
+    async def _invoke(
+        resolver: Callable,
+        scheduler: Optional["RequestScheduler"],
+        parent_result: Optional[Any],
+        arguments: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Any:
+        if scheduler is None:
+            return await resolver(parent_result, arguments, ctx, info)
+
+        await scheduler.acquire(info)
+        try:
+            return await resolver(parent_result, arguments, ctx, info)
+        finally:
+            scheduler.release()
+
+    @staticmethod
+    async def _await_in_slot(
+        awaitable: Awaitable,
+        scheduler: Optional["RequestScheduler"],
+        info: "Info",
+    ) -> Any:
+        if scheduler is None:
+            return await awaitable
+
+        await scheduler.acquire(info)
+        try:
+            return await awaitable
+        finally:
+            scheduler.release()
+
+    @classmethod
+    async def _await_result(cls, awaitable: Awaitable, info: "Info") -> Any:
+        # Awaits the awaitable returned by a plain function holding a slot
+        # of the scheduler & until the deadline of the execution, as the
+        # coroutine of a resolver would
+        invocation = cls._await_in_slot(
+            awaitable, info.execution_ctx.scheduler, info
+        )
+        if info.execution_ctx.deadline is None:
+            return await invocation
+        return await run_until_deadline(
+            invocation, info.execution_ctx.deadline
+        )
+
+    async def _resolve(
+        self,
+        parent_result: Optional[Any],
+        arguments: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+        execution_directives: Optional[List[Dict[str, Any]]],
+    ) -> Any:
+        # Calls the resolver wrapped with its directives, through the
+        # scheduler & until the deadline of the execution
+        deadline = (
+            info.execution_ctx.deadline
+            if not self.resolves_with_default_resolver
+            else None
+        )
+        resolver = wraps_with_directives(
+            directives_definition=execution_directives,
+            directive_hook="on_field_execution",
+            func=self._directivated_func,
+        )
+        scheduler = info.execution_ctx.scheduler
+        if self.resolves_with_default_resolver or (
+            scheduler is None and deadline is None
+        ):
+            return await resolver(parent_result, arguments, ctx, info)
+
+        if deadline is None:
+            return await self._invoke(
+                resolver, scheduler, parent_result, arguments, ctx, info
+            )
+        return await run_until_deadline(
+            self._invoke(
+                resolver, scheduler, parent_result, arguments, ctx, info
+            ),
+            deadline,
+        )
+
     async def __call__(
         self,
         parent_result: Optional[Any],
@@ -67,20 +251,24 @@ class _ResolverExecutor:
         execution_directives: Optional[List[Dict[str, Any]]],
     ) -> (Any, Any):
         try:
-            resolver = wraps_with_directives(
-                directives_definition=execution_directives,
-                directive_hook="on_field_execution",
-                func=self._directivated_func,
+            arguments = await coerce_arguments(
+                self._schema_field.arguments, args, ctx, info
             )
 
-            result = await resolver(
-                parent_result,
-                await coerce_arguments(
-                    self._schema_field.arguments, args, ctx, info
-                ),
-                ctx,
-                info,
-            )
+            if self._sync_func is not None and not execution_directives:
+                if info.execution_ctx.deadline is not None:
+                    # A plain function can't be cancelled, it's only not
+                    # called once the deadline has expired
+                    check_deadline(info.execution_ctx.deadline)
+                result = self._sync_func(parent_result, arguments, ctx, info)
+                if isawaitable(result):
+                    # e.g. the coroutine of another function, whose result
+                    # is the value of the field
+                    result = await self._await_result(result, info)
+            else:
+                result = await self._resolve(
+                    parent_result, arguments, ctx, info, execution_directives
+                )
 
             if info.execution_ctx.is_introspection:
                 result = await self._introspection(result, ctx, info)
@@ -94,8 +282,15 @@ class _ResolverExecutor:
         except Exception as e:  # pylint: disable=broad-except
             return e, None
 
-    def update_func(self, func: Callable) -> None:
+    def update_func(
+        self,
+        func: Callable,
+        run_in_executor: bool = False,
+        batch: bool = False,
+    ) -> None:
         self._raw_func = func
+        self._run_in_executor = run_in_executor
+        self._batch = batch
 
     def update_coercer(self) -> None:
         self._coercer = get_coercer(self._schema_field)
@@ -111,10 +306,45 @@ class _ResolverExecutor:
         if self._schema_field.subscribe and self._raw_func is default_resolver:
             self._raw_func = default_subscription_resolver(self._raw_func)
 
+        func = self._raw_func
+        self._sync_func = None
+        if self._batch:
+            func = _batch_resolver(func, self._run_in_executor)
+        elif not _is_coroutine_function(func):
+            if self._run_in_executor:
+                func = _executor_resolver(func)
+            else:
+                # Directives expect an awaitable resolver
+                func = _awaitable_resolver(func)
+                if not self._schema_field.directives:
+                    self._sync_func = self._raw_func
+
         self._directivated_func = wraps_with_directives(
             directives_definition=self._schema_field.directives,
             directive_hook="on_field_execution",
-            func=self._raw_func,
+            func=func,
+        )
+
+        # Leaves resolved by the default resolver without arguments don't
+        # need any coroutine to be resolved & coerced
+        self._sync_coercer = (
+            get_sync_coercer(self._schema_field)
+            if self.resolves_with_default_resolver
+            and not self._schema_field.arguments
+            else None
+        )
+
+    def resolve_sync(self, parent_result: Optional[Any]) -> Any:
+        """
+        Resolves & coerces the value of the field synchronously, only
+        available when `resolves_synchronously` is True.
+        :param parent_result: the value of the parent field
+        :return: the coerced value of the field
+        :raises Exception: when the value of the field has to go through the
+        asynchronous execution to produce an error
+        """
+        return self._sync_coercer(
+            _get_field_value(parent_result, self._schema_field.name)
         )
 
     @property
@@ -125,6 +355,15 @@ class _ResolverExecutor:
     def shall_produce_list(self) -> bool:
         return self._shall_produce_list
 
+    @property
+    def resolves_with_default_resolver(self) -> bool:
+        # Neither a custom resolver nor field directives are involved
+        return self._directivated_func is default_resolver
+
+    @property
+    def resolves_synchronously(self) -> bool:
+        return self._sync_coercer is not None
+
     @property
     def cant_be_null(self) -> bool:
         try:
@@ -133,6 +372,10 @@ class _ResolverExecutor:
             pass
         return False
 
+    @property
+    def items_cant_be_null(self) -> bool:
+        return self._items_cant_be_null
+
     @property
     def contains_not_null(self) -> bool:
         try:
@@ -156,24 +399,28 @@ def default_subscription_resolver(func: Callable):
     return func_wrapper
 
 
-async def default_resolver(
-    parent_result: Optional[Any],
-    _args: Dict[str, Any],
-    _ctx: Optional[Dict[str, Any]],
-    info: "Info",
-) -> Optional[Any]:
+def _get_field_value(parent_result: Optional[Any], name: str) -> Optional[Any]:
     try:
-        return getattr(parent_result, info.schema_field.name)
+        return getattr(parent_result, name)
     except AttributeError:
         pass
 
     try:
-        return parent_result[info.schema_field.name]
+        return parent_result[name]
     except (KeyError, TypeError):
         pass
     return None
 
 
+async def default_resolver(
+    parent_result: Optional[Any],
+    _args: Dict[str, Any],
+    _ctx: Optional[Dict[str, Any]],
+    info: "Info",
+) -> Optional[Any]:
+    return _get_field_value(parent_result, info.schema_field.name)
+
+
 def default_error_coercer(exception: Exception, error: dict) -> dict:
     # pylint: disable=unused-argument
     return error
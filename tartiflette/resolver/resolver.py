@@ -1,4 +1,4 @@
-from inspect import iscoroutinefunction
+from inspect import isasyncgenfunction, isgeneratorfunction
 from typing import Callable
 
 from tartiflette.schema.registry import SchemaRegistry
@@ -25,12 +25,39 @@ class Resolver:
         async def field_resolver(parent, arguments, request_ctx, info):
             do your stuff
             return 42
+
+    Resolvers can also be plain functions, which are called directly
+    without creating any coroutine. Those which block can be run in the
+    default executor of the event loop instead of holding it:
+
+        @Resolver("SomeObject.field", run_in_executor=True)
+        def field_resolver(parent, arguments, request_ctx, info):
+            do your blocking stuff
+            return 42
+
+    Batch resolvers are given the list of the parents of the field, and the
+    list of their arguments, resolved during the same iteration of the
+    event loop (e.g. the items of a list), and return their values in the
+    same order:
+
+        @Resolver("SomeObject.field", batch=True)
+        async def field_resolver(parents, arguments, request_ctx, info):
+            do your stuff
+            return [42 for parent in parents]
     """
 
-    def __init__(self, name: str, schema_name: str = "default") -> None:
+    def __init__(
+        self,
+        name: str,
+        schema_name: str = "default",
+        run_in_executor: bool = False,
+        batch: bool = False,
+    ) -> None:
         self._name = name
         self._implementation = None
         self._schema_name = schema_name
+        self._run_in_executor = run_in_executor
+        self._batch = batch
 
     @property
     def name(self) -> str:
@@ -44,18 +71,25 @@ class Resolver:
 
         try:
             field = schema.get_field_by_name(self._name)
-            field.resolver.update_func(self._implementation)
+            field.resolver.update_func(
+                self._implementation,
+                run_in_executor=self._run_in_executor,
+                batch=self._batch,
+            )
         except KeyError:
             raise UnknownFieldDefinition(
                 "Unknown Field Definition %s" % self._name
             )
 
     def __call__(self, resolver: Callable) -> Callable:
-        if not iscoroutinefunction(resolver):
+        if (
+            not callable(resolver)
+            or isasyncgenfunction(resolver)
+            or isgeneratorfunction(resolver)
+        ):
             raise NonAwaitableResolver(
-                "The resolver `{}` given is not awaitable.".format(
-                    repr(resolver)
-                )
+                "The resolver `{}` given is neither a coroutine function "
+                "nor a function.".format(repr(resolver))
             )
 
         SchemaRegistry.register_resolver(self._schema_name, self)
@@ -21,7 +21,9 @@ class SchemaBakery:
         build_graphql_schema_from_sdl(sdl, schema=schema)
 
         SchemaBakery._inject_default_object(
-            schema_name, exclude_builtins_scalars
+            schema_name,
+            exclude_builtins_scalars,
+            schema_info.get("exclude_builtins_directives", []),
         )
 
         for object_ids in _SCHEMA_OBJECT_IDS:
@@ -44,7 +46,9 @@ class SchemaBakery:
 
     @staticmethod
     def _inject_default_object(
-        schema_name: str, exclude_builtins_scalars: Optional[List[str]]
+        schema_name: str,
+        exclude_builtins_scalars: Optional[List[str]],
+        exclude_builtins_directives: List[str],
     ) -> None:
         for name, scalar_implem in CUSTOM_SCALARS.items():
             if (
@@ -55,5 +59,6 @@ class SchemaBakery:
                 deco(scalar_implem)
 
         for name, directive_implem in BUILT_IN_DIRECTIVES.items():
-            deco = Directive(name, schema_name)
-            deco(directive_implem)
+            if name not in exclude_builtins_directives:
+                deco = Directive(name, schema_name)
+                deco(directive_implem)
@@ -1,4 +1,5 @@
 import os
+import re
 
 from glob import glob
 from typing import List, Optional, Union
@@ -20,9 +21,23 @@ _BUILTINS_SCALARS = [
     "Time",
 ]
 
+# Built-in directives which are replaced by the ones defined by the SDL
+_BUILTINS_INCREMENTAL_DIRECTIVES = ["defer", "stream"]
+
+_DIRECTIVE_DEFINITION_RE = re.compile(r"^\s*directive\s+@(\w+)", re.MULTILINE)
+
+
+def _read_sdl_files(sdl_files: List[str]) -> str:
+    sdl = ""
+    for filepath in sdl_files:
+        with open(filepath, "r") as sdl_file:
+            sdl += "\n" + sdl_file.read()
+    return sdl
+
 
 def _get_builtins_sdl_files(
-    exclude_builtins_scalars: Optional[List[str]]
+    exclude_builtins_scalars: Optional[List[str]],
+    exclude_builtins_directives: Optional[List[str]] = None,
 ) -> List[str]:
     return [
         *[
@@ -34,6 +49,14 @@ def _get_builtins_sdl_files(
             )
         ],
         "%s/builtins/directives.sdl" % _DIR_PATH,
+        *[
+            "%s/builtins/incremental/%s.sdl" % (_DIR_PATH, builtin_directive)
+            for builtin_directive in _BUILTINS_INCREMENTAL_DIRECTIVES
+            if (
+                exclude_builtins_directives is None
+                or builtin_directive not in exclude_builtins_directives
+            )
+        ],
         "%s/builtins/introspection.sdl" % _DIR_PATH,
     ]
 
@@ -97,8 +120,7 @@ class SchemaRegistry:
     ) -> None:
         SchemaRegistry._schemas.setdefault(schema_name, {})
 
-        # Maybe read them one and use them a lot :p
-        sdl_files_list = _get_builtins_sdl_files(exclude_builtins_scalars)
+        sdl_files_list = []
 
         full_sdl = ""
 
@@ -113,12 +135,31 @@ class SchemaRegistry:
         else:
             full_sdl = sdl
 
-        # Convert SDL files into big schema and parse it
-        for filepath in sdl_files_list:
-            with open(filepath, "r") as sdl_file:
-                full_sdl += "\n" + sdl_file.read()
+        files_sdl = _read_sdl_files(sdl_files_list)
+
+        # The SDL can define its own `@defer` & `@stream` directives
+        defined_directives = _DIRECTIVE_DEFINITION_RE.findall(
+            full_sdl + files_sdl
+        )
+        exclude_builtins_directives = [
+            builtin_directive
+            for builtin_directive in _BUILTINS_INCREMENTAL_DIRECTIVES
+            if builtin_directive in defined_directives
+        ]
 
-        SchemaRegistry._schemas[schema_name]["sdl"] = full_sdl
+        # Convert SDL files into big schema and parse it
+        SchemaRegistry._schemas[schema_name]["sdl"] = (
+            full_sdl
+            + _read_sdl_files(
+                _get_builtins_sdl_files(
+                    exclude_builtins_scalars, exclude_builtins_directives
+                )
+            )
+            + files_sdl
+        )
+        SchemaRegistry._schemas[schema_name][
+            "exclude_builtins_directives"
+        ] = exclude_builtins_directives
 
     @staticmethod
     def find_schema_info(schema_name: str = "default") -> dict:
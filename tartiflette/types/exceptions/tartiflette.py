@@ -5,6 +5,18 @@ from tartiflette.types.location import Location
 
 
 class TartifletteError(Exception):
+    # Subclasses which don't define `__slots__` store their own attributes
+    # in the `__dict__` of the exception
+    __slots__ = (
+        "message",
+        "user_message",
+        "more_info",
+        "path",
+        "locations",
+        "extensions",
+        "original_error",
+    )
+
     def __init__(
         self,
         message: str,
@@ -171,6 +183,14 @@ class UndefinedFragment(GraphQLError):
     pass
 
 
+class FragmentCycle(GraphQLError):
+    pass
+
+
+class TooManyExpandedFields(GraphQLError):
+    pass
+
+
 class NotALeafType(GraphQLError):
     pass
 
@@ -227,3 +247,36 @@ class UnknownGraphQLType(GraphQLError):
 
 class SkipExecution(Exception):
     pass
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            message="PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class NoQueryProvided(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            message="No query provided",
+            extensions={"code": "NO_QUERY_PROVIDED"},
+        )
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self, query_hash: str) -> None:
+        super().__init__(
+            message="Provided sha256 hash < %s > does not match query"
+            % query_hash,
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+
+class DeadlineExceeded(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            message="Deadline exceeded before the field could be resolved",
+            extensions={"code": "DEADLINE_EXCEEDED"},
+        )
@@ -8,6 +8,7 @@ def _get_callables(implementation):
 
 def transform_directive(directive, args=None):
     return {
+        "name": directive.name,
         "callables": _get_callables(directive.implementation),
         "args": {
             arg_name: directive.arguments[arg_name].default_value
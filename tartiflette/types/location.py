@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 
 class Location:
+    __slots__ = ("line", "column", "line_end", "column_end", "context")
+
     def __init__(
         self,
         line: int,
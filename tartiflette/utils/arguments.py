@@ -69,18 +69,21 @@ async def coerce_arguments(
     ctx: Optional[Dict[str, Any]],
     info: "Info",
 ) -> Dict[str, Any]:
-    results = await asyncio.gather(
-        *[
-            argument_definition.coercer(input_args, ctx, info)
-            for argument_definition in argument_definitions.values()
-        ],
-        return_exceptions=True,
-    )
-
     coerced_arguments = {}
     exceptions = []
 
-    for argument_name, result in zip(argument_definitions, results):
+    # Arguments are coerced one after the other: their coercers hardly ever
+    # suspend, and gathering them would schedule a task per argument & hold
+    # every field with arguments until the next iteration of the event loop
+    for argument_name, argument_definition in argument_definitions.items():
+        try:
+            result = await argument_definition.coercer(input_args, ctx, info)
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            # Subclasses Exception before Python 3.8, mustn't be reported
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            result = e
+
         if isinstance(result, MultipleException):
             exceptions.extend(result.exceptions)
             continue
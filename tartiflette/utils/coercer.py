@@ -251,3 +251,87 @@ def get_coercer(
 
     # Manage directives
     return _add_directive_runner_partial(coercer, reduced_type, schema, way)
+
+
+def _sync_scalar_coercer(func: Callable, val: Optional[Any]) -> Optional[Any]:
+    if val is None:
+        return val
+
+    return func(val)
+
+
+def _sync_enum_coercer(
+    enum_valid_values: List[str], func: Callable, val: Optional[str]
+) -> Optional[str]:
+    if val is None:
+        return val
+
+    if val not in enum_valid_values:
+        raise ValueError(val)
+    return func(val)
+
+
+def _sync_list_coercer(func: Callable, val: Optional[Any]) -> Optional[list]:
+    if val is None:
+        return val
+
+    if isinstance(val, list):
+        return [func(v) for v in val]
+
+    return [func(val)]
+
+
+def _sync_not_null_coercer(func: Callable, val: Optional[Any]) -> Any:
+    if val is None:
+        raise ValueError(val)
+    return func(val)
+
+
+_SYNC_TYPE_COERCERS = {
+    _list_coercer: _sync_list_coercer,
+    _not_null_coercer: _sync_not_null_coercer,
+}
+
+
+def get_sync_coercer(field: "GraphQLField") -> Optional[Callable]:
+    """
+    Synchronous counterpart of `get_coercer` for the output values of the
+    fields of a scalar or enum type without directives. The returned
+    coercer takes only the value to coerce & raises a bare exception on the
+    values the asynchronous coercer rejects, so that they can go through it
+    to produce a proper error.
+    :param field: the field whose output values are coerced
+    :return: the coercer, None if the type of the field has none
+    """
+    schema = field.schema
+    if not schema:
+        return None
+
+    reduced_type = reduce_type(field.gql_type)
+    try:
+        named_type = schema.find_type(reduced_type)
+    except (AttributeError, KeyError):
+        return None
+
+    # Types holding directives have them run on each output value
+    if getattr(named_type, "_directives", None):
+        return None
+
+    enum = schema.find_enum(reduced_type)
+    if enum:
+        if any(getattr(value, "_directives", None) for value in enum.values):
+            return None
+        coercer = partial(
+            _sync_enum_coercer,
+            [x.value for x in enum.values],
+            schema.find_scalar("String").coerce_output,
+        )
+    else:
+        scalar = schema.find_scalar(reduced_type)
+        if not scalar or not scalar.coerce_output:
+            return None
+        coercer = partial(_sync_scalar_coercer, scalar.coerce_output)
+
+    for field_type_coercer in reversed(_get_type_coercers(field.gql_type)):
+        coercer = partial(_SYNC_TYPE_COERCERS[field_type_coercer], coercer)
+    return coercer
@@ -0,0 +1,18 @@
+import json
+
+from typing import Any
+
+_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False
+)
+
+
+def encode_json(response: Any) -> bytes:
+    """
+    Encodes a GraphQL response into a compact UTF-8 JSON body, through a
+    shared encoder (the C one when available) rather than `json.dumps`
+    arguments parsed & an encoder created for each response.
+    :param response: the GraphQL response to encode
+    :return: the JSON body as bytes
+    """
+    return _JSON_ENCODER.encode(response).encode("utf-8")
@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from tartiflette.schema.registry import SchemaRegistry
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.yield_fixture
+def clean_registry():
+    SchemaRegistry._schemas = {}
+    yield SchemaRegistry
+    SchemaRegistry._schemas = {}
+
+
+@pytest.fixture
+def run_async():
+    loop = asyncio.get_event_loop()
+
+    def _run(coroutine_function, *args, **kwargs):
+        return loop.run_until_complete(coroutine_function(*args, **kwargs))
+
+    return _run
@@ -0,0 +1,85 @@
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type Node {
+    id: Int!
+    name: String!
+    children: [Node!]
+}
+
+type Query {
+    tree(depth: Int!, width: Int!): Node
+}
+"""
+
+_QUERY = """
+query Tree($depth: Int!, $width: Int!) {
+    tree(depth: $depth, width: $width) {
+        id name children {
+            id name children {
+                id name children {
+                    id name children {
+                        id name children {
+                            id name children {
+                                id name children {
+                                    id name children {
+                                        id name children { id name }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# (depth, width): ~1100 nodes made of a few very wide levels or of many
+# narrow ones
+_SHAPES = {"wide": (2, 33), "deep": (9, 2)}
+
+
+def _engine(schema_name, executor):
+    @Resolver("Query.tree", schema_name=schema_name)
+    async def resolver_tree(*_args, **_kwargs):
+        return {"id": 0, "depth": 0}
+
+    @Resolver("Node.children", schema_name=schema_name)
+    async def resolver_children(parent, args, ctx, info):
+        depth, width = ctx["shape"]
+        if parent["depth"] >= depth:
+            return None
+        return [
+            {"id": parent["id"] * width + index, "depth": parent["depth"] + 1}
+            for index in range(width)
+        ]
+
+    @Resolver("Node.name", schema_name=schema_name)
+    def resolver_name(parent, *_args, **_kwargs):
+        return "Node %d" % parent["id"]
+
+    return Engine(_SDL, schema_name=schema_name, executor=executor)
+
+
+@pytest.mark.parametrize("shape", ["wide", "deep"])
+@pytest.mark.parametrize("executor", ["basic", "breadth_first"])
+def test_benchmark_executors(
+    benchmark, clean_registry, run_async, executor, shape
+):
+    engine = _engine("benchmark_executors", executor)
+    prepared = engine.prepare(_QUERY)
+    depth, width = _SHAPES[shape]
+
+    result = benchmark(
+        run_async,
+        prepared.execute,
+        context={"shape": (depth, width)},
+        variables={"depth": depth, "width": width},
+    )
+
+    assert "errors" not in result
+    assert len(result["data"]["tree"]["children"]) == width
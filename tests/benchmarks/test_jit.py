@@ -0,0 +1,88 @@
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type Author {
+    id: ID!
+    name: String!
+    email: String
+}
+
+type Comment {
+    id: ID!
+    body: String!
+    author: Author!
+}
+
+type Post {
+    id: ID!
+    title: String!
+    body: String
+    views: Int!
+    tags: [String!]
+    author: Author!
+    comments: [Comment!]!
+}
+
+type Query {
+    posts: [Post!]!
+}
+"""
+
+_QUERY = """
+query Posts {
+    posts {
+        id
+        title
+        body
+        views
+        tags
+        author { id name email }
+        comments { id body author { id name } }
+    }
+}
+"""
+
+_POSTS = [
+    {
+        "id": str(post_id),
+        "title": "Post %d" % post_id,
+        "body": "Body of the post %d" % post_id,
+        "views": post_id * 10,
+        "tags": ["graphql", "python"],
+        "author": {"id": "1", "name": "Author", "email": None},
+        "comments": [
+            {
+                "id": "%d-%d" % (post_id, comment_id),
+                "body": "Comment %d" % comment_id,
+                "author": {"id": "2", "name": "Commenter"},
+            }
+            for comment_id in range(10)
+        ],
+    }
+    for post_id in range(100)
+]
+
+
+def _engine(schema_name, jit_threshold):
+    @Resolver("Query.posts", schema_name=schema_name)
+    async def resolver_posts(*_args, **_kwargs):
+        return _POSTS
+
+    return Engine(_SDL, schema_name=schema_name, jit_threshold=jit_threshold)
+
+
+@pytest.mark.parametrize(
+    "jit_threshold", [None, 0], ids=["interpreter", "compiled"]
+)
+def test_benchmark_jit_execute(
+    benchmark, clean_registry, run_async, jit_threshold
+):
+    engine = _engine("benchmark_jit", jit_threshold)
+    prepared = engine.prepare(_QUERY)
+
+    result = benchmark(run_async, prepared.execute)
+
+    assert "errors" not in result
+    assert len(result["data"]["posts"]) == 100
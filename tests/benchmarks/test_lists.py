@@ -0,0 +1,44 @@
+from tartiflette import Engine, Resolver
+
+_FIELDS = ["field%d" % index for index in range(20)]
+
+_SDL = """
+type Item {
+    %s
+}
+
+type Query {
+    items: [Item]
+}
+""" % "\n    ".join(
+    "%s: Int" % field for field in _FIELDS
+)
+
+_QUERY = "query Items { items { %s } }" % " ".join(_FIELDS)
+
+_ITEMS = [{"value": index} for index in range(1000)]
+
+
+async def _resolver_item_field(parent, *_args, **_kwargs):
+    return parent["value"]
+
+
+def test_benchmark_lists_execute(benchmark, clean_registry, run_async):
+    # Fields resolved by a custom resolver, which doesn't suspend, on each
+    # item of a list
+    for field in _FIELDS:
+        Resolver("Item.%s" % field, schema_name="benchmark_lists")(
+            _resolver_item_field
+        )
+
+    @Resolver("Query.items", schema_name="benchmark_lists")
+    async def resolver_items(*_args, **_kwargs):
+        return _ITEMS
+
+    engine = Engine(_SDL, schema_name="benchmark_lists")
+    prepared = engine.prepare(_QUERY)
+
+    result = benchmark(run_async, prepared.execute)
+
+    assert "errors" not in result
+    assert len(result["data"]["items"]) == 1000
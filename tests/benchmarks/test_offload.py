@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from itertools import count
+
+import pytest
+
+from tartiflette import Engine
+
+_SDL = """
+type Book {
+    id: ID!
+    title: String!
+}
+
+type Author {
+    id: ID!
+    name: String!
+    books: [Book!]!
+}
+
+type Query {
+    author: Author
+}
+"""
+
+_SMALL_QUERY = "{ author { id name } }"
+
+_LARGE_QUERY_INDEXES = count()
+
+
+def _large_query(index):
+    # About 200 KB, distinct from each other so that each of them is parsed
+    return "query Large%d { %s }" % (
+        index,
+        " ".join(
+            "author%d: author { id name books { id title } }" % field
+            for field in range(4000)
+        ),
+    )
+
+
+async def _small_queries_latencies(engine, nb_large_queries):
+    latencies = []
+    large_queries = asyncio.gather(
+        *[
+            engine.execute(_large_query(next(_LARGE_QUERY_INDEXES)))
+            for _ in range(nb_large_queries)
+        ]
+    )
+
+    while not large_queries.done():
+        start = time.perf_counter()
+        await engine.execute(_SMALL_QUERY)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0)
+
+    # The large queries have to be planned & executed, not rejected
+    assert not any("errors" in result for result in await large_queries)
+    return latencies
+
+
+@pytest.mark.parametrize(
+    "offload_parsing_threshold", [None, 10000], ids=["event-loop", "offloaded"]
+)
+def test_benchmark_offload_small_queries_p99(
+    benchmark, clean_registry, run_async, offload_parsing_threshold
+):
+    engine = Engine(
+        _SDL,
+        schema_name="benchmark_offload",
+        max_expanded_fields=None,
+        offload_parsing_threshold=offload_parsing_threshold,
+    )
+
+    latencies = []
+
+    def _run():
+        latencies.extend(run_async(_small_queries_latencies, engine, 2))
+
+    benchmark.pedantic(_run, rounds=3, iterations=1)
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    benchmark.extra_info["small_queries"] = len(latencies)
+    benchmark.extra_info["small_queries_p99_ms"] = p99 * 1000
+    benchmark.extra_info["small_queries_max_ms"] = latencies[-1] * 1000
@@ -0,0 +1,160 @@
+import pytest
+
+from tartiflette import Engine
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+
+_SDL = """
+enum Sort { ASC DESC }
+
+input Filter {
+    ids: [ID!]
+    name: String
+    sort: Sort = ASC
+}
+
+type Author {
+    id: ID!
+    name(upper: Boolean = false): String!
+    books(filter: Filter, first: Int = 10): [Book!]!
+}
+
+type Book {
+    id: ID!
+    title: String!
+    year: Int
+    author: Author!
+}
+
+type Query {
+    authors(filter: Filter, first: Int): [Author!]!
+    book(id: ID!): Book
+}
+"""
+
+_FRAGMENT = """
+fragment BookFields on Book {
+    id
+    title
+    year
+    author { id name(upper: true) }
+}
+"""
+
+_FIELD = """
+    authors%(index)d: authors(
+        filter: {ids: ["1", "2", "3"], name: "Author %(index)d", sort: DESC}
+        first: %(index)d
+    ) {
+        id
+        name @include(if: $withNames)
+        books(filter: {sort: ASC}, first: 5) {
+            ...BookFields
+            ... on Book { author { books { id title } } }
+        }
+    }
+"""
+
+_LARGE_QUERY = (
+    "query Large($withNames: Boolean = true) {%s}"
+    % "".join(_FIELD % {"index": index} for index in range(50))
+    + _FRAGMENT
+)
+
+_FRAGMENTS_QUERY = (
+    "query Fragments {%s}"
+    % "".join(
+        "authors%d: authors(first: %d) { ...AuthorFields }" % (index, index)
+        for index in range(50)
+    )
+    + """
+fragment AuthorFields on Author {
+    id
+    name(upper: true)
+    books(filter: {sort: DESC}, first: 3) {
+        ...BookFields
+        author { id name books { id title year } }
+    }
+}
+"""
+    + _FRAGMENT
+)
+
+
+def _tartify_document(engine, query):
+    return engine._parser.tartify_document(
+        engine._schema,
+        parse_to_document(query, experimental_schema_support=False),
+    )
+
+
+def test_benchmark_parser_large_query(benchmark, clean_registry):
+    engine = Engine(_SDL, schema_name="benchmark_parser")
+
+    operations, errors = benchmark(_tartify_document, engine, _LARGE_QUERY)
+
+    assert errors is None
+    assert len(operations["Large"].children) == 50
+
+
+@pytest.mark.parametrize("planned", [False, True], ids=["replayed", "planned"])
+def test_benchmark_parser_fragment_spreads(
+    benchmark, clean_registry, monkeypatch, planned
+):
+    from tartiflette.parser.visitor import TartifletteVisitor
+
+    if not planned:
+        monkeypatch.setattr(
+            TartifletteVisitor, "_get_fragment_plan", lambda *_args: None
+        )
+
+    engine = Engine(_SDL, schema_name="benchmark_parser")
+
+    operations, errors = benchmark(
+        engine._parser.parse_and_tartify, engine._schema, _FRAGMENTS_QUERY
+    )
+
+    assert errors is None
+    assert len(operations["Fragments"].children) == 50
+
+
+def _deep_fragments(depth):
+    # Each level of authors & books is selected through its own fragment
+    return "".join(
+        """
+fragment DeepAuthor%(level)d on Author {
+    id
+    name(upper: true)
+    books(filter: {sort: ASC}, first: %(level)d) { ...DeepBook%(level)d }
+}
+
+fragment DeepBook%(level)d on Book {
+    id
+    title
+    author { %(next)s }
+}
+"""
+        % {
+            "level": level,
+            "next": "...DeepAuthor%d" % (level + 1)
+            if level + 1 < depth
+            else "id",
+        }
+        for level in range(depth)
+    )
+
+
+_DEEP_QUERY = "query Deep {%s}" % "".join(
+    "authors%d: authors(first: %d) { ...DeepAuthor0 }" % (index, index)
+    for index in range(20)
+) + _deep_fragments(15)
+
+
+def test_benchmark_parser_deep_fragments(benchmark, clean_registry):
+    engine = Engine(_SDL, schema_name="benchmark_parser")
+
+    operations, errors = benchmark(
+        engine._parser.parse_and_tartify, engine._schema, _DEEP_QUERY
+    )
+
+    assert errors is None
+    assert len(operations["Deep"].children) == 20
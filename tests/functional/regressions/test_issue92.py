@@ -225,6 +225,75 @@ async def test_issue92_fragment_inordered():
                             }
                         ],
                     },
+                    {
+                        "name": "defer",
+                        "locations": ["FRAGMENT_SPREAD", "INLINE_FRAGMENT"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "defaultValue": None,
+                                "type": {
+                                    "kind": "SCALAR",
+                                    "name": "String",
+                                    "ofType": None,
+                                },
+                            },
+                            {
+                                "name": "if",
+                                "defaultValue": "True",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Boolean",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                        ],
+                    },
+                    {
+                        "name": "stream",
+                        "locations": ["FIELD"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "defaultValue": None,
+                                "type": {
+                                    "kind": "SCALAR",
+                                    "name": "String",
+                                    "ofType": None,
+                                },
+                            },
+                            {
+                                "name": "initialCount",
+                                "defaultValue": "0",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Int",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                            {
+                                "name": "if",
+                                "defaultValue": "True",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Boolean",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                        ],
+                    },
                 ],
                 "queryType": {"name": "Query"},
                 "mutationType": {"name": "Mutation"},
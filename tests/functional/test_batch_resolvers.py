@@ -0,0 +1,113 @@
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type User {
+    id: Int!
+    name: String!
+}
+
+type Post {
+    id: Int!
+    author(suffix: String = ""): User
+    comments: [Post]
+}
+
+type Query {
+    posts: [Post]
+}
+"""
+
+_QUERY = """
+query {
+    posts {
+        id
+        author(suffix: "!") { name }
+        comments { id author { name } }
+    }
+}
+"""
+
+
+def _build_engine(schema_name, executor, calls):
+    @Resolver("Query.posts", schema_name=schema_name)
+    async def resolver_query_posts(*_, **__):
+        return [
+            {
+                "id": post_id,
+                "comments": [
+                    {"id": post_id * 10 + comment_id}
+                    for comment_id in range(2)
+                ],
+            }
+            for post_id in range(1, 4)
+        ]
+
+    @Resolver("Post.author", schema_name=schema_name, batch=True)
+    async def resolver_post_author(parents, args, _ctx, _info):
+        calls.append([parent["id"] for parent in parents])
+        return [
+            {
+                "id": parent["id"],
+                "name": "User %d%s" % (parent["id"], arg.get("suffix", "")),
+            }
+            if parent["id"] != 2
+            else Exception("No author")
+            for parent, arg in zip(parents, args)
+        ]
+
+    return Engine(_SDL, schema_name=schema_name, executor=executor)
+
+
+@pytest.mark.parametrize("executor", ["basic", "breadth_first"])
+@pytest.mark.asyncio
+async def test_batch_resolvers(executor):
+    calls = []
+    engine = _build_engine(
+        "test_batch_resolvers_%s" % executor, executor, calls
+    )
+
+    result = await engine.execute(_QUERY)
+
+    assert result["data"] == {
+        "posts": [
+            {
+                "id": 1,
+                "author": {"name": "User 1!"},
+                "comments": [
+                    {"id": 10, "author": {"name": "User 10"}},
+                    {"id": 11, "author": {"name": "User 11"}},
+                ],
+            },
+            {
+                "id": 2,
+                "author": None,
+                "comments": [
+                    {"id": 20, "author": {"name": "User 20"}},
+                    {"id": 21, "author": {"name": "User 21"}},
+                ],
+            },
+            {
+                "id": 3,
+                "author": {"name": "User 3!"},
+                "comments": [
+                    {"id": 30, "author": {"name": "User 30"}},
+                    {"id": 31, "author": {"name": "User 31"}},
+                ],
+            },
+        ]
+    }
+    assert result["errors"] == [
+        {
+            "message": "No author",
+            "path": ["posts", "author"],
+            "locations": [{"line": 5, "column": 9}],
+        }
+    ]
+    # One call per field of the query resolved during the same iteration of
+    # the event loop
+    assert sorted(sorted(call) for call in calls) == [
+        [1, 2, 3],
+        [10, 11, 20, 21, 30, 31],
+    ]
@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Engine, Resolver
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type C {
+    v: String!
+}
+
+type B {
+    c: C!
+    other: String
+}
+
+type A {
+    b: B!
+}
+
+type Node {
+    id: Int!
+    depth: Int!
+    children: [Node]
+}
+
+type Query {
+    a: A
+    tree(depth: Int!, width: Int!): Node
+}
+
+type Mutation {
+    step(id: Int!): Int!
+}
+"""
+
+_QUERY = """
+query {
+    a { b { other c { v } } }
+    tree(depth: 3, width: 3) {
+        id depth children { id depth children { id depth children { id } } }
+    }
+}
+"""
+
+
+def _build_engine(schema_name, calls, **kwargs):
+    @Resolver("C.v", schema_name=schema_name)
+    async def resolver_c_v(parent, *_, **__):
+        calls.append(("C.v", None))
+        if parent.get("fail"):
+            raise Exception("boom")
+        return parent["v"]
+
+    @Resolver("Query.tree", schema_name=schema_name)
+    async def resolver_query_tree(_parent, args, *_, **__):
+        def build(node_id, depth):
+            return {
+                "id": node_id,
+                "depth": depth,
+                "children": [
+                    build(node_id * args["width"] + index, depth + 1)
+                    for index in range(args["width"])
+                ]
+                if depth < args["depth"]
+                else None,
+            }
+
+        return build(1, 0)
+
+    @Resolver("Node.children", schema_name=schema_name)
+    async def resolver_node_children(parent, *_, **__):
+        calls.append(("Node.children", parent["depth"]))
+        await asyncio.sleep(0)
+        return parent["children"]
+
+    @Resolver("Mutation.step", schema_name=schema_name)
+    async def resolver_mutation_step(_parent, args, *_, **__):
+        calls.append(("Mutation.step", args["id"]))
+        await asyncio.sleep(0.01 * (3 - args["id"]))
+        calls.append(("Mutation.step", args["id"]))
+        return args["id"]
+
+    return Engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_executor_same_result_as_basic():
+    basic_calls = []
+    breadth_first_calls = []
+    basic = _build_engine("test_breadth_first_executor_basic", basic_calls)
+    breadth_first = _build_engine(
+        "test_breadth_first_executor",
+        breadth_first_calls,
+        executor="breadth_first",
+    )
+
+    initial_value = {"a": {"b": {"other": "o", "c": {"fail": True}}}}
+
+    expected = await basic.execute(_QUERY, initial_value=initial_value)
+    result = await breadth_first.execute(_QUERY, initial_value=initial_value)
+
+    assert result == expected
+    assert result["data"]["a"] is None
+    assert result["errors"] == [
+        {
+            "message": "boom",
+            "path": ["a", "b", "c", "v"],
+            "locations": [{"line": 3, "column": 23}],
+        }
+    ]
+    assert len(result["data"]["tree"]["children"]) == 3
+    assert sorted(breadth_first_calls) == sorted(basic_calls)
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_executor_level_after_level():
+    calls = []
+    engine = _build_engine(
+        "test_breadth_first_executor_levels", calls, executor="breadth_first"
+    )
+
+    result = await engine.execute(
+        "query { tree(depth: 2, width: 2) "
+        "{ children { children { children { id } } } } }"
+    )
+
+    assert "errors" not in result
+    # All the fields of a level are resolved before the next level starts
+    assert [depth for _, depth in calls] == [0, 1, 1, 2, 2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_executor_mutation_serial():
+    calls = []
+    engine = _build_engine(
+        "test_breadth_first_executor_mutation", calls, executor="breadth_first"
+    )
+
+    assert await engine.execute(
+        "mutation { first: step(id: 1) second: step(id: 2) }"
+    ) == {"data": {"first": 1, "second": 2}}
+    assert calls == [
+        ("Mutation.step", 1),
+        ("Mutation.step", 1),
+        ("Mutation.step", 2),
+        ("Mutation.step", 2),
+    ]
+
+
+def test_breadth_first_executor_unknown_executor():
+    with pytest.raises(ImproperlyConfigured, match="Unknown executor"):
+        Engine(
+            _SDL,
+            schema_name="test_breadth_first_executor_unknown",
+            executor="depth_first",
+        )
@@ -0,0 +1,74 @@
+import pytest
+
+from tartiflette import Engine, Resolver
+from tartiflette.dataloader import DataLoader
+
+_SDL = """
+type User {
+    id: Int!
+    name: String!
+}
+
+type Post {
+    id: Int!
+    author: User
+}
+
+type Query {
+    posts: [Post]
+}
+"""
+
+_BATCHES = []
+
+
+class UserLoader(DataLoader):
+    async def batch_load(self, keys):
+        _BATCHES.append(keys)
+        return [
+            {"id": key, "name": "User %d" % key}
+            if key
+            else LookupError("Unknown user")
+            for key in keys
+        ]
+
+
+def _build_engine(schema_name, executor):
+    @Resolver("Query.posts", schema_name=schema_name)
+    async def resolver_query_posts(*_, **__):
+        return [
+            {"id": post_id, "author_id": post_id % 3}
+            for post_id in range(1, 7)
+        ]
+
+    @Resolver("Post.author", schema_name=schema_name)
+    async def resolver_post_author(parent, _args, _ctx, info):
+        return await UserLoader.from_info(info).load(parent["author_id"])
+
+    return Engine(_SDL, schema_name=schema_name, executor=executor)
+
+
+@pytest.mark.parametrize("executor", ["basic", "breadth_first"])
+@pytest.mark.asyncio
+async def test_dataloader_batches_fields_of_a_list(executor):
+    engine = _build_engine("test_dataloader_%s" % executor, executor)
+    query = "query { posts { id author { name } } }"
+
+    for _ in range(2):
+        del _BATCHES[:]
+
+        result = await engine.execute(query)
+
+        assert [post["author"] for post in result["data"]["posts"]] == [
+            {"name": "User 1"},
+            {"name": "User 2"},
+            None,
+            {"name": "User 1"},
+            {"name": "User 2"},
+            None,
+        ]
+        assert len(result["errors"]) == 2
+        assert result["errors"][0]["message"] == "Unknown user"
+        # One batch per execution: the cache doesn't outlive the request
+        assert len(_BATCHES) == 1
+        assert sorted(_BATCHES[0]) == [0, 1, 2]
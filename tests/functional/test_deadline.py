@@ -0,0 +1,207 @@
+import asyncio
+import time
+
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type Item {
+    id: Int!
+    slow: String
+    blocking: String!
+}
+
+type Query {
+    fast: String
+    slow: String
+    remaining: Float
+    rows: [Item]
+}
+"""
+
+_ERROR = {
+    "message": "Deadline exceeded before the field could be resolved",
+    "extensions": {"code": "DEADLINE_EXCEEDED"},
+}
+
+
+def _build_engine(schema_name, cancelled):
+    @Resolver("Query.fast", schema_name=schema_name)
+    async def resolver_query_fast(*_, **__):
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    async def resolver_query_slow(*_, **__):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return "slow"
+
+    @Resolver("Query.remaining", schema_name=schema_name)
+    async def resolver_query_remaining(parent, args, ctx, info):
+        return info.execution_ctx.time_remaining()
+
+    @Resolver("Query.rows", schema_name=schema_name)
+    async def resolver_query_rows(*_, **__):
+        return [{"id": i} for i in range(3)]
+
+    @Resolver("Item.slow", schema_name=schema_name)
+    async def resolver_item_slow(parent, *_, **__):
+        await asyncio.sleep(0 if parent["id"] == 0 else 10)
+        return "slow%d" % parent["id"]
+
+    @Resolver("Item.blocking", schema_name=schema_name)
+    def resolver_item_blocking(parent, *_, **__):
+        time.sleep(0.1)
+        return "blocking%d" % parent["id"]
+
+    return Engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_deadline_partial_data():
+    cancelled = []
+    engine = _build_engine("test_deadline_partial_data", cancelled)
+
+    started = time.monotonic()
+    result = await engine.execute(
+        "query { fast slow rows { id slow } }", timeout=0.1
+    )
+
+    assert time.monotonic() - started < 5
+    assert cancelled == ["slow"]
+    assert result["data"] == {
+        "fast": "fast",
+        "slow": None,
+        "rows": [
+            {"id": 0, "slow": "slow0"},
+            {"id": 1, "slow": None},
+            {"id": 2, "slow": None},
+        ],
+    }
+    assert sorted(
+        (error["path"], error["locations"]) for error in result["errors"]
+    ) == [
+        (["rows", "slow"], [{"line": 1, "column": 29}]),
+        (["rows", "slow"], [{"line": 1, "column": 29}]),
+        (["slow"], [{"line": 1, "column": 14}]),
+    ]
+    for error in result["errors"]:
+        assert {
+            "message": error["message"],
+            "extensions": error["extensions"],
+        } == _ERROR
+
+
+@pytest.mark.asyncio
+async def test_deadline_plain_function_not_called_once_expired():
+    engine = _build_engine(
+        "test_deadline_plain_function_not_called_once_expired", []
+    )
+
+    result = await engine.execute(
+        "query { rows { id blocking } }", timeout=0.15
+    )
+
+    # The second call blocks until the deadline, the third one isn't made
+    # & its non-null field nulls its item
+    assert result == {
+        "data": {
+            "rows": [
+                {"id": 0, "blocking": "blocking0"},
+                {"id": 1, "blocking": "blocking1"},
+                None,
+            ]
+        },
+        "errors": [
+            {
+                "path": ["rows", "blocking"],
+                "locations": [{"line": 1, "column": 19}],
+                **_ERROR,
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_deadline_plain_function_awaitable():
+    cancelled = []
+    schema_name = "test_deadline_plain_function_awaitable"
+
+    async def fetch_slow():
+        try:
+            await asyncio.sleep(2)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return "slow"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    def resolver_query_slow(*_, **__):
+        # The coroutine returned is cancelled by the deadline
+        return fetch_slow()
+
+    engine = Engine(_SDL, schema_name=schema_name)
+
+    started = time.monotonic()
+    result = await engine.execute("query { slow }", timeout=0.1)
+
+    assert time.monotonic() - started < 1
+    assert cancelled == ["slow"]
+    assert result == {
+        "data": {"slow": None},
+        "errors": [
+            {
+                "path": ["slow"],
+                "locations": [{"line": 1, "column": 9}],
+                **_ERROR,
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_deadline_time_remaining():
+    engine = _build_engine("test_deadline_time_remaining", [])
+
+    result = await engine.execute("query { remaining }", timeout=10)
+    assert 0 < result["data"]["remaining"] <= 10
+
+    assert await engine.execute("query { remaining }") == {
+        "data": {"remaining": None}
+    }
+
+
+@pytest.mark.asyncio
+async def test_deadline_incremental():
+    engine = _build_engine("test_deadline_incremental", [])
+
+    payloads = [
+        payload
+        async for payload in engine.execute_incremental(
+            "query { fast ... @defer { slow } }", timeout=0.05
+        )
+    ]
+
+    assert payloads == [
+        {"data": {"fast": "fast"}, "hasNext": True},
+        {
+            "incremental": [
+                {
+                    "data": {"slow": None},
+                    "path": [],
+                    "errors": [
+                        {
+                            "path": ["slow"],
+                            "locations": [{"line": 1, "column": 27}],
+                            **_ERROR,
+                        }
+                    ],
+                }
+            ],
+            "hasNext": False,
+        },
+    ]
@@ -0,0 +1,345 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Directive, Engine, Resolver
+
+_SDL = """
+type Recommendation {
+    id: Int!
+    title: String!
+}
+
+type Product {
+    id: Int!
+    name: String
+    reviews: [String]
+    recommendations: [Recommendation]
+    slow: String!
+}
+
+type Query {
+    product(id: Int!): Product
+    products: [Product]
+    hello: String
+}
+"""
+
+
+def _build_engine(schema_name):
+    @Resolver("Query.product", schema_name=schema_name)
+    async def resolver_query_product(parent, args, *_, **__):
+        return {"id": args["id"], "name": "p", "reviews": ["a", "b", "c"]}
+
+    @Resolver("Query.products", schema_name=schema_name)
+    async def resolver_query_products(parent, args, *_, **__):
+        return [{"id": i, "name": "p%d" % i, "reviews": []} for i in range(4)]
+
+    @Resolver("Product.recommendations", schema_name=schema_name)
+    async def resolver_product_recommendations(parent, *_, **__):
+        await asyncio.sleep(0.01)
+        return [{"id": i, "title": "r%d" % i} for i in range(2)]
+
+    @Resolver("Product.slow", schema_name=schema_name)
+    async def resolver_product_slow(parent, *_, **__):
+        await asyncio.sleep(0)
+        if parent["id"] == 2:
+            raise Exception("boom")
+        return "slow%d" % parent["id"]
+
+    return Engine(_SDL, schema_name=schema_name)
+
+
+async def _payloads(engine, query, **kwargs):
+    return [
+        payload
+        async for payload in engine.execute_incremental(
+            query, initial_value={"hello": "world"}, **kwargs
+        )
+    ]
+
+
+def _incremental(payloads):
+    return sorted(
+        (
+            record
+            for payload in payloads[1:]
+            for record in payload["incremental"]
+        ),
+        key=lambda record: (
+            [str(key) for key in record["path"]],
+            "items" not in record,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_defer():
+    engine = _build_engine("test_incremental_defer")
+
+    payloads = await _payloads(
+        engine,
+        """
+        query {
+            product(id: 1) {
+                id
+                ... @defer(label: "more") {
+                    recommendations { id title }
+                    slow
+                }
+            }
+        }
+        """,
+    )
+
+    assert payloads == [
+        {"data": {"product": {"id": 1}}, "hasNext": True},
+        {
+            "incremental": [
+                {
+                    "data": {
+                        "recommendations": [
+                            {"id": 0, "title": "r0"},
+                            {"id": 1, "title": "r1"},
+                        ],
+                        "slow": "slow1",
+                    },
+                    "path": ["product"],
+                    "label": "more",
+                }
+            ],
+            "hasNext": False,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_defer_fragment_spread_at_root():
+    engine = _build_engine("test_incremental_defer_fragment_spread_at_root")
+
+    payloads = await _payloads(
+        engine,
+        """
+        query {
+            hello
+            ...ProductFragment @defer
+        }
+
+        fragment ProductFragment on Query {
+            product(id: 3) { id }
+        }
+        """,
+    )
+
+    assert payloads == [
+        {"data": {"hello": "world"}, "hasNext": True},
+        {
+            "incremental": [{"data": {"product": {"id": 3}}, "path": []}],
+            "hasNext": False,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_defer_error():
+    engine = _build_engine("test_incremental_defer_error")
+
+    payloads = await _payloads(
+        engine, "query { product(id: 2) { id ... @defer { slow } } }"
+    )
+
+    # The non-null field nulls the deferred fragment, not the initial data
+    assert payloads == [
+        {"data": {"product": {"id": 2}}, "hasNext": True},
+        {
+            "incremental": [
+                {
+                    "data": None,
+                    "path": ["product"],
+                    "errors": [
+                        {
+                            "message": "boom",
+                            "path": ["product", "slow"],
+                            "locations": [{"line": 1, "column": 42}],
+                        }
+                    ],
+                }
+            ],
+            "hasNext": False,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "variables,expected",
+    [
+        (
+            {"defer": False},
+            [{"data": {"product": {"id": 1, "slow": "slow1"}}}],
+        ),
+        (
+            {"defer": True},
+            [
+                {"data": {"product": {"id": 1}}, "hasNext": True},
+                {
+                    "incremental": [
+                        {"data": {"slow": "slow1"}, "path": ["product"]}
+                    ],
+                    "hasNext": False,
+                },
+            ],
+        ),
+    ],
+)
+async def test_incremental_defer_if(variables, expected):
+    engine = _build_engine("test_incremental_defer_if_%s" % variables["defer"])
+
+    payloads = await _payloads(
+        engine,
+        """
+        query ($defer: Boolean!) {
+            product(id: 1) { id ... @defer(if: $defer) { slow } }
+        }
+        """,
+        variables=variables,
+    )
+
+    assert payloads == expected
+
+
+@pytest.mark.asyncio
+async def test_incremental_stream():
+    engine = _build_engine("test_incremental_stream")
+
+    payloads = await _payloads(
+        engine, "query { product(id: 1) { reviews @stream(initialCount: 1) } }"
+    )
+
+    assert payloads[0] == {
+        "data": {"product": {"reviews": ["a"]}},
+        "hasNext": True,
+    }
+    assert payloads[-1]["hasNext"] is False
+    # The items are always sent in the order of the list
+    assert [
+        record for payload in payloads[1:] for record in payload["incremental"]
+    ] == [
+        {"items": ["b"], "path": ["product", "reviews", 1]},
+        {"items": ["c"], "path": ["product", "reviews", 2]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_stream_with_nested_defer():
+    engine = _build_engine("test_incremental_stream_with_nested_defer")
+
+    payloads = await _payloads(
+        engine,
+        """
+        query {
+            products @stream(initialCount: 2, label: "products") {
+                id
+                ... @defer { slow }
+            }
+            hello
+        }
+        """,
+    )
+
+    assert payloads[0] == {
+        "data": {"products": [{"id": 0}, {"id": 1}], "hello": "world"},
+        "hasNext": True,
+    }
+    assert payloads[-1]["hasNext"] is False
+    assert _incremental(payloads) == [
+        {"data": {"slow": "slow0"}, "path": ["products", 0]},
+        {"data": {"slow": "slow1"}, "path": ["products", 1]},
+        {"items": [{"id": 2}], "path": ["products", 2], "label": "products"},
+        {
+            "data": None,
+            "path": ["products", 2],
+            "errors": [
+                {
+                    "message": "boom",
+                    "path": ["products", "slow"],
+                    "locations": [{"line": 5, "column": 30}],
+                }
+            ],
+        },
+        {"items": [{"id": 3}], "path": ["products", 3], "label": "products"},
+        {"data": {"slow": "slow3"}, "path": ["products", 3]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_without_directives():
+    engine = _build_engine("test_incremental_without_directives")
+
+    assert await _payloads(engine, "query { product(id: 1) { id } }") == [
+        {"data": {"product": {"id": 1}}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_directives_ignored_by_execute():
+    engine = _build_engine("test_incremental_directives_ignored_by_execute")
+
+    assert (
+        await engine.execute(
+            """
+        query {
+            product(id: 1) {
+                id
+                reviews @stream
+                ... @defer { slow }
+            }
+        }
+        """
+        )
+        == {
+            "data": {
+                "product": {
+                    "id": 1,
+                    "reviews": ["a", "b", "c"],
+                    "slow": "slow1",
+                }
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_user_defined_defer():
+    schema_name = "test_incremental_user_defined_defer"
+
+    @Directive("defer", schema_name=schema_name)
+    class UserDefer:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return "%s (%s)" % (
+                await next_resolver(parent, args, ctx, info),
+                directive_args["reason"],
+            )
+
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolver_query_hello(*_, **__):
+        return "world"
+
+    # The SDL replaces the built-in `@defer` with its own one
+    engine = Engine(
+        """
+        directive @defer(reason: String) on FIELD
+
+        type Query { hello: String }
+        """,
+        schema_name=schema_name,
+    )
+    query = 'query { hello @defer(reason: "late") }'
+
+    assert await engine.execute(query) == {"data": {"hello": "world (late)"}}
+    assert [
+        payload async for payload in engine.execute_incremental(query)
+    ] == [{"data": {"hello": "world (late)"}}]
@@ -284,6 +284,50 @@ async def test_tartiflette_execute_schema_introspection_output(clean_registry):
                             }
                         ],
                     },
+                    {
+                        "name": "defer",
+                        "description": None,
+                        "locations": ["FRAGMENT_SPREAD", "INLINE_FRAGMENT"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "description": None,
+                                "type": {"kind": "SCALAR", "name": "String"},
+                                "defaultValue": None,
+                            },
+                            {
+                                "name": "if",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "True",
+                            },
+                        ],
+                    },
+                    {
+                        "name": "stream",
+                        "description": None,
+                        "locations": ["FIELD"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "description": None,
+                                "type": {"kind": "SCALAR", "name": "String"},
+                                "defaultValue": None,
+                            },
+                            {
+                                "name": "initialCount",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "0",
+                            },
+                            {
+                                "name": "if",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "True",
+                            },
+                        ],
+                    },
                 ],
                 "mutationType": {"name": "CustomRootMutation"},
                 "queryType": {"name": "CustomRootQuery"},
@@ -405,6 +449,50 @@ async def test_tartiflette_execute_schema_introspection_output_exclude_scalars(
                         "name": "include",
                         "description": None,
                     },
+                    {
+                        "name": "defer",
+                        "description": None,
+                        "locations": ["FRAGMENT_SPREAD", "INLINE_FRAGMENT"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "description": None,
+                                "type": {"kind": "SCALAR", "name": "String"},
+                                "defaultValue": None,
+                            },
+                            {
+                                "name": "if",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "True",
+                            },
+                        ],
+                    },
+                    {
+                        "name": "stream",
+                        "description": None,
+                        "locations": ["FIELD"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "description": None,
+                                "type": {"kind": "SCALAR", "name": "String"},
+                                "defaultValue": None,
+                            },
+                            {
+                                "name": "initialCount",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "0",
+                            },
+                            {
+                                "name": "if",
+                                "description": None,
+                                "type": {"kind": "NON_NULL", "name": None},
+                                "defaultValue": "True",
+                            },
+                        ],
+                    },
                 ],
                 "types": [
                     {"kind": "OBJECT", "name": "CustomRootQuery"},
@@ -612,6 +700,75 @@ fragment TypeRef on __Type {
                             }
                         ],
                     },
+                    {
+                        "name": "defer",
+                        "locations": ["FRAGMENT_SPREAD", "INLINE_FRAGMENT"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "defaultValue": None,
+                                "type": {
+                                    "kind": "SCALAR",
+                                    "name": "String",
+                                    "ofType": None,
+                                },
+                            },
+                            {
+                                "name": "if",
+                                "defaultValue": "True",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Boolean",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                        ],
+                    },
+                    {
+                        "name": "stream",
+                        "locations": ["FIELD"],
+                        "args": [
+                            {
+                                "name": "label",
+                                "defaultValue": None,
+                                "type": {
+                                    "kind": "SCALAR",
+                                    "name": "String",
+                                    "ofType": None,
+                                },
+                            },
+                            {
+                                "name": "initialCount",
+                                "defaultValue": "0",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Int",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                            {
+                                "name": "if",
+                                "defaultValue": "True",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "name": None,
+                                    "ofType": {
+                                        "kind": "SCALAR",
+                                        "name": "Boolean",
+                                        "ofType": None,
+                                    },
+                                },
+                            },
+                        ],
+                    },
                 ],
                 "types": [
                     {
@@ -0,0 +1,147 @@
+import pytest
+
+from tartiflette import Engine, Resolver, Subscription
+
+_SDL = """
+type C {
+    v: String!
+}
+
+type B {
+    c: C!
+    other: String
+}
+
+type A {
+    b: B!
+}
+
+type Z {
+    a: A
+}
+
+type Y {
+    z: Z
+}
+
+type Item {
+    name: String!
+}
+
+type Query {
+    y: Y
+    nullableItems: [Item]
+    nonNullItems: [Item!]
+}
+
+type Subscription {
+    counter: C
+}
+"""
+
+
+@Resolver("C.v", schema_name="test_null_propagation")
+@Resolver("C.v", schema_name="test_null_propagation_compiled")
+async def resolver_c_v(parent, *_, **__):
+    if parent.get("fail"):
+        raise Exception("boom")
+    return parent["v"]
+
+
+@Subscription("Subscription.counter", schema_name="test_null_propagation")
+async def subscription_counter(*_, **__):
+    for payload in [{"fail": True}, {"v": "ok"}, {"fail": True}]:
+        yield payload
+
+
+_ENGINES = [
+    Engine(_SDL, schema_name="test_null_propagation"),
+    Engine(
+        _SDL, schema_name="test_null_propagation_compiled", jit_threshold=0
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", _ENGINES)
+@pytest.mark.asyncio
+async def test_null_propagation_to_closest_nullable_ancestor(engine):
+    query = """
+    query {
+        y { z { a { b { other c { v } } } } }
+    }
+    """
+
+    for _ in range(2):
+        assert await engine.execute(
+            query,
+            initial_value={
+                "y": {"z": {"a": {"b": {"other": "o", "c": {"fail": True}}}}}
+            },
+        ) == {
+            "data": {"y": {"z": {"a": None}}},
+            "errors": [
+                {
+                    "message": "boom",
+                    "path": ["y", "z", "a", "b", "c", "v"],
+                    "locations": [{"line": 3, "column": 35}],
+                }
+            ],
+        }
+
+
+@pytest.mark.parametrize("engine", _ENGINES)
+@pytest.mark.asyncio
+async def test_null_propagation_list_items(engine):
+    query = """
+    query {
+        nullableItems { name }
+        nonNullItems { name }
+    }
+    """
+
+    result = await engine.execute(
+        query,
+        initial_value={
+            "nullableItems": [{"name": "a"}, {"name": None}],
+            "nonNullItems": [{"name": "a"}, {"name": None}],
+        },
+    )
+
+    assert result["data"] == {
+        "nullableItems": [{"name": "a"}, None],
+        "nonNullItems": None,
+    }
+    assert len(result["errors"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_null_propagation_subscription_events():
+    results = []
+    async for result in _ENGINES[0].subscribe(
+        "subscription { counter { v } }"
+    ):
+        results.append(result)
+
+    assert results == [
+        {
+            "data": {"counter": None},
+            "errors": [
+                {
+                    "message": "boom",
+                    "path": ["counter", "v"],
+                    "locations": [{"line": 1, "column": 26}],
+                }
+            ],
+        },
+        {"data": {"counter": {"v": "ok"}}},
+        {
+            "data": {"counter": None},
+            "errors": [
+                {
+                    "message": "boom",
+                    "path": ["counter", "v"],
+                    "locations": [{"line": 1, "column": 26}],
+                }
+            ],
+        },
+    ]
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type Item {
+    id: Int!
+    detail: String
+}
+
+type Query {
+    items(count: Int!): [Item]
+}
+"""
+
+
+def _build_engine(schema_name, in_flight, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolver_query_items(_parent, args, *_, **__):
+        return [{"id": item_id} for item_id in range(args["count"])]
+
+    @Resolver("Item.detail", schema_name=schema_name)
+    async def resolver_item_detail(parent, *_, **__):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.001)
+        in_flight["current"] -= 1
+        return "Detail %d" % parent["id"]
+
+    return Engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.parametrize("executor", ["basic", "breadth_first"])
+@pytest.mark.asyncio
+async def test_resolver_scheduler_per_request(executor):
+    in_flight = {"current": 0, "max": 0}
+    engine = _build_engine(
+        "test_resolver_scheduler_per_request_%s" % executor,
+        in_flight,
+        executor=executor,
+        max_concurrent_resolvers_per_request=5,
+    )
+
+    result = await engine.execute("query { items(count: 50) { id detail } }")
+
+    assert "errors" not in result
+    assert result["data"]["items"][49] == {"id": 49, "detail": "Detail 49"}
+    assert in_flight["max"] == 5
+
+
+@pytest.mark.asyncio
+async def test_resolver_scheduler_per_engine():
+    in_flight = {"current": 0, "max": 0}
+    engine = _build_engine(
+        "test_resolver_scheduler_per_engine",
+        in_flight,
+        max_concurrent_resolvers=8,
+        max_concurrent_resolvers_per_request=5,
+    )
+
+    results = await asyncio.gather(
+        *[
+            engine.execute("query { items(count: 20) { detail } }")
+            for _ in range(4)
+        ]
+    )
+
+    assert all("errors" not in result for result in results)
+    assert in_flight["max"] == 8
+    assert engine.resolver_scheduler.limiter.info() == {
+        "limit": 8,
+        "in_flight": 0,
+        "max_in_flight": 8,
+        "waiting": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_resolver_scheduler_priority():
+    order = []
+    schema_name = "test_resolver_scheduler_priority"
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolver_query_items(_parent, args, *_, **__):
+        return [{"id": item_id} for item_id in range(args["count"])]
+
+    @Resolver("Item.id", schema_name=schema_name)
+    @Resolver("Item.detail", schema_name=schema_name)
+    async def resolver_item(parent, _args, _ctx, info):
+        order.append((info.schema_field.name, parent["id"]))
+        await asyncio.sleep(0)
+        return parent["id"] if info.schema_field.name == "id" else None
+
+    engine = Engine(
+        _SDL,
+        schema_name=schema_name,
+        max_concurrent_resolvers_per_request=1,
+        resolver_priority=lambda info: 0
+        if info.schema_field.name == "id"
+        else 1,
+    )
+
+    result = await engine.execute("query { items(count: 3) { detail id } }")
+
+    assert "errors" not in result
+    # The first field gets the free slot, the waiting ids go before the
+    # waiting details
+    assert order == [
+        ("detail", 0),
+        ("id", 0),
+        ("id", 1),
+        ("id", 2),
+        ("detail", 1),
+        ("detail", 2),
+    ]
+    assert (
+        Engine(
+            _SDL, schema_name="test_resolver_scheduler_none"
+        ).resolver_scheduler
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolver_scheduler_plain_function_awaitable():
+    in_flight = {"current": 0, "max": 0}
+    schema_name = "test_resolver_scheduler_plain_function_awaitable"
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolver_query_items(_parent, args, *_, **__):
+        return [{"id": item_id} for item_id in range(args["count"])]
+
+    async def load_detail(item_id):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.001)
+        in_flight["current"] -= 1
+        return "Detail %d" % item_id
+
+    @Resolver("Item.detail", schema_name=schema_name)
+    def resolver_item_detail(parent, *_, **__):
+        # The coroutine returned is awaited holding a slot
+        return load_detail(parent["id"])
+
+    engine = Engine(
+        _SDL, schema_name=schema_name, max_concurrent_resolvers_per_request=5
+    )
+
+    result = await engine.execute("query { items(count: 50) { id detail } }")
+
+    assert "errors" not in result
+    assert result["data"]["items"][49] == {"id": 49, "detail": "Detail 49"}
+    assert in_flight["max"] == 5
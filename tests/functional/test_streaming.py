@@ -0,0 +1,163 @@
+import asyncio
+import json
+import pickle
+
+import pytest
+
+from tartiflette import Engine, Resolver
+
+_SDL = """
+type Item {
+    id: Int!
+    name: String
+    double: Int!
+}
+
+type Query {
+    rows(count: Int!): [Item]
+    strictRows(count: Int!): [Item!]
+    total: Int!
+}
+
+type Mutation {
+    add(id: Int!): [Item]
+}
+"""
+
+
+def _build_engine(schema_name, events, **kwargs):
+    @Resolver("Query.rows", schema_name=schema_name)
+    @Resolver("Query.strictRows", schema_name=schema_name)
+    async def resolver_rows(parent, args, *_, **__):
+        events.append("rows")
+        return [{"id": i, "name": "é%d" % i} for i in range(args["count"])]
+
+    @Resolver("Item.double", schema_name=schema_name)
+    async def resolver_item_double(parent, *_, **__):
+        await asyncio.sleep(0)
+        events.append(parent["id"])
+        if parent["id"] == 3:
+            raise Exception("boom")
+        return parent["id"] * 2
+
+    @Resolver("Mutation.add", schema_name=schema_name)
+    async def resolver_mutation_add(parent, args, *_, **__):
+        events.append("add")
+        return [{"id": args["id"], "name": None}]
+
+    return Engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+async def _chunks(engine, query, initial_value=None, **kwargs):
+    if initial_value is None:
+        initial_value = {"total": 5}
+
+    return [
+        chunk
+        async for chunk in engine.execute_to_chunks(
+            query, initial_value=initial_value, **kwargs
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_list_items():
+    events = []
+    engine = _build_engine("test_streaming_list_items", events)
+
+    chunks = await _chunks(
+        engine,
+        "query { rows(count: 5) { id name double } total }",
+        chunk_size=2,
+    )
+
+    # The items are executed & sent two at a time, the first chunk
+    # starting the response
+    assert chunks[0].startswith(b'{"data":{"rows":[{"id":0,')
+    assert len(chunks) == 4
+    assert events[0] == "rows"
+    assert sorted(events[1:3]) == [0, 1]
+    assert sorted(events[3:5]) == [2, 3]
+    assert events[5:] == [4]
+
+    assert json.loads(b"".join(chunks).decode("utf-8")) == {
+        "data": {
+            "rows": [
+                {"id": 0, "name": "é0", "double": 0},
+                {"id": 1, "name": "é1", "double": 2},
+                {"id": 2, "name": "é2", "double": 4},
+                None,
+                {"id": 4, "name": "é4", "double": 8},
+            ],
+            "total": 5,
+        },
+        "errors": [
+            {
+                "message": "boom",
+                "path": ["rows", "double"],
+                "locations": [{"line": 1, "column": 34}],
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "query { strictRows(count: 5) { id double } rows(count: 2) { id } }",
+        "query { rows(count: 0) { id } total }",
+        "query { total rows(count: 3) @skip(if: true) { id } }",
+        "query { rows(count: 1) @skip(if: true) { id } }",
+        "query { unknown }",
+        "mutation { first: add(id: 1) { id } second: add(id: 2) { id } }",
+    ],
+)
+@pytest.mark.asyncio
+async def test_streaming_same_response(query):
+    engine = _build_engine("test_streaming_same_response_%d" % len(query), [])
+
+    # Lists of non-null items, which a single item can null, & mutations
+    # aren't streamed item after item, but the response is the same
+    assert b"".join(
+        await _chunks(engine, query, chunk_size=2)
+    ) == await engine.execute_to_bytes(query, initial_value={"total": 5})
+
+
+@pytest.mark.asyncio
+async def test_streaming_non_null_root_field():
+    engine = _build_engine("test_streaming_non_null_root_field", [])
+
+    assert await _chunks(
+        engine, "query { rows(count: 3) { id } total }", initial_value={}
+    ) == [
+        b'{"data":null,"errors":[{"message":"Invalid value (value: None) '
+        b'for field `total` of type `Int!`","path":["total"],"locations":'
+        b'[{"line":1,"column":31}]}]}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_custom_encoder():
+    engine = _build_engine(
+        "test_streaming_custom_encoder",
+        [],
+        response_encoder=lambda value: json.dumps(value, indent=2).encode(),
+    )
+    query = "query { rows(count: 5) { id name } total }"
+
+    chunks = await _chunks(engine, query, chunk_size=2)
+
+    assert len(chunks) == 4
+    assert json.loads(b"".join(chunks).decode("utf-8")) == json.loads(
+        await engine.execute_to_bytes(query, initial_value={"total": 5})
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_non_json_encoder():
+    engine = _build_engine(
+        "test_streaming_non_json_encoder", [], response_encoder=pickle.dumps
+    )
+
+    with pytest.raises(ValueError, match="encoding them into JSON"):
+        await _chunks(engine, "query { rows(count: 5) { id } }")
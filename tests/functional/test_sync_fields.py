@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+
+from tartiflette import Engine, Resolver
+from tartiflette.resolver.factory import _ResolverExecutor
+
+_SDL = """
+enum Size {
+    S
+    M
+    L
+}
+
+type Item {
+    name: String
+    size: Size
+    tags: [String!]
+    weight: Int!
+}
+
+type Query {
+    items: [Item]
+}
+"""
+
+
+@Resolver("Query.items", schema_name="test_sync_fields")
+async def resolver_query_items(*_, **__):
+    return [
+        {"name": "a", "size": "S", "tags": ["x", "y"], "weight": 1},
+        {"name": 2, "size": "M", "tags": [], "weight": "3"},
+        {"name": None, "size": "XL", "tags": None, "weight": 2},
+        {"name": "d", "size": None, "tags": ["z", None], "weight": None},
+    ]
+
+
+_ENGINE = Engine(_SDL, schema_name="test_sync_fields")
+
+
+@pytest.mark.asyncio
+async def test_sync_fields():
+    executions = []
+    original_call = _ResolverExecutor.__call__
+
+    async def counting_call(self, *args, **kwargs):
+        executions.append(self.schema_field.name)
+        return await original_call(self, *args, **kwargs)
+
+    with patch.object(_ResolverExecutor, "__call__", counting_call):
+        result = await _ENGINE.execute(
+            "query { items { name size tags weight } }"
+        )
+
+    assert result["data"] == {
+        "items": [
+            {"name": "a", "size": "S", "tags": ["x", "y"], "weight": 1},
+            {"name": "2", "size": "M", "tags": [], "weight": 3},
+            {"name": None, "size": None, "tags": None, "weight": 2},
+            None,
+        ]
+    }
+    assert sorted(result["errors"], key=lambda error: error["path"]) == [
+        {
+            "message": "Invalid value (value: 'XL') for field `size` of type "
+            "`Size`",
+            "path": ["items", "size"],
+            "locations": [{"line": 1, "column": 22}],
+        },
+        {
+            "message": "Invalid value (value: None) for field `tags` of type "
+            "`[String!]`",
+            "path": ["items", "tags"],
+            "locations": [{"line": 1, "column": 27}],
+        },
+        {
+            "message": "Invalid value (value: None) for field `weight` of "
+            "type `Int!`",
+            "path": ["items", "weight"],
+            "locations": [{"line": 1, "column": 32}],
+        },
+    ]
+
+    # Only the root field & the leaves whose value can't be coerced go
+    # through the resolver executor
+    assert sorted(executions) == ["items", "size", "tags", "weight"]
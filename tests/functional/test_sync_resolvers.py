@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from tartiflette import Directive, Engine, Resolver
+from tartiflette.directive import CommonDirective
+
+_SDL = """
+directive @upper on FIELD | FIELD_DEFINITION
+
+type Query {
+    hello(name: String!): String
+    upperHello(name: String!): String @upper
+    thread: Boolean
+    failing: String
+    delegated(name: String!): String
+    upperDelegated(name: String!): String @upper
+}
+"""
+
+
+@Directive("upper", schema_name="test_sync_resolvers")
+class UpperDirective(CommonDirective):
+    @staticmethod
+    async def on_field_execution(
+        directive_args, next_resolver, parent_result, args, ctx, info
+    ):
+        return (await next_resolver(parent_result, args, ctx, info)).upper()
+
+
+@Resolver("Query.hello", schema_name="test_sync_resolvers")
+@Resolver("Query.upperHello", schema_name="test_sync_resolvers")
+def resolver_query_hello(parent, args, ctx, info):
+    return "hello " + args["name"]
+
+
+@Resolver(
+    "Query.thread", schema_name="test_sync_resolvers", run_in_executor=True
+)
+def resolver_query_thread(parent, args, ctx, info):
+    return threading.current_thread() is not threading.main_thread()
+
+
+@Resolver("Query.failing", schema_name="test_sync_resolvers")
+def resolver_query_failing(parent, args, ctx, info):
+    raise ValueError("failing")
+
+
+async def _fetch_hello(name):
+    return "hello " + name
+
+
+@Resolver("Query.delegated", schema_name="test_sync_resolvers")
+@Resolver("Query.upperDelegated", schema_name="test_sync_resolvers")
+def resolver_query_delegated(parent, args, ctx, info):
+    # A plain function returning the coroutine of another one
+    return _fetch_hello(args["name"])
+
+
+_ENGINE = Engine(_SDL, schema_name="test_sync_resolvers")
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers():
+    assert (
+        await _ENGINE.execute(
+            """
+        query {
+            hello(name: "a")
+            directiveHello: hello(name: "b") @upper
+            upperHello(name: "c")
+            thread
+        }
+        """
+        )
+        == {
+            "data": {
+                "hello": "hello a",
+                "directiveHello": "HELLO B",
+                "upperHello": "HELLO C",
+                "thread": True,
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_error():
+    assert await _ENGINE.execute("query { failing }") == {
+        "data": {"failing": None},
+        "errors": [
+            {
+                "message": "failing",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 9}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_returning_awaitable():
+    assert (
+        await _ENGINE.execute(
+            """
+        query {
+            delegated(name: "a")
+            upperDelegated(name: "b")
+        }
+        """
+        )
+        == {"data": {"delegated": "hello a", "upperDelegated": "HELLO B"}}
+    )
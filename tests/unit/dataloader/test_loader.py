@@ -0,0 +1,193 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+from tartiflette.dataloader import DataLoader
+from tartiflette.executors.types import ExecutionContext
+
+
+def _loader(**kwargs):
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return [KeyError(key) if key == "missing" else key * 2 for key in keys]
+
+    return DataLoader(batch_load, **kwargs), batches
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_loads_of_a_tick():
+    loader, batches = _loader()
+
+    assert await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load(3)
+    ) == [2, 4, 6]
+    assert await loader.load(4) == 8
+    assert batches == [[1, 2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cache():
+    loader, batches = _loader()
+
+    assert await asyncio.gather(loader.load(1), loader.load(1)) == [2, 2]
+    assert await loader.load(1) == 2
+    assert batches == [[1]]
+    assert loader.info() == {
+        "loads": 3,
+        "cache_hits": 2,
+        "batches": 1,
+        "batched_keys": 1,
+        "errors": 0,
+        "size": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_dataloader_no_cache():
+    loader, batches = _loader(cache=False)
+
+    assert await asyncio.gather(loader.load(1), loader.load(1)) == [2, 2]
+    assert await loader.load(1) == 2
+    assert batches == [[1, 1], [1]]
+    assert loader.prime(2, 0).clear(1).clear_all() is loader
+    assert loader.info()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cancelled_load():
+    loader, batches = _loader()
+
+    cancelled = asyncio.ensure_future(loader.load(1))
+    other = asyncio.ensure_future(loader.load(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    # Only the cancelled caller is affected, the key is still loaded once
+    assert await other == 2
+    assert cancelled.cancelled()
+    assert await loader.load(1) == 2
+    assert batches == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_max_batch_size():
+    loader, batches = _loader(max_batch_size=2)
+
+    assert await loader.load_many([1, 2, 3, 4, 5]) == [2, 4, 6, 8, 10]
+    assert batches == [[1, 2], [3, 4], [5]]
+    assert loader.info()["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_dataloader_prime_and_clear():
+    loader, batches = _loader()
+
+    loader.prime(1, "primed").prime(2, ValueError("primed error"))
+    loader.prime(1, "ignored")
+
+    assert await loader.load(1) == "primed"
+    with pytest.raises(ValueError, match="primed error"):
+        await loader.load(2)
+
+    loader.clear(1)
+    assert await loader.load(1) == 2
+
+    loader.clear_all()
+    assert await loader.load_many([1, 2]) == [2, 4]
+    assert batches == [[1], [1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_errors_are_not_cached():
+    loader, batches = _loader()
+
+    results = await asyncio.gather(
+        loader.load("missing"), loader.load(1), return_exceptions=True
+    )
+
+    assert isinstance(results[0], KeyError)
+    assert results[1] == 2
+
+    with pytest.raises(KeyError):
+        await loader.load("missing")
+
+    assert batches == [["missing", 1], ["missing"]]
+    assert loader.info()["errors"] == 2
+
+
+@pytest.mark.parametrize(
+    "batch_load_result,message",
+    [
+        (Exception("backend down"), "backend down"),
+        ([1], "expected 2 values, got 1."),
+    ],
+)
+@pytest.mark.asyncio
+async def test_dataloader_batch_load_failure(batch_load_result, message):
+    async def batch_load(keys):
+        if isinstance(batch_load_result, Exception):
+            raise batch_load_result
+        return batch_load_result
+
+    loader = DataLoader(batch_load)
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+
+    assert all(message in str(result) for result in results)
+    assert len(results) == 2
+    assert loader.info()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dataloader_subclass_and_from_info():
+    class UserLoader(DataLoader):
+        async def batch_load(self, keys):
+            return ["user %s" % key for key in keys]
+
+    info = Mock()
+    info.execution_ctx = ExecutionContext()
+
+    loader = UserLoader.from_info(info, max_batch_size=10)
+
+    assert UserLoader.from_info(info) is loader
+    assert await loader.load_many([1, 2]) == ["user 1", "user 2"]
+
+
+def test_dataloader_without_batch_load():
+    class UserLoader(DataLoader):
+        pass
+
+    with pytest.raises(TypeError, match="< DataLoader > needs either"):
+        DataLoader()
+
+    with pytest.raises(TypeError, match="< UserLoader > needs either"):
+        UserLoader(max_batch_size=10)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_functions_from_info():
+    async def load_users(keys):
+        return ["user %s" % key for key in keys]
+
+    async def load_posts(keys):
+        return ["post %s" % key for key in keys]
+
+    info = Mock()
+    info.execution_ctx = ExecutionContext()
+
+    users = DataLoader.from_info(info, load_users)
+    posts = DataLoader.from_info(info, batch_load=load_posts)
+
+    assert users is not posts
+    assert DataLoader.from_info(info, load_users) is users
+    assert DataLoader.from_info(info, load_posts) is posts
+    assert await asyncio.gather(users.load(1), posts.load(1)) == [
+        "user 1",
+        "post 1",
+    ]
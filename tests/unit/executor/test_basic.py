@@ -75,12 +75,12 @@ async def test_executor_basic_allow_parallelization(allow_parallelization):
     assert asyncio_gather_mock.called is allow_parallelization
 
 
-def _get_mocked_root_nodes(cbn, marsh, alias):
+def _get_mocked_root_nodes(cbn, marsh, alias, index=0):
     a = Mock()
     a.cant_be_null = cbn
     a.marshalled = marsh
     a.alias = alias
-    a.is_execution_stopped = False
+    a.index = index
     return a
 
 
@@ -92,7 +92,7 @@ def _get_mocked_root_nodes(cbn, marsh, alias):
         (
             [
                 _get_mocked_root_nodes(True, {"b": "c"}, "a"),
-                _get_mocked_root_nodes(True, {"b": "c"}, "b"),
+                _get_mocked_root_nodes(True, {"b": "c"}, "b", 1),
             ],
             {"a": {"b": "c"}, "b": {"b": "c"}},
         ),
@@ -102,12 +102,34 @@ def _get_mocked_root_nodes(cbn, marsh, alias):
 )
 def test_executor_basic__get_datas(root_nodes, expected):
     from tartiflette.executors.basic import _get_datas
+    from tartiflette.executors.types import ExecutionContext
+
+    execution_ctx = ExecutionContext(nb_root_fields=len(root_nodes or []))
+    for root_node in root_nodes or []:
+        execution_ctx.set_marshalled(root_node, root_node.marshalled)
 
     if inspect.isclass(expected) and issubclass(expected, Exception):
         with pytest.raises(expected):
-            _get_datas(root_nodes)
+            _get_datas(root_nodes, execution_ctx)
     else:
-        assert _get_datas(root_nodes) == expected
+        assert _get_datas(root_nodes, execution_ctx) == expected
+
+
+def test_executor_basic__get_datas_execution_stopped():
+    from tartiflette.executors.basic import _get_datas
+    from tartiflette.executors.types import ExecutionContext
+
+    root_nodes = [
+        _get_mocked_root_nodes(False, {"b": "c"}, "a"),
+        _get_mocked_root_nodes(False, {"b": "c"}, "b", 1),
+    ]
+
+    execution_ctx = ExecutionContext(nb_root_fields=2)
+    for root_node in root_nodes:
+        execution_ctx.set_marshalled(root_node, root_node.marshalled)
+    execution_ctx.stop_execution(root_nodes[0])
+
+    assert _get_datas(root_nodes, execution_ctx) == {"b": {"b": "c"}}
 
 
 def _get_mocked_error():
@@ -139,6 +161,7 @@ async def test_executor_basic_execute(errors, expected, monkeypatch):
     operation_mock.name = None
     operation_mock.children = []
     operation_mock.allow_parallelization = True
+    operation_mock.coerce_variables = Mock(return_value=({}, []))
 
     a = await execute(
         {None: operation_mock},
@@ -172,6 +195,7 @@ async def test_executor_basic_execute_custom_resolver(monkeypatch):
     operation_mock.name = None
     operation_mock.children = []
     operation_mock.allow_parallelization = True
+    operation_mock.coerce_variables = Mock(return_value=({}, []))
 
     a = await execute(
         {None: operation_mock},
@@ -281,3 +305,34 @@ def test_executor_get_operation(operations, operation_name, expected):
             assert type(expected_error) is type(error)
             assert str(expected_error) == str(error)
         assert operation is None
+
+
+def test_executor_create_execution_context():
+    from tartiflette.executors.basic import create_execution_context
+
+    operation_mock = Mock()
+    operation_mock.children = [Mock(), Mock()]
+    operation_mock.coerce_variables = Mock(
+        return_value=({"a_var": "a_value"}, [])
+    )
+
+    execution_ctx, errors = create_execution_context(
+        operation_mock, {"a_var": "a_value"}
+    )
+
+    assert execution_ctx.variables == {"a_var": "a_value"}
+    assert execution_ctx.results == [None, None]
+    assert errors is None
+
+
+def test_executor_create_execution_context_variable_errors():
+    from tartiflette.executors.basic import create_execution_context
+
+    an_error = Mock()
+    operation_mock = Mock()
+    operation_mock.coerce_variables = Mock(return_value=({}, [an_error]))
+
+    execution_ctx, errors = create_execution_context(operation_mock, {})
+
+    assert execution_ctx is None
+    assert errors == [an_error]
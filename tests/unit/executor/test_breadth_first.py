@@ -0,0 +1,123 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+
+def _node(name, events, children=None, suspend=False):
+    node = Mock()
+    node.name = name
+
+    async def resolve(execution_ctx, request_ctx, **kwargs):
+        events.append(name)
+        if suspend:
+            await asyncio.sleep(0)
+        if children is None:
+            return None
+        return "%s-raw" % name, {}, kwargs["parent_slot"]
+
+    def iter_children(execution_ctx, raw, coerced, slot):
+        for child in children:
+            yield child, raw, coerced, slot
+
+    node.resolve = resolve
+    node.iter_children = iter_children
+    return node
+
+
+@pytest.mark.asyncio
+async def test_executor_breadth_first_execute_level():
+    from tartiflette.executors.breadth_first import execute_level
+
+    events = []
+    leaf = _node("leaf", events)
+    parent = _node("parent", events, children=[leaf, leaf], suspend=True)
+
+    next_level = await execute_level(
+        [(parent, "root", None, "slot"), (leaf, "root", None, "slot")],
+        Mock(),
+        None,
+    )
+
+    assert sorted(events) == ["leaf", "parent"]
+    assert next_level == [
+        (leaf, "parent-raw", {}, "slot"),
+        (leaf, "parent-raw", {}, "slot"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_executor_breadth_first_execute_levels():
+    from tartiflette.executors.breadth_first import execute_levels
+
+    events = []
+    leaf = _node("leaf", events, suspend=True)
+    middle = _node("middle", events, children=[leaf])
+    root_a = _node("root_a", events, children=[middle, middle])
+    root_b = _node("root_b", events, children=[leaf], suspend=True)
+
+    await execute_levels(
+        [(root_a, None, None, None), (root_b, None, None, None)], Mock(), None
+    )
+
+    assert sorted(events[:2]) == ["root_a", "root_b"]
+    assert sorted(events[2:5]) == ["leaf", "middle", "middle"]
+    assert events[5:] == ["leaf", "leaf"]
+
+
+@pytest.mark.parametrize(
+    "allow_parallelization,expected",
+    [
+        (True, ["a", "b", "a-child", "b-child"]),
+        (False, ["a", "a-child", "b", "b-child"]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_executor_breadth_first_execute_operation(
+    allow_parallelization, expected, monkeypatch
+):
+    from tartiflette.executors import breadth_first
+
+    events = []
+    root_a = _node("a", events, children=[_node("a-child", events)])
+    root_b = _node("b", events, children=[_node("b-child", events)])
+
+    operation = Mock()
+    operation.children = [root_a, root_b]
+    operation.allow_parallelization = allow_parallelization
+
+    execution_ctx = Mock()
+    build_response = Mock(return_value={"data": {}})
+    monkeypatch.setattr(
+        breadth_first,
+        "create_execution_context",
+        Mock(return_value=(execution_ctx, [])),
+    )
+    monkeypatch.setattr(breadth_first, "build_response", build_response)
+
+    assert await breadth_first.execute_operation(
+        operation, None, None, Mock(), {}
+    ) == {"data": {}}
+    assert events == expected
+    assert build_response.call_args[0][:2] == (
+        operation.children,
+        execution_ctx,
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_breadth_first_execute_operation_errors(monkeypatch):
+    from tartiflette.executors import breadth_first
+
+    error = Exception("invalid variable")
+    operation = Mock()
+    monkeypatch.setattr(
+        breadth_first,
+        "create_execution_context",
+        Mock(return_value=(Mock(), [error])),
+    )
+
+    assert await breadth_first.execute_operation(
+        operation, None, None, lambda err: {"message": str(err)}, {}
+    ) == {"data": None, "errors": [{"message": "invalid variable"}]}
@@ -0,0 +1,156 @@
+import pytest
+
+_SDL = """
+type Owner {
+    name: String!
+}
+
+type Dog {
+    name: String!
+    age: Int
+    owner: Owner
+    tags: [String!]
+    nicknames: [String]
+}
+
+type Query {
+    dogs: [Dog]
+    dog: Dog
+    bestDog: Dog!
+}
+"""
+
+_DOGS = [
+    {"name": "Rex", "age": 3, "owner": {"name": "Bob"}, "tags": ["good"]},
+    {
+        "name": "Medor",
+        "age": None,
+        "owner": None,
+        "tags": None,
+        "nicknames": ["M", None],
+    },
+]
+
+
+async def _execute_both(clean_registry, query, initial_value=None):
+    from tartiflette import Engine, Resolver
+
+    @Resolver("Query.dogs", schema_name="test_compiler")
+    async def resolver_dogs(*_args, **_kwargs):
+        return _DOGS
+
+    interpreter = Engine(_SDL, schema_name="test_compiler")
+    clean_registry._schemas = {}
+
+    @Resolver("Query.dogs", schema_name="test_compiler")
+    async def resolver_dogs_jit(*_args, **_kwargs):
+        return _DOGS
+
+    compiled = Engine(_SDL, schema_name="test_compiler", jit_threshold=0)
+
+    expected = await interpreter.execute(query, initial_value=initial_value)
+    result = await compiled.execute(query, initial_value=initial_value)
+
+    operation = compiled.prepare(query)._operation
+    assert operation.compiled is not None
+    return expected, result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,initial_value",
+    [
+        ("{ dogs { name age owner { name } tags nicknames } }", None),
+        ("{ dog { name ... on Dog { age } } }", {"dog": {"name": "Rex"}}),
+        ("{ dog { name age } }", {"dog": {"name": None, "age": 1}}),
+        ("{ bestDog { name } }", {"bestDog": None}),
+        ("{ dog { tags } }", {"dog": {"tags": ["a", None]}}),
+        ("{ dog { tags } }", {"dog": {"tags": "a"}}),
+        ("{ dog { age } }", {"dog": {"age": "not an int"}}),
+        ("{ dog { name owner { name } } }", {"dog": None}),
+        ("{ dogs { name __typename } }", None),
+    ],
+)
+async def test_compiler_same_results_as_interpreter(
+    clean_registry, query, initial_value
+):
+    expected, result = await _execute_both(
+        clean_registry, query, initial_value=initial_value
+    )
+
+    assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_compiler_threshold(clean_registry):
+    from tartiflette import Engine
+
+    e = Engine(_SDL, jit_threshold=2)
+
+    query = "{ dog { name } }"
+    prepared = e.prepare(query)
+
+    for _ in range(2):
+        assert await prepared.execute(initial_value={"dog": {"name": "a"}})
+        assert prepared._operation.compiled is None
+
+    assert await prepared.execute(initial_value={"dog": {"name": "a"}}) == {
+        "data": {"dog": {"name": "a"}}
+    }
+    assert prepared._operation.compiled is not None
+    assert prepared._operation.executions == 3
+
+
+@pytest.mark.asyncio
+async def test_compiler_disabled(clean_registry):
+    from tartiflette import Engine
+
+    e = Engine(_SDL)
+
+    for _ in range(3):
+        await e.execute("{ dog { name } }")
+
+    operation = e.prepare("{ dog { name } }")._operation
+    assert operation.compiled is None
+    assert operation.executions == 0
+
+
+@pytest.mark.asyncio
+async def test_compiler_compiles_children_of_interpreted_fields(
+    clean_registry
+):
+    from tartiflette import Engine, Resolver
+
+    @Resolver("Query.dogs")
+    async def resolver_dogs(*_args, **_kwargs):
+        return _DOGS
+
+    e = Engine(_SDL, jit_threshold=0)
+
+    prepared = e.prepare("{ dogs { name } }")
+    await prepared.execute()
+
+    assert prepared._operation.children[0].compiled_children is not None
+
+
+def test_compiler_compile_operation_not_a_query():
+    from unittest.mock import Mock
+
+    from tartiflette.executors.compiler import compile_operation
+
+    operation = Mock()
+    operation.type = "Mutation"
+
+    assert compile_operation(operation) is None
+
+
+@pytest.mark.asyncio
+async def test_compiler_compile_operation_introspection(clean_registry):
+    from tartiflette import Engine
+    from tartiflette.executors.compiler import compile_operation
+
+    e = Engine(_SDL)
+
+    prepared = e.prepare("{ __schema { types { name } } }")
+
+    assert compile_operation(prepared._operation) is None
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_executor_deadline_get_deadline():
+    from tartiflette.executors.deadline import get_deadline
+
+    now = asyncio.get_event_loop().time()
+
+    assert get_deadline(None) is None
+    assert now + 5 <= get_deadline(5) <= asyncio.get_event_loop().time() + 5
+
+
+@pytest.mark.asyncio
+async def test_executor_deadline_run_until_deadline():
+    from tartiflette.executors.deadline import run_until_deadline
+
+    async def resolver():
+        await asyncio.sleep(0)
+        return "value"
+
+    deadline = asyncio.get_event_loop().time() + 10
+
+    assert await run_until_deadline(resolver(), deadline) == "value"
+
+
+@pytest.mark.asyncio
+async def test_executor_deadline_run_until_deadline_expires():
+    from tartiflette.executors.deadline import run_until_deadline
+    from tartiflette.types.exceptions.tartiflette import DeadlineExceeded
+
+    cancelled = []
+
+    async def resolver():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    deadline = asyncio.get_event_loop().time() + 0.01
+
+    with pytest.raises(DeadlineExceeded):
+        await run_until_deadline(resolver(), deadline)
+
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_executor_deadline_run_until_deadline_expired():
+    from tartiflette.executors.deadline import run_until_deadline
+    from tartiflette.types.exceptions.tartiflette import DeadlineExceeded
+
+    started = []
+
+    async def resolver():
+        started.append(True)
+
+    coroutine = resolver()
+
+    with pytest.raises(DeadlineExceeded):
+        await run_until_deadline(
+            coroutine, asyncio.get_event_loop().time() - 1
+        )
+
+    assert not started
+    assert coroutine.cr_frame is None
+
+
+@pytest.mark.asyncio
+async def test_executor_deadline_run_until_deadline_cancelled():
+    from tartiflette.executors.deadline import run_until_deadline
+
+    deadline = asyncio.get_event_loop().time() + 10
+    task = asyncio.ensure_future(
+        run_until_deadline(asyncio.sleep(10), deadline)
+    )
+    await asyncio.sleep(0)
+
+    task.cancel()
+
+    # The cancellation of the execution isn't turned into an error
+    with pytest.raises(asyncio.CancelledError):
+        await task
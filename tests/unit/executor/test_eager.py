@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_order():
+    from tartiflette.executors.eager import gather_eagerly
+
+    events = []
+
+    async def sync_coroutine(name):
+        events.append(name)
+
+    async def suspending_coroutine(name):
+        events.append("%s-start" % name)
+        await asyncio.sleep(0)
+        events.append("%s-end" % name)
+
+    await gather_eagerly(
+        [
+            suspending_coroutine("a"),
+            sync_coroutine("b"),
+            suspending_coroutine("c"),
+            sync_coroutine("d"),
+        ]
+    )
+
+    assert events[:4] == ["a-start", "b", "c-start", "d"]
+    assert sorted(events[4:]) == ["a-end", "c-end"]
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_lazy():
+    from tartiflette.executors.eager import gather_eagerly
+
+    alive = []
+    max_alive = []
+
+    async def sync_coroutine():
+        max_alive.append(len(alive))
+
+    def coroutines():
+        for _ in range(3):
+            coroutine = sync_coroutine()
+            alive.append(coroutine)
+            yield coroutine
+            alive.remove(coroutine)
+
+    await gather_eagerly(coroutines())
+
+    assert max_alive == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_results_and_errors():
+    from tartiflette.executors.eager import gather_eagerly
+
+    future = asyncio.get_event_loop().create_future()
+    results = []
+
+    async def waiting_coroutine():
+        try:
+            results.append(await future)
+        except ValueError as e:
+            results.append(e)
+
+    async def failing_coroutine():
+        await asyncio.sleep(0)
+        raise KeyError("failing")
+
+    asyncio.get_event_loop().call_soon(future.set_exception, ValueError())
+
+    with pytest.raises(KeyError):
+        await gather_eagerly([waiting_coroutine(), failing_coroutine()])
+
+    await asyncio.sleep(0)
+
+    assert len(results) == 1
+    assert isinstance(results[0], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_sync_error():
+    from tartiflette.executors.eager import gather_eagerly
+
+    done = []
+
+    async def suspending_coroutine():
+        await asyncio.sleep(0)
+        done.append(True)
+
+    async def failing_coroutine():
+        raise KeyError("failing")
+
+    with pytest.raises(KeyError):
+        await gather_eagerly([suspending_coroutine(), failing_coroutine()])
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert done == [True]
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_cancellation():
+    from tartiflette.executors.eager import gather_eagerly
+
+    cancelled = []
+
+    async def suspending_coroutine():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    task = asyncio.ensure_future(gather_eagerly([suspending_coroutine()]))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_shared_future():
+    from tartiflette.executors.eager import gather_eagerly
+
+    future = asyncio.get_event_loop().create_future()
+    results = []
+
+    async def waiting_coroutine():
+        results.append(await future)
+
+    asyncio.get_event_loop().call_soon(future.set_result, "done")
+
+    await gather_eagerly([waiting_coroutine() for _ in range(3)])
+
+    assert results == ["done", "done", "done"]
+
+
+@pytest.mark.asyncio
+async def test_executor_eager_gather_eagerly_plain_future_and_sleep():
+    from tartiflette.executors.eager import gather_eagerly
+
+    future = asyncio.Future()
+    events = []
+
+    async def started_coroutine():
+        # The first suspension is on a plain future, the following one on
+        # the bare yield of `asyncio.sleep(0)`
+        events.append(await future)
+        await asyncio.sleep(0)
+        events.append("slept")
+
+    asyncio.get_event_loop().call_soon(future.set_result, "resolved")
+
+    await gather_eagerly([started_coroutine()])
+
+    assert events == ["resolved", "slept"]
+    assert not future._asyncio_future_blocking
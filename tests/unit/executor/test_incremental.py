@@ -0,0 +1,9 @@
+import pytest
+
+
+def test_executor_incremental_record_abstract():
+    from tartiflette.executors.incremental import IncrementalRecord
+    from tartiflette.executors.types import ExecutionContext
+
+    with pytest.raises(TypeError):
+        IncrementalRecord(None, None, ExecutionContext())
@@ -0,0 +1,133 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_executor_scheduler_concurrency_limiter_bound():
+    from tartiflette.executors.scheduler import ConcurrencyLimiter
+
+    limiter = ConcurrencyLimiter(2)
+    in_flight = []
+
+    async def run():
+        await limiter.acquire()
+        try:
+            in_flight.append(limiter.in_flight)
+            await asyncio.sleep(0)
+        finally:
+            limiter.release()
+
+    await asyncio.gather(*[run() for _ in range(10)])
+
+    assert max(in_flight) == 2
+    assert limiter.info() == {
+        "limit": 2,
+        "in_flight": 0,
+        "max_in_flight": 2,
+        "waiting": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_executor_scheduler_concurrency_limiter_order():
+    from tartiflette.executors.scheduler import ConcurrencyLimiter
+
+    limiter = ConcurrencyLimiter(1)
+    order = []
+
+    async def run(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+        limiter.release()
+
+    await limiter.acquire()
+    tasks = [
+        asyncio.ensure_future(run(name, priority))
+        for name, priority in [("a", 1), ("b", 0), ("c", 1), ("d", 0)]
+    ]
+    await asyncio.sleep(0)
+
+    assert limiter.waiting == 4
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["b", "d", "a", "c"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_scheduler_concurrency_limiter_cancel():
+    from tartiflette.executors.scheduler import ConcurrencyLimiter
+
+    limiter = ConcurrencyLimiter(1)
+
+    await limiter.acquire()
+    waiting = asyncio.ensure_future(limiter.acquire())
+    granted = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Cancelled while waiting: skipped when the slot is released
+    waiting.cancel()
+    limiter.release()
+    await asyncio.sleep(0)
+
+    assert granted.done()
+    assert limiter.in_flight == 1
+
+    # Cancelled once handed the slot: released again
+    granted_then_cancelled = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    granted_then_cancelled.cancel()
+    await asyncio.sleep(0)
+
+    assert granted_then_cancelled.cancelled()
+    assert limiter.in_flight == 0
+
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(0)
+
+
+@pytest.mark.asyncio
+async def test_executor_scheduler_resolver_scheduler():
+    from tartiflette.executors.scheduler import ResolverScheduler
+
+    scheduler = ResolverScheduler(
+        max_concurrent=3,
+        max_concurrent_per_request=2,
+        priority=lambda info: len(info.path),
+    )
+
+    first = scheduler.for_request()
+    second = scheduler.for_request()
+
+    assert first.limiters[1] is second.limiters[1] is scheduler.limiter
+    assert first.limiters[0] is not second.limiters[0]
+
+    info = Mock(path=["a", "b"])
+    await first.acquire(info)
+    await first.acquire(info)
+    await second.acquire(info)
+
+    assert scheduler.limiter.in_flight == 3
+
+    # Waits for a slot of the engine, without holding the one it got from
+    # its request
+    pending = asyncio.ensure_future(second.acquire(info))
+    await asyncio.sleep(0)
+    pending.cancel()
+    await asyncio.sleep(0)
+
+    assert second.limiters[0].in_flight == 1
+
+    first.release()
+    first.release()
+    second.release()
+
+    assert scheduler.limiter.in_flight == 0
+    assert ResolverScheduler(max_concurrent_per_request=1).limiter is None
+    assert len(ResolverScheduler(max_concurrent=1).for_request().limiters) == 1
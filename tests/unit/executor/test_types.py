@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_executor_types_ec_instance():
     from tartiflette.executors.types import ExecutionContext
 
@@ -18,6 +21,88 @@ def test_executor_types_ec_add_error():
     assert e in ec.errors
 
 
+def test_executor_types_ec_results():
+    from unittest.mock import Mock
+
+    from tartiflette.executors.types import ExecutionContext
+
+    ec = ExecutionContext(nb_root_fields=2)
+    node = Mock(index=1)
+
+    assert ec.results == [None, None]
+
+    ec.set_marshalled(node, {"a": "b"})
+    ec.stop_execution(node)
+
+    assert ec.get_marshalled(node) == {"a": "b"}
+    assert ec.results == [None, {"a": "b"}]
+    assert ec.is_execution_stopped(node)
+    assert not ec.is_execution_stopped(Mock(index=0))
+
+
+def test_executor_types_ec_get_dataloader():
+    from unittest.mock import Mock
+
+    from tartiflette.executors.types import ExecutionContext
+
+    ec = ExecutionContext()
+    factory = Mock(side_effect=[Mock(), Mock()])
+
+    dataloader = ec.get_dataloader("users", factory)
+
+    assert ec.get_dataloader("users", factory) is dataloader
+    assert ec.get_dataloader("posts", factory) is not dataloader
+    assert factory.call_count == 2
+    assert ExecutionContext().get_dataloader("users", Mock()) is not dataloader
+
+
+def test_executor_types_ec_fork():
+    from unittest.mock import Mock
+
+    from tartiflette.executors.types import ExecutionContext
+
+    ec = ExecutionContext(
+        {"a": 1}, nb_root_fields=2, scheduler=Mock(), deadline=12.5
+    )
+    ec.is_introspection = True
+    ec.add_error(Exception())
+    ec.stop_execution(Mock(index=0))
+    dataloader = ec.get_dataloader("users", Mock())
+    ec.infos["field"] = Mock(execution_ctx=ec)
+
+    forked = ec.fork()
+
+    assert forked.variables == {"a": 1}
+    assert forked.scheduler is ec.scheduler
+    assert forked.deadline == 12.5
+    assert forked.is_introspection
+    assert forked.get_dataloader("users", Mock()) is dataloader
+    assert forked.results == [None, None]
+    assert not forked.errors
+    assert not forked.is_execution_stopped(Mock(index=0))
+    assert forked.incremental is None
+    # The infos given to the resolvers of the fork are bound to the fork
+    assert not forked.infos
+
+
+def test_executor_types_result_slot_bubble_null():
+    from tartiflette.executors.types import ResultSlot
+
+    results = [{"a": [{"b": {"c": None}}]}]
+    root_slot = ResultSlot(results, 0, False)
+    a_slot = ResultSlot(results[0], "a", True, root_slot)
+    item_slot = ResultSlot(results[0]["a"], 0, False, a_slot)
+    b_slot = ResultSlot(results[0]["a"][0], "b", False, item_slot)
+
+    b_slot.bubble_null()
+
+    assert results == [{"a": None}]
+
+    root_slot.bubble_null()
+
+    assert results == [None]
+
+
 def test_executor_types_info_repr():
     from tartiflette.executors.types import Info
 
@@ -70,3 +155,26 @@ def test_executor_types_info_eq():
 
     assert inf1 == inf2
     assert inf3 != inf2
+
+
+def test_executor_types_info_slots():
+    from tartiflette.executors.types import Info
+
+    info = Info(
+        query_field="A",
+        schema_field="B",
+        schema="C",
+        path=["D", "E"],
+        location="F",
+        execution_ctx="G",
+    )
+
+    assert not hasattr(info, "__dict__")
+    with pytest.raises(AttributeError):
+        info.other = "H"
+
+
+def test_executor_types_ec_slots():
+    from tartiflette.executors.types import ExecutionContext
+
+    assert not hasattr(ExecutionContext(), "__dict__")
@@ -27,3 +27,37 @@ def test_parser_nodes_node_set_parent():
     n.set_parent("T")
 
     assert n.parent == "T"
+
+
+@pytest.mark.parametrize(
+    "module_name,class_name,args",
+    [
+        ("node", "Node", (["K"], "R", None, "T")),
+        ("field", "NodeField", ("T", None, None, None, ["T"], None)),
+        ("argument", "NodeArgument", (["K"], None, "T")),
+        ("directive", "NodeDirective", (["K"], None, "T")),
+        ("variable", "NodeVariable", (["K"], None, "T")),
+        (
+            "operation_definition",
+            "NodeOperationDefinition",
+            (["K"], None, "T", "Query"),
+        ),
+        (
+            "fragment_definition",
+            "NodeFragmentDefinition",
+            (["K"], None, "T", "Type"),
+        ),
+        ("variable_definition", "NodeVariableDefinition", (["K"], None, "T")),
+    ],
+)
+def test_parser_nodes_node_slots(module_name, class_name, args):
+    from importlib import import_module
+
+    node_class = getattr(
+        import_module("tartiflette.parser.nodes.%s" % module_name), class_name
+    )
+    node = node_class(*args)
+
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.unknown_attribute = "T"
@@ -61,117 +61,200 @@ def test_parser_node_nodefield_shall_produce_list(value):
     assert nf.shall_produce_list == value
 
 
-def test_parser_node_nodefield_bubble_error():
+def test_parser_node_nodefield_iter_children_no_cond():
     from tartiflette.parser.nodes.field import NodeField
 
     fe = Mock()
-    fe.cant_be_null = False
+    fe.shall_produce_list = False
 
-    nf = NodeField("Rb", None, fe, None, None, None, None)
+    nf = NodeField("NtM", None, fe, None, None, None, None)
 
-    nf.marshalled = {}
-    nf.parent = None
+    child = Mock()
+    child.type_condition = None
+    child.resolves_synchronously = False
 
-    nf.bubble_error()
+    exectx = Mock()
+    result = Mock()
+    coerce = Mock()
+    slot = Mock()
 
-    assert nf.marshalled is None
+    nf.children = [child, child, child]
 
-    nf.marshalled = {}
-    nf.parent = Mock()
-    nf.parent.marshalled = {"Rb": "Lol"}
-    nf.parent.bubble_error = Mock()
+    assert list(nf.iter_children(exectx, result, coerce, slot)) == [
+        (child, result, coerce, slot),
+        (child, result, coerce, slot),
+        (child, result, coerce, slot),
+    ]
+    assert not child.called
 
-    nf.bubble_error()
 
-    assert "Rb" in nf.parent.marshalled
-    assert nf.parent.marshalled["Rb"] is None
+def test_parser_node_nodefield_iter_children_cond():
+    from tartiflette.parser.nodes.field import NodeField
 
-    fe.cant_be_null = True
+    fe = Mock()
+    fe.shall_produce_list = False
 
-    nf.bubble_error()
+    nf = NodeField("NtM", None, fe, None, None, None, None)
+
+    child = Mock()
+    child.type_condition = "LOL"
+    child.resolves_synchronously = False
 
-    assert nf.parent.bubble_error.called
+    exectx = Mock()
+    result = {"_typename": "LL"}
+    coerce = Mock()
+    slot = Mock()
 
-    nf.parent = None
-    nf.marshalled = {}
+    nf.children = [child, child, child]
 
-    nf.bubble_error()
+    assert list(nf.iter_children(exectx, result, coerce, slot)) == []
 
-    assert nf.marshalled is None
+    result = {"_typename": "LOL"}
 
+    assert list(nf.iter_children(exectx, result, coerce, slot)) == [
+        (child, result, coerce, slot),
+        (child, result, coerce, slot),
+        (child, result, coerce, slot),
+    ]
 
-def test_parser_node_nodefield__get_coroutz_from_child_no_cond():
+
+def test_parser_node_nodefield_iter_children_a_list():
     from tartiflette.parser.nodes.field import NodeField
 
-    nf = NodeField("NtM", None, None, None, None, None, None)
+    fe = Mock()
+    fe.shall_produce_list = True
+    fe.items_cant_be_null = False
+
+    nf = NodeField("NtM", None, fe, None, None, None, None)
 
     child = Mock()
     child.type_condition = None
+    child.resolves_synchronously = False
 
     exectx = Mock()
-    reqctx = Mock()
-    result = Mock()
-    coerce = Mock()
+    result = [Mock(), Mock()]
+    coerce = [Mock(), Mock()]
+    slot = Mock()
 
-    nf.children = [child, child, child]
+    nf.children = [child]
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, None)
+    children = list(nf.iter_children(exectx, result, coerce, slot))
 
-    assert len(crtz) == 3
-    assert child.call_args_list == [
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
-    ]
+    assert len(children) == 2
+    for index, (node, parent_result, container, item_slot) in enumerate(
+        children
+    ):
+        assert node is child
+        assert parent_result is result[index]
+        assert container is coerce[index]
+        assert item_slot.container is coerce
+        assert item_slot.key == index
+        assert item_slot.nullable
+        assert item_slot.parent is slot
+
+    assert list(nf.iter_children(exectx, None, None, slot)) == []
 
 
-def test_parser_node_nodefield__get_coroutz_from_child_cond():
+def test_parser_node_nodefield_iter_children_a_list_range():
     from tartiflette.parser.nodes.field import NodeField
 
-    nf = NodeField("NtM", None, None, None, None, None, None)
+    fe = Mock()
+    fe.shall_produce_list = True
+    fe.items_cant_be_null = False
+
+    nf = NodeField("NtM", None, fe, None, None, None, None)
 
     child = Mock()
-    child.type_condition = "LOL"
+    child.type_condition = None
+    child.resolves_synchronously = False
 
-    exectx = Mock()
-    reqctx = Mock()
-    result = Mock()
-    coerce = Mock()
+    result = [Mock() for _ in range(5)]
+    coerce = [Mock() for _ in range(5)]
 
-    nf.children = [child, child, child]
+    nf.children = [child]
+
+    assert [
+        item_slot.key
+        for _, _, _, item_slot in nf.iter_children(
+            Mock(), result, coerce, Mock(), 1, 3
+        )
+    ] == [1, 2]
+    assert [
+        container
+        for _, _, container, _ in nf.iter_children(
+            Mock(), result, coerce, Mock(), 3, 10
+        )
+    ] == coerce[3:]
+
+
+def test_parser_node_nodefield_iter_children_sync():
+    from tartiflette.parser.nodes.field import NodeField
+
+    fe = Mock()
+    fe.shall_produce_list = False
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, "LL")
+    nf = NodeField("NtM", None, fe, None, None, None, None)
 
-    assert crtz == []
+    sync_child = Mock()
+    sync_child.type_condition = None
+    sync_child.resolves_synchronously = True
+    sync_child.alias = "sync"
+    sync_child.field_executor.resolve_sync = Mock(return_value="value")
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, "LOL")
+    failing_child = Mock()
+    failing_child.type_condition = None
+    failing_child.resolves_synchronously = True
+    failing_child.alias = "failing"
+    failing_child.field_executor.resolve_sync = Mock(side_effect=ValueError)
 
-    assert len(crtz) == 3
-    assert child.call_args_list == [
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
-        (
-            (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
-        ),
+    exectx = ExecutionContext()
+    result = Mock()
+    coerce = {}
+    slot = Mock()
+
+    nf.children = [sync_child, failing_child]
+
+    assert list(nf.iter_children(exectx, result, coerce, slot)) == [
+        (failing_child, result, coerce, slot)
+    ]
+    assert coerce == {"sync": "value"}
+    assert sync_child.field_executor.resolve_sync.call_args_list == [
+        ((result,),)
+    ]
+
+    exectx.is_introspection = True
+
+    assert list(nf.iter_children(exectx, result, coerce, slot)) == [
+        (sync_child, result, coerce, slot),
+        (failing_child, result, coerce, slot),
     ]
 
 
+@pytest.mark.parametrize(
+    "children,arguments,execution_directives,expected",
+    [
+        ([], {}, [], True),
+        ([Mock()], {}, [], False),
+        ([], {"a": Mock()}, [], False),
+        ([], {}, [Mock()], False),
+    ],
+)
+def test_parser_node_nodefield_resolves_synchronously(
+    children, arguments, execution_directives, expected
+):
+    from tartiflette.parser.nodes.field import NodeField
+
+    fe = Mock()
+    fe.resolves_synchronously = True
+
+    nf = NodeField("NtM", None, fe, None, None, None, None)
+    nf.children = children
+    nf.arguments = arguments
+    nf.execution_directives = execution_directives
+
+    assert nf.resolves_synchronously is expected
+
+
 @pytest.mark.asyncio
 async def test_parser_node_nodefield__execute_children_not_a_list():
     from tartiflette.parser.nodes.field import NodeField
@@ -191,13 +274,18 @@ async def test_parser_node_nodefield__execute_children_not_a_list():
     nf = NodeField("NtM", None, fe, None, None, None, None)
 
     nf.children = [child]
+    slot = Mock()
 
-    await nf._execute_children(exectx, reqctx, result, coerce)
+    await nf._execute_children(exectx, reqctx, result, coerce, slot)
 
     assert child.called
     assert child.call_args == (
         (exectx, reqctx),
-        {"parent_result": result, "parent_marshalled": coerce},
+        {
+            "parent_result": result,
+            "parent_marshalled": coerce,
+            "parent_slot": slot,
+        },
     )
 
 
@@ -213,6 +301,7 @@ async def test_parser_node_nodefield__execute_children_a_list():
 
     fe = Mock()
     fe.shall_produce_list = True
+    fe.items_cant_be_null = False
 
     child = AsyncMock()
     child.type_condition = None
@@ -220,18 +309,22 @@ async def test_parser_node_nodefield__execute_children_a_list():
     nf = NodeField("NtM", None, fe, None, None, None, None)
 
     nf.children = [child]
+    slot = Mock()
 
-    await nf._execute_children(exectx, reqctx, result, coerce)
+    await nf._execute_children(exectx, reqctx, result, coerce, slot)
 
     assert child.called
-    assert (
-        (exectx, reqctx),
-        {"parent_result": result[0], "parent_marshalled": coerce[0]},
-    ) in child.call_args_list
-    assert (
-        (exectx, reqctx),
-        {"parent_result": result[1], "parent_marshalled": coerce[1]},
-    ) in child.call_args_list
+    assert len(child.call_args_list) == 2
+    for args, kwargs in child.call_args_list:
+        index = kwargs["parent_slot"].key
+        assert args == (exectx, reqctx)
+        assert kwargs["parent_result"] is result[index]
+        assert kwargs["parent_marshalled"] is coerce[index]
+        item_slot = kwargs["parent_slot"]
+        assert item_slot.container is coerce
+        assert item_slot.key == index
+        assert item_slot.nullable
+        assert item_slot.parent is slot
 
 
 @pytest.mark.asyncio
@@ -247,16 +340,18 @@ async def test_parser_node_nodefield___call__():
 
     fe = fex()
     fe.schema_field = Mock()
+    fe.cant_be_null = False
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = None
+    nf.index = 0
 
-    exectx = Mock()
+    exectx = ExecutionContext(nb_root_fields=1)
     reqctx = Mock()
 
     await nf(exectx, reqctx)
 
-    assert nf.marshalled == coerced
+    assert exectx.get_marshalled(nf) == coerced
 
 
 @pytest.mark.asyncio
@@ -272,23 +367,24 @@ async def test_parser_node_nodefield___call___with_a_parent():
 
     fe = fex()
     fe.schema_field = Mock()
+    fe.cant_be_null = False
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = None
 
-    exectx = Mock()
+    exectx = ExecutionContext()
     reqctx = Mock()
 
     prm = {}
 
     await nf(exectx, reqctx, parent_marshalled=prm)
 
-    assert nf.marshalled == {}
+    assert exectx.results == []
     assert prm["B"] == coerced
 
 
 @pytest.mark.asyncio
-async def test_parser_node_nodefield___call___with_children():
+async def test_parser_node_nodefield___call___with_children(monkeypatch):
     from tartiflette.parser.nodes.field import NodeField
     from tests.unit.utils import AsyncMock
 
@@ -301,29 +397,35 @@ async def test_parser_node_nodefield___call___with_children():
 
     fe = fex()
     fe.schema_field = Mock()
+    fe.cant_be_null = False
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
-    nf._execute_children = AsyncMock()
+    monkeypatch.setattr(NodeField, "_execute_children", AsyncMock())
 
-    exectx = Mock()
+    exectx = ExecutionContext()
     reqctx = Mock()
 
     prm = {}
 
-    await nf(exectx, reqctx, parent_marshalled=prm)
+    parent_slot = Mock()
+
+    await nf(exectx, reqctx, parent_marshalled=prm, parent_slot=parent_slot)
 
-    assert nf.marshalled == {}
+    assert exectx.results == []
     assert prm["B"] == coerced
     assert nf._execute_children.called
-    assert nf._execute_children.call_args == (
-        (exectx, reqctx),
-        {"result": raw, "coerced": coerced},
-    )
+    args, kwargs = nf._execute_children.call_args
+    assert args == (exectx, reqctx)
+    assert kwargs["result"] is raw
+    assert kwargs["coerced"] is coerced
+    assert kwargs["slot"].container is prm
+    assert kwargs["slot"].key == "B"
+    assert kwargs["slot"].parent is parent_slot
 
 
 @pytest.mark.asyncio
-async def test_parser_node_nodefield___call___fe_is_excepting():
+async def test_parser_node_nodefield___call___fe_is_excepting(monkeypatch):
     from tartiflette.parser.nodes.field import NodeField
     from tests.unit.utils import AsyncMock
 
@@ -340,26 +442,24 @@ async def test_parser_node_nodefield___call___fe_is_excepting():
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
-    nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
+    monkeypatch.setattr(NodeField, "_execute_children", AsyncMock())
 
-    exectx = Mock()
-    exectx.add_error = Mock()
+    exectx = ExecutionContext()
     reqctx = Mock()
 
     prm = {}
+    parent_slot = Mock()
 
-    await nf(exectx, reqctx, parent_marshalled=prm)
+    await nf(exectx, reqctx, parent_marshalled=prm, parent_slot=parent_slot)
 
-    assert nf.marshalled == {}
     assert prm["B"] == coerced
-    assert nf.parent.bubble_error.called
-    assert exectx.add_error.called
+    assert parent_slot.bubble_null.called
+    assert not nf._execute_children.called
+    assert exectx.errors
 
 
 @pytest.mark.asyncio
-async def test_parser_node_nodefield__call__exception():
+async def test_parser_node_nodefield__call__exception(monkeypatch):
     from tartiflette.parser.nodes.field import NodeField
     from tests.unit.utils import AsyncMock
 
@@ -376,9 +476,7 @@ async def test_parser_node_nodefield__call__exception():
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
-    nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
+    monkeypatch.setattr(NodeField, "_execute_children", AsyncMock())
 
     exectx = ExecutionContext()
     reqctx = Mock()
@@ -401,7 +499,7 @@ async def test_parser_node_nodefield__call__exception():
 
 
 @pytest.mark.asyncio
-async def test_parser_node_nodefield__call__custom_exception():
+async def test_parser_node_nodefield__call__custom_exception(monkeypatch):
     from tartiflette.parser.nodes.field import NodeField
     from tests.unit.utils import AsyncMock
 
@@ -422,9 +520,7 @@ async def test_parser_node_nodefield__call__custom_exception():
 
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
-    nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
+    monkeypatch.setattr(NodeField, "_execute_children", AsyncMock())
 
     exectx = ExecutionContext()
     reqctx = Mock()
@@ -481,3 +577,34 @@ def test_add_errors_to_execution_context(
         assert isinstance(error, GraphQLError)
         assert error.message == expected_message
         assert type(error.original_error) is expected_original_error
+
+
+def test_parser_node_nodefield_get_info():
+    from tartiflette.parser.nodes.field import NodeField
+
+    fe = Mock()
+    nf = NodeField("NtM", "schema", fe, "location", ["a", "NtM"], None, None)
+    other_nf = NodeField(
+        "Other", "schema", fe, "location", ["Other"], None, None
+    )
+
+    exectx = ExecutionContext()
+
+    info = nf.get_info(exectx)
+
+    assert info.query_field is nf
+    assert info.schema_field is fe.schema_field
+    assert info.schema == "schema"
+    assert info.path == ["a", "NtM"]
+    assert info.location == "location"
+    assert info.execution_ctx is exectx
+
+    # Created once per execution
+    assert nf.get_info(exectx) is info
+    assert other_nf.get_info(exectx) is not info
+    assert nf.get_info(ExecutionContext()) is not info
+
+    # The fork of an execution gets infos of its own, bound to it
+    forked = exectx.fork()
+    assert nf.get_info(forked).execution_ctx is forked
+    assert nf.get_info(exectx) is info
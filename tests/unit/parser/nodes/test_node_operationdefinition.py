@@ -0,0 +1,70 @@
+from tartiflette.utils.arguments import UNDEFINED_VALUE
+
+
+def _operation_definition():
+    from tartiflette.parser.nodes.operation_definition import (
+        NodeOperationDefinition,
+    )
+    from tartiflette.parser.nodes.variable_definition import (
+        NodeVariableDefinition,
+    )
+
+    nod = NodeOperationDefinition(["A"], "a_location", "Query", "query")
+
+    nvd = NodeVariableDefinition(["A"], "a_location", "a_var")
+    nvd.var_name = "a_var"
+    nvd.var_type = int
+    nvd.default_value = 5
+    nod.add_variable_definition(nvd)
+
+    nvd = NodeVariableDefinition(["A"], "a_location", "another_var")
+    nvd.var_name = "another_var"
+    nvd.var_type = str
+    nod.add_variable_definition(nvd)
+
+    nod.add_variable_usage("a_var")
+    nod.add_variable_usage("another_var")
+    return nod
+
+
+def test_parser_nodes_node_operation_definition_coerce_variables():
+    nod = _operation_definition()
+
+    assert nod.coerce_variables({"a_var": 3, "another_var": "b"}) == (
+        {"a_var": 3, "another_var": "b"},
+        [],
+    )
+
+
+def test_parser_nodes_node_operation_definition_coerce_variables_defaults():
+    nod = _operation_definition()
+
+    assert nod.coerce_variables(None) == (
+        {"a_var": 5, "another_var": UNDEFINED_VALUE},
+        [],
+    )
+
+
+def test_parser_nodes_node_operation_definition_coerce_variables_errors():
+    from tartiflette.types.exceptions.tartiflette import InvalidType
+
+    variables, errors = _operation_definition().coerce_variables(
+        {"a_var": "3"}
+    )
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], InvalidType)
+
+
+def test_parser_nodes_node_operation_definition_coerce_variables_unknown():
+    from tartiflette.types.exceptions.tartiflette import (
+        UnknownVariableException,
+    )
+
+    nod = _operation_definition()
+    nod.add_variable_usage("undefined_var")
+
+    _, errors = nod.coerce_variables({})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], UnknownVariableException)
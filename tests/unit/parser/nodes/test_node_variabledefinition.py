@@ -13,3 +13,91 @@ def test_parser_nodes_node_variable_definition_inst():
     assert nvd.is_nullable is True
     assert nvd.is_list is False
     assert nvd.libgraphql_type == "VariableDefinition"
+
+
+def _variable_definition(var_type=int, is_nullable=True, is_list=False):
+    from tartiflette.parser.nodes.variable_definition import (
+        NodeVariableDefinition,
+    )
+
+    nvd = NodeVariableDefinition(["A"], "a_location", "Nija")
+    nvd.var_name = "a_var"
+    nvd.var_type = var_type
+    nvd.is_nullable = is_nullable
+    nvd.is_list = is_list
+    return nvd
+
+
+def test_parser_nodes_node_variable_definition_coerce():
+    value, errors = _variable_definition().coerce({"a_var": 3})
+
+    assert value == 3
+    assert errors == []
+
+
+def test_parser_nodes_node_variable_definition_coerce_nullable():
+    value, errors = _variable_definition(is_nullable=True).coerce(
+        {"a_var": None}
+    )
+
+    assert value is None
+    assert errors == []
+
+
+def test_parser_nodes_node_variable_definition_coerce_default_value():
+    nvd = _variable_definition()
+    nvd.default_value = 5
+
+    assert nvd.coerce({}) == (5, [])
+
+
+def test_parser_nodes_node_variable_definition_coerce_undefined():
+    assert _variable_definition().coerce({}) == (UNDEFINED_VALUE, [])
+
+
+def test_parser_nodes_node_variable_definition_coerce_missing_non_null():
+    from tartiflette.types.exceptions.tartiflette import (
+        UnknownVariableException,
+    )
+
+    value, errors = _variable_definition(is_nullable=False).coerce({})
+
+    assert value is UNDEFINED_VALUE
+    assert len(errors) == 1
+    assert isinstance(errors[0], UnknownVariableException)
+
+
+def test_parser_nodes_node_variable_definition_coerce_invalid_type():
+    from tartiflette.types.exceptions.tartiflette import InvalidType
+
+    _, errors = _variable_definition().coerce({"a_var": "3"})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], InvalidType)
+    assert errors[0].locations == ["a_location"]
+
+
+def test_parser_nodes_node_variable_definition_coerce_list():
+    nvd = _variable_definition(is_list=True)
+
+    assert nvd.coerce({"a_var": [1, 2]}) == ([1, 2], [])
+
+
+def test_parser_nodes_node_variable_definition_coerce_list_not_a_list():
+    from tartiflette.types.exceptions.tartiflette import InvalidType
+
+    _, errors = _variable_definition(is_list=True).coerce({"a_var": 1})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], InvalidType)
+
+
+def test_parser_nodes_node_variable_definition_coerce_list_invalid_item():
+    from tartiflette.types.exceptions.tartiflette import InvalidType
+
+    _, errors = _variable_definition(is_list=True).coerce(
+        {"a_var": [1, "2", "3"]}
+    )
+
+    assert len(errors) == 2
+    assert all(isinstance(error, InvalidType) for error in errors)
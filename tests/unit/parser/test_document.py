@@ -0,0 +1,174 @@
+import pytest
+
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.parser.cffi import LibGraphqlParser, Visitor
+from tartiflette.parser.document import visit_document
+
+_QUERY = """
+query Dogs($id: Int = 1, $names: [String!]! = ["a", "b"], $f: Float) {
+    dog(id: $id) @skip(if: false) {
+        ... on Dog @include(if: true) { name }
+        ...DogFields
+        nick: name
+    }
+    dogs(filter: {name: "Rex", age: 3, weight: 1.5, alive: true,
+                  owner: null, kind: GOOD, names: $names}) {
+        name
+    }
+}
+
+fragment DogFields on Dog {
+    age
+}
+
+mutation { doSomething }
+"""
+
+
+class _RecordingVisitor(Visitor):
+    _GETTERS = (
+        "get_value",
+        "get_alias",
+        "get_selection_set_size",
+        "get_selections_size",
+        "get_type_condition",
+        "get_operation",
+        "get_named_type",
+    )
+
+    def __init__(self, stop_on=None):
+        super().__init__()
+        self.events = []
+        self._stop_on = stop_on
+
+    def update(self, event, element):
+        self.continue_child = 1
+        location = element.get_location()
+        self.events.append(
+            (
+                event,
+                element.libgraphql_type,
+                element.name,
+                (
+                    location.line,
+                    location.column,
+                    location.line_end,
+                    location.column_end,
+                ),
+                tuple(
+                    getattr(element, getter)()
+                    for getter in self._GETTERS
+                    if hasattr(element, getter)
+                ),
+            )
+        )
+        if (
+            event == self.IN
+            and self._stop_on is not None
+            and element.name == self._stop_on
+        ):
+            self.continue_child = 0
+
+
+def _cffi_events(query, **kwargs):
+    parser = LibGraphqlParser()
+    visitor = _RecordingVisitor(**kwargs)
+    parser.parse_and_visit(query, visitor)
+    return visitor.events
+
+
+def _document_events(query, **kwargs):
+    visitor = _RecordingVisitor(**kwargs)
+    visit_document(
+        parse_to_document(query, experimental_schema_support=False), visitor
+    )
+    return visitor.events
+
+
+@pytest.mark.parametrize("stop_on", [None, "dog", "filter", "DogFields"])
+def test_visit_document_same_events_as_libgraphqlparser(stop_on):
+    expected = _cffi_events(_QUERY, stop_on=stop_on)
+
+    assert _document_events(_QUERY, stop_on=stop_on) == expected
+    assert len(expected) > 50
+
+
+def test_visit_document_skipped_children():
+    events = _document_events("{ dog { name } cat }", stop_on="dog")
+
+    assert [(event[0], event[1], event[2]) for event in events] == [
+        (Visitor.IN, "Document", None),
+        (Visitor.IN, "OperationDefinition", None),
+        (Visitor.IN, "SelectionSet", None),
+        (Visitor.IN, "Field", "dog"),
+        (Visitor.IN, "Field", "cat"),
+        (Visitor.OUT, "Field", "cat"),
+        (Visitor.OUT, "SelectionSet", None),
+        (Visitor.OUT, "OperationDefinition", None),
+        (Visitor.OUT, "Document", None),
+    ]
+
+
+def test_parse_and_tartify_errors(clean_registry):
+    from tartiflette import Engine
+
+    engine = Engine(
+        """
+        type Dog { name: String }
+        type Query { dog(id: Int): Dog }
+        """
+    )
+
+    operations, errors = engine._parser.parse_and_tartify(
+        engine._schema,
+        """
+    query A { dog(id: 1, unknown: 2) { name unknown ...F } }
+    query A { dog { name { name } } }
+    fragment F on Dog { name unknown }
+    fragment G on Dog { name }
+    """,
+    )
+
+    # Same errors, in the same order, as visiting the libgraphqlparser AST
+    # through its C callbacks used to report
+    assert operations is None
+    assert [error.coerce_value() for error in errors] == [
+        {
+            "message": "Undefined argument < unknown > on field < dog > of "
+            "type < Query >.",
+            "path": None,
+            "locations": [{"line": 2, "column": 26}],
+        },
+        {
+            "message": "field `Dog.unknown` was not found in GraphQL schema.",
+            "path": ["dog", "unknown"],
+            "locations": [{"line": 2, "column": 45}],
+        },
+        {
+            "message": "Operation name < A > should be unique.",
+            "path": None,
+            "locations": [{"line": 2, "column": 5}, {"line": 3, "column": 5}],
+        },
+        {
+            "message": "field `Dog.unknown` was not found in GraphQL schema.",
+            "path": ["dog", "unknown"],
+            "locations": [{"line": 4, "column": 30}],
+        },
+        {
+            "message": "Fragment < G > is never used.",
+            "path": None,
+            "locations": [{"line": 5, "column": 5}],
+        },
+    ]
+
+
+def test_parse_and_tartify_type_system_definition(clean_registry):
+    from tartiflette import Engine
+    from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
+
+    engine = Engine("type Query { dog: String }")
+
+    with pytest.raises(GraphQLSyntaxError):
+        engine._parser.parse_and_tartify(
+            engine._schema, "type Dog { name: String } { dog }"
+        )
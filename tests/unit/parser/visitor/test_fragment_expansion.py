@@ -0,0 +1,116 @@
+import pytest
+
+_SDL = """
+type Dog { name: String friend: Dog }
+
+type Query { dog: Dog }
+"""
+
+
+def _chained_fragments(depth):
+    # Each fragment spreads the next one twice: 2 ** depth fields
+    return (
+        "{ dog { ...F0 } }"
+        + "".join(
+            "fragment F%d on Dog { friend { ...F%d } friend { ...F%d } }"
+            % (index, index + 1, index + 1)
+            for index in range(depth)
+        )
+        + ("fragment F%d on Dog { name }" % depth)
+    )
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        (
+            "{ dog { ...A } } fragment A on Dog { ...A }",
+            {
+                "message": "Cannot spread fragment < A > within itself.",
+                "path": None,
+                "locations": [{"line": 1, "column": 38}],
+            },
+        ),
+        (
+            """
+            { dog { ...A } }
+            fragment A on Dog { name ...B }
+            fragment B on Dog { friend { ...C } }
+            fragment C on Dog { ...A }
+            """,
+            {
+                "message": "Cannot spread fragment < A > within itself.",
+                "path": None,
+                "locations": [
+                    {"line": 3, "column": 38},
+                    {"line": 4, "column": 42},
+                    {"line": 5, "column": 33},
+                ],
+            },
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fragment_expansion_rejected(clean_registry, query, expected):
+    from tartiflette import Engine
+
+    e = Engine(_SDL)
+
+    assert await e.execute(query) == {"data": None, "errors": [expected]}
+
+
+@pytest.mark.asyncio
+async def test_fragment_expansion_budget(clean_registry):
+    from tartiflette import Engine
+
+    e = Engine(_SDL, max_expanded_fields=5)
+
+    # dog + 2 friends + 2 names
+    assert await e.execute(
+        _chained_fragments(1), initial_value={"dog": {"friend": {}}}
+    ) == {"data": {"dog": {"friend": {"name": None}}}}
+
+    # dog + 2 friends + 4 friends + 4 names
+    assert await e.execute(_chained_fragments(2)) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Document expands to more than < 5 > fields.",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fragment_expansion_large_budget(clean_registry):
+    from tartiflette import Engine
+
+    e = Engine(_SDL, max_expanded_fields=10000)
+
+    assert await e.execute(_chained_fragments(40)) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Document expands to more than < 10000 > fields.",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "max_expanded_fields", [{}, {"max_expanded_fields": None}]
+)
+@pytest.mark.asyncio
+async def test_fragment_expansion_budget_disabled(
+    clean_registry, max_expanded_fields
+):
+    from tartiflette import Engine
+
+    # The limit is opt-in: 2 ** 14 fields are accepted by default
+    e = Engine(_SDL, **max_expanded_fields)
+
+    assert await e.execute(_chained_fragments(14)) == {"data": {"dog": None}}
@@ -0,0 +1,177 @@
+import pytest
+
+_SDL = """
+directive @custom(value: Int) on FIELD | INLINE_FRAGMENT | FRAGMENT_SPREAD
+
+interface Pet { name: String }
+
+type Owner { name(upper: Boolean): String pets: [Pet] }
+
+type Dog implements Pet {
+    name: String
+    barkVolume: Int
+    owner: Owner
+}
+
+type Cat implements Pet { name: String meowVolume: Int owner: Owner }
+
+union Animal = Dog | Cat
+
+type Query { pets: [Pet] animals: [Animal] dog: Dog }
+"""
+
+_QUERY = """
+query Pets($upper: Boolean, $value: Int) {
+    pets {
+        ...PetFields
+        ... on Dog @include(if: true) {
+            ...DogFields @custom(value: $value)
+            ...PetFields
+        }
+    }
+    animals {
+        ... on Dog { ...DogFields ...PetFields }
+        ... on Cat { ...PetFields meowVolume }
+    }
+    dog {
+        ...DogFields @skip(if: false)
+        ... on Dog { ...DogFields }
+        owner { pets { ...PetFields } }
+    }
+}
+
+fragment PetFields on Pet {
+    name
+    ... on Dog { barkVolume @custom(value: 1) }
+}
+
+fragment DogFields on Dog {
+    name @skip(if: true)
+    barkVolume
+    owner {
+        name(upper: $upper)
+        pets { ...PetFields }
+    }
+}
+"""
+
+
+def _dump_node(node):
+    return (
+        node.name,
+        node.alias,
+        node.path,
+        node.type_condition,
+        node.has_variables,
+        sorted(node.arguments),
+        [
+            (directive["callables"], repr(directive["args"]))
+            for directive in node.execution_directives
+        ],
+        [_dump_node(child) for child in node.children],
+    )
+
+
+def _dump_operation(operation):
+    return (
+        sorted(operation.variable_usages),
+        [_dump_node(child) for child in operation.children],
+    )
+
+
+def _parse(engine, query):
+    operations, errors = engine._parser.parse_and_tartify(
+        engine._schema, query
+    )
+    return operations, [error.coerce_value() for error in errors or []]
+
+
+@pytest.fixture
+def engine(clean_registry):
+    from tartiflette import Engine
+
+    return Engine(_SDL, schema_name="test_fragment_plan")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        _QUERY,
+        """
+        query { dog { ...F ...F @skip(if: false) } }
+        fragment F on Dog { name unknown owner { ...G } }
+        fragment G on Owner { unknownToo }
+        """,
+        """
+        query { dog { ...F owner { pets { ...F } } } }
+        fragment F on Pet { name ...G }
+        fragment G on Dog { barkVolume ...H }
+        fragment H on Pet { name @custom(value: 2) }
+        """,
+    ],
+)
+def test_fragment_plan_same_operations_as_replay(engine, monkeypatch, query):
+    from tartiflette.parser.visitor import TartifletteVisitor
+
+    operations, errors = _parse(engine, query)
+
+    monkeypatch.setattr(
+        TartifletteVisitor, "_get_fragment_plan", lambda *_args: None
+    )
+    replayed_operations, replayed_errors = _parse(engine, query)
+
+    assert errors == replayed_errors
+    if operations is None:
+        assert replayed_operations is None
+        return
+
+    assert {
+        name: _dump_operation(operation)
+        for name, operation in operations.items()
+    } == {
+        name: _dump_operation(operation)
+        for name, operation in replayed_operations.items()
+    }
+
+
+def test_fragment_plan_planned_once(engine, monkeypatch):
+    from tartiflette.parser.visitor import TartifletteVisitor
+
+    planned = []
+    plan_fragment = TartifletteVisitor._plan_fragment
+
+    def _plan_fragment(self, cfd):
+        planned.append(cfd.name)
+        return plan_fragment(self, cfd)
+
+    monkeypatch.setattr(TartifletteVisitor, "_plan_fragment", _plan_fragment)
+
+    operations, errors = _parse(
+        engine,
+        """
+        query {
+            pets { ...PetFields }
+            animals { ... on Dog { owner { pets { ...PetFields } } } }
+            dog { owner { pets { ...PetFields } } }
+            dog { owner { pets { ...PetFields } } }
+        }
+        fragment PetFields on Pet { name }
+        """,
+    )
+
+    assert errors == []
+    # Once for the spreads into an inline fragment, once for the others
+    assert planned == ["PetFields", "PetFields"]
+    nodes = [
+        operations[None].children[0].children[0],
+        operations[None].children[1].children[0].children[0].children[0],
+        operations[None].children[2].children[0].children[0].children[0],
+        operations[None].children[3].children[0].children[0].children[0],
+    ]
+    assert [node.path for node in nodes] == [
+        ["pets", "name"],
+        ["animals", "owner", "pets", "name"],
+        ["dog", "owner", "pets", "name"],
+        ["dog", "owner", "pets", "name"],
+    ]
+    assert len({id(node) for node in nodes}) == 4
@@ -19,6 +19,28 @@ from tartiflette.types.exceptions.tartiflette import (
 from tartiflette.types.location import Location
 from tartiflette.utils.arguments import UNDEFINED_VALUE
 
+_VISITOR_PATHS = {}
+
+
+def _visitor_path(path):
+    # Same cells for the same paths, as if they were visited by the visitor
+    from tartiflette.parser.visitor.visitor_context import VisitorPath
+
+    if not path:
+        return None
+
+    try:
+        return _VISITOR_PATHS[path]
+    except KeyError:
+        pass
+
+    parent_path, node_name = path.rsplit("/", 1)
+    libgraphql_type, _, name = node_name.rstrip(")").partition("(")
+    _VISITOR_PATHS[path] = VisitorPath(
+        _visitor_path(parent_path), libgraphql_type, name or None
+    )
+    return _VISITOR_PATHS[path]
+
 
 @pytest.fixture
 def a_schema():
@@ -49,13 +71,7 @@ def test_parser_visitor(a_schema):
     tv = TartifletteVisitor(a_schema)
 
     assert a_schema == tv.schema
-    assert tv._vars == {}
-
-    a_dict = {"A": "B"}
-
-    tv = TartifletteVisitor(a_schema, a_dict)
-
-    assert tv._vars == a_dict
+    assert tv.operations == {}
 
 
 def test_parser_visitor__on_argument(a_visitor, an_element):
@@ -64,7 +80,7 @@ def test_parser_visitor__on_argument(a_visitor, an_element):
 
     a_visitor._get_parent_type = Mock(return_value="Query")
     a_visitor._internal_ctx.field_path = ["field", "path"]
-    a_visitor._internal_ctx._fields = {"field/path": field_def_mock}
+    a_visitor._internal_ctx._fields = [Mock(), field_def_mock]
     a_visitor._internal_ctx.node = field_node_mock
     a_visitor._internal_ctx.node.name = "dog"
 
@@ -86,7 +102,7 @@ def test_parser_visitor__on_argument_undefined_field_argument(
     a_visitor._internal_ctx.directive = None
     a_visitor._get_parent_type = Mock(return_value="Query")
     a_visitor._internal_ctx.field_path = ["field", "path"]
-    a_visitor._internal_ctx._fields = {"field/path": field_def_mock}
+    a_visitor._internal_ctx._fields = [Mock(), field_def_mock]
     a_visitor._internal_ctx.node = field_node_mock
     a_visitor._internal_ctx.node.name = "dog"
 
@@ -148,7 +164,7 @@ def test_parser_visitor__on_argument_non_unique_field_argument(
     a_visitor._internal_ctx.directive = None
     a_visitor._get_parent_type = Mock(return_value="Query")
     a_visitor._internal_ctx.field_path = ["field", "path"]
-    a_visitor._internal_ctx._fields = {"field/path": field_def_mock}
+    a_visitor._internal_ctx._fields = [Mock(), field_def_mock]
     a_visitor._internal_ctx.node = field_node_mock
     a_visitor._internal_ctx.node.name = "dog"
 
@@ -280,41 +296,51 @@ def test_parser_visitor__on_variable_in(a_visitor, an_element):
     assert a_visitor._internal_ctx.node.var_name == "a_name"
 
 
-def test_parser_visitor__on_variable_in_no_var_name_ukn_var(
-    a_visitor, an_element
-):
-    from tartiflette.types.exceptions.tartiflette import (
-        UnknownVariableException,
-    )
+def test_parser_visitor__on_variable_in_no_var_name(a_visitor, an_element):
+    from tartiflette.parser.nodes.variable import NodeVariable
 
     del a_visitor._internal_ctx.node.var_name
 
+    a_visitor._internal_ctx.directive = None
+    a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.node.arguments = {}
     a_visitor._internal_ctx.argument = Mock()
-    a_visitor._internal_ctx.argument.name = "an_argument_name"
-    a_visitor._vars = {}
+    a_visitor._internal_ctx.argument.name = "a_name"
 
     a_visitor._on_variable_in(an_element)
 
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], UnknownVariableException)
+    assert a_visitor.exceptions == []
+    assert a_visitor._internal_ctx.node.arguments == {
+        "a_name": a_visitor._internal_ctx.argument
+    }
+    assert a_visitor._internal_ctx.node.has_variables is True
+    assert a_visitor._internal_ctx.argument.has_variables is True
+    assert isinstance(a_visitor._internal_ctx.argument.value, NodeVariable)
+    assert a_visitor._internal_ctx.argument.value.name == "a_name"
+    assert a_visitor._internal_ctx.operation.add_variable_usage.call_args == (
+        ("a_name",),
+    )
 
 
-def test_parser_visitor__on_variable_in_no_var_name(a_visitor, an_element):
+def test_parser_visitor__on_variable_in_directive(a_visitor, an_element):
+    from tartiflette.parser.nodes.variable import NodeVariable
+
     del a_visitor._internal_ctx.node.var_name
 
-    a_visitor._internal_ctx.directive = None
-    a_visitor._internal_ctx.node.arguments = {}
+    a_visitor._internal_ctx.directive = Mock()
+    a_visitor._internal_ctx.directive.arguments = {}
+    a_visitor._internal_ctx.operation = Mock()
+    a_visitor._internal_ctx.node.has_variables = False
     a_visitor._internal_ctx.argument = Mock()
-    a_visitor._internal_ctx.argument.name = "a_name"
-    a_visitor._vars = {"a_name": "a_value"}
+    a_visitor._internal_ctx.argument.name = "if"
 
     a_visitor._on_variable_in(an_element)
 
-    assert a_visitor._internal_ctx.node.arguments == {
-        "a_name": a_visitor._internal_ctx.argument
-    }
+    assert a_visitor._internal_ctx.directive.has_variables is True
+    assert a_visitor._internal_ctx.node.has_variables is False
+    assert isinstance(
+        a_visitor._internal_ctx.directive.arguments["if"].value, NodeVariable
+    )
 
 
 def test_parser_visitor__on_field_in_first_field(a_visitor, an_element):
@@ -515,7 +541,7 @@ def test_parser_visitor__on_field_out(a_visitor, an_element):
     field_mock.arguments = {}
 
     a_visitor._internal_ctx.field_path = ["field", "path"]
-    a_visitor._internal_ctx._fields = {"field/path": field_mock}
+    a_visitor._internal_ctx._fields = [Mock(), field_mock]
     a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.operation.type = "Query"
     a_visitor._internal_ctx.node = Mock()
@@ -550,7 +576,7 @@ def test_parser_visitor__on_field_out_missing_required_argument(
     }
 
     a_visitor._internal_ctx.field_path = ["fieldName"]
-    a_visitor._internal_ctx._fields = {"fieldName": field_mock}
+    a_visitor._internal_ctx._fields = [field_mock]
     a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.operation.type = "Query"
 
@@ -581,147 +607,18 @@ def test_parser_visitor__on_variable_definition_in(a_visitor, an_element):
     assert a_visitor._internal_ctx.node.parent == current_node
 
 
-def test_parser_visitor__validate_type(a_visitor, an_element):
-    a_visitor._validate_type("ninja", "a", str, False)
-
-    assert a_visitor.exceptions == []
-    assert a_visitor.continue_child == 1
-
-    a_visitor._validate_type("ntm", "a", int, False)
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], GraphQLError)
-    assert a_visitor.continue_child == 0
-
-
-def test_parser_visitor__validate_type_invalid_type_dont_care(
-    a_visitor, an_element
-):
-    a_visitor._validate_type("ninja", "a", None, False)
-
-    assert a_visitor.exceptions == []
-    assert a_visitor.continue_child == 1
-
-
-def test_parser_visitor__validate_vars_existing_okay_var(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = False
-    a_visitor._internal_ctx.node.is_nullable = False
-
-    a_visitor._vars = {"LOL": "a_value"}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._validate_type.call_args_list == [
-        (("LOL", "a_value", str, False),)
-    ]
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_is_list(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = True
-    a_visitor._internal_ctx.node.is_nullable = True
-
-    a_visitor._vars = {"LOL": ["a_value_1", "a_value_2"]}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._validate_type.call_args_list == [
-        (("LOL", "a_value_1", str, True),),
-        (("LOL", "a_value_2", str, True),),
-    ]
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_is_list_nok(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = True
-
-    a_visitor._vars = {"LOL": "a_value_1"}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], GraphQLError)
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_has_a_dfv(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.default_value = "a_default_value"
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._vars == {"LOL": "a_default_value"}
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_no_dfv_but_nullable(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_nullable = True
-    a_visitor._internal_ctx.node.default_value = UNDEFINED_VALUE
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._vars == {"LOL": UNDEFINED_VALUE}
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_no_dfv_non_nullable(
-    a_visitor, an_element
-):
-    from tartiflette.types.exceptions.tartiflette import (
-        UnknownVariableException,
-    )
-
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_nullable = False
-    a_visitor._internal_ctx.node.default_value = None
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], UnknownVariableException)
-
-
 def test_parser_visitor__on_variable_definition_out(a_visitor, an_element):
-    a_visitor._validates_vars = Mock()
+    a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.node = Mock()
     current_node = a_visitor._internal_ctx.node
     a_visitor._internal_ctx.node.parent = Mock()
 
     a_visitor._on_variable_definition_out(an_element)
 
-    assert a_visitor._validates_vars.called
+    assert (
+        a_visitor._internal_ctx.operation.add_variable_definition.call_args
+        == ((current_node,),)
+    )
     assert a_visitor._internal_ctx.node != current_node
     assert a_visitor._internal_ctx.node == current_node.parent
 
@@ -974,9 +871,9 @@ def test_parser_visitor_in_v2(
     node_event_callback = Mock()
 
     # Init visitor instance
-    a_visitor._internal_ctx.path = curr_path
+    a_visitor._internal_ctx.path = _visitor_path(curr_path)
     a_visitor.continue_child = continue_child
-    a_visitor._error_path = error_path
+    a_visitor._error_path = _visitor_path(error_path)
     a_visitor._in_fragment_spread_context = in_fragment_spread_context
 
     # Mock visitor callable
@@ -994,9 +891,9 @@ def test_parser_visitor_in_v2(
     assert a_visitor._in(an_element) is None
 
     a_visitor._internal_ctx.move_in.assert_called_once_with(an_element)
-    assert a_visitor._internal_ctx.path == expected_path
+    assert str(a_visitor._internal_ctx.path or "") == expected_path
     assert a_visitor.continue_child == expected_continue_child
-    assert a_visitor._error_path == expected_error_path
+    assert a_visitor._error_path is _visitor_path(expected_error_path)
 
     if event_callback_called:
         node_event_callback.assert_called_once()
@@ -1156,9 +1053,9 @@ def test_parser_visitor_out(
     node_event_callback = Mock()
 
     # Init visitor instance
-    a_visitor._internal_ctx.path = curr_path
+    a_visitor._internal_ctx.path = _visitor_path(curr_path)
     a_visitor.continue_child = continue_child
-    a_visitor._error_path = error_path
+    a_visitor._error_path = _visitor_path(error_path)
     a_visitor._in_fragment_spread_context = in_fragment_spread_context
 
     # Mock visitor callable
@@ -1176,9 +1073,9 @@ def test_parser_visitor_out(
     assert a_visitor._out(an_element) is None
 
     a_visitor._internal_ctx.move_out.assert_called_once()
-    assert a_visitor._internal_ctx.path == expected_path
+    assert str(a_visitor._internal_ctx.path or "") == expected_path
     assert a_visitor.continue_child == expected_continue_child
-    assert a_visitor._error_path == expected_error_path
+    assert a_visitor._error_path is _visitor_path(expected_error_path)
 
     if event_callback_called:
         node_event_callback.assert_called_once()
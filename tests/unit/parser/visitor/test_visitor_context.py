@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -46,47 +46,87 @@ def test_visitor_context__compute_type_cond(
 @pytest.mark.parametrize(
     "current_path,libgraphql_type,name,expected",
     [
-        ("", "FakeType", "nodeName", "/FakeType(nodeName)"),
-        ("/Document", "FakeType", "nodeName", "/Document/FakeType(nodeName)"),
+        (None, "FakeType", "nodeName", "/FakeType(nodeName)"),
+        (
+            ("Document", None),
+            "FakeType",
+            "nodeName",
+            "/Document/FakeType(nodeName)",
+        ),
     ],
 )
 def test_visitor_context_move_in(
     current_path, libgraphql_type, name, expected
 ):
-    def _my_create_node_name(a, b):
-        return a + ("" if not b else "(" + b + ")")
+    from tartiflette.parser.visitor.visitor_context import VisitorPath
+
+    if current_path is not None:
+        current_path = VisitorPath(None, *current_path)
 
     visitor_context = InternalVisitorContext(path=current_path)
 
-    assert visitor_context.path == current_path
+    assert visitor_context.path is current_path
 
     element = Mock()
     element.libgraphql_type = libgraphql_type
     element.name = name
 
-    with patch(
-        "tartiflette.parser.visitor.visitor_context._create_node_name",
-        side_effect=_my_create_node_name,
-    ):
-        visitor_context.move_in(element)
+    visitor_context.move_in(element)
 
-    assert visitor_context.path == expected
+    assert visitor_context.path.parent is current_path
+    assert visitor_context.path.libgraphql_type == libgraphql_type
+    assert visitor_context.path.name == name
+    assert str(visitor_context.path) == expected
 
 
-@pytest.mark.parametrize(
-    "current_path,expected",
-    [
-        ("", ""),
-        ("/Document", ""),
-        ("/Document/FakeType(nodeName)", "/Document"),
-    ],
-)
-def test_visitor_context_move_out(current_path, expected):
-    visitor_context = InternalVisitorContext(path=current_path)
+def test_visitor_context_move_out():
+    from tartiflette.parser.visitor.visitor_context import VisitorPath
+
+    document_path = VisitorPath(None, "Document")
+    visitor_context = InternalVisitorContext(
+        path=VisitorPath(document_path, "FakeType", "nodeName")
+    )
 
-    assert visitor_context.path == current_path
     visitor_context.move_out()
-    assert visitor_context.path == expected
+    assert visitor_context.path is document_path
+    visitor_context.move_out()
+    assert visitor_context.path is None
+    visitor_context.move_out()
+    assert visitor_context.path is None
+
+
+def test_visitor_context_is_within():
+    from tartiflette.parser.visitor.visitor_context import VisitorPath
+
+    document_path = VisitorPath(None, "Document")
+    field_path = VisitorPath(document_path, "Field", "dog")
+    child_path = VisitorPath(field_path, "Field", "name")
+    same_name_path = VisitorPath(document_path, "Field", "dog")
+
+    assert InternalVisitorContext(path=child_path).is_within(field_path)
+    assert InternalVisitorContext(path=field_path).is_within(field_path)
+    assert not InternalVisitorContext(path=document_path).is_within(field_path)
+    assert not InternalVisitorContext(path=same_name_path).is_within(
+        field_path
+    )
+    assert not InternalVisitorContext().is_within(field_path)
+
+
+def test_visitor_context_clone_shares_path():
+    from tartiflette.parser.visitor.visitor_context import VisitorPath
+
+    visitor_context = InternalVisitorContext(
+        path=VisitorPath(None, "Document"),
+        field_path=["rootField"],
+        fields=[Mock()],
+    )
+
+    clone = visitor_context.clone()
+    clone.move_in_field(Mock(), Mock())
+
+    assert clone.path is visitor_context.path
+    assert visitor_context.field_path == ["rootField"]
+    assert len(visitor_context._fields) == 1
 
 
 @pytest.mark.parametrize(
@@ -109,10 +149,7 @@ def test_visitor_context_move_in_field(
     assert visitor_context.field_path == current_field_path
     visitor_context.move_in_field(element, field_mock)
     assert visitor_context.field_path == expected
-    assert (
-        visitor_context._fields[visitor_context._hashed_field_path]
-        is field_mock
-    )
+    assert visitor_context.current_field is field_mock
 
 
 _PARENT_NODE_MOCK = Mock()
@@ -147,47 +184,29 @@ def test_visitor_context_move_out_field(
         node=current_node,
         depth=current_depth,
         field_path=current_field_path,
-        fields={"/".join(current_field_path): field_mock},
+        fields=[field_mock] * current_depth,
     )
 
     assert visitor_context.depth == current_depth
     assert visitor_context.field_path == current_field_path
-    assert (
-        visitor_context._fields[visitor_context._hashed_field_path]
-        is field_mock
-    )
 
     visitor_context.move_out_field()
 
-    assert visitor_context._hashed_field_path not in visitor_context._fields
+    assert visitor_context._fields == [field_mock] * len(expected_field_path)
     assert visitor_context.field_path == expected_field_path
     assert visitor_context.node is expected_node
 
 
-@pytest.mark.parametrize(
-    "current_field_path,expected",
-    [
-        ([], ""),
-        (["rootField"], "rootField"),
-        (["rootField", "fieldName"], "rootField/fieldName"),
-    ],
-)
-def test_visitor_context_hashed_field_path(current_field_path, expected):
-    visitor_context = InternalVisitorContext(field_path=current_field_path)
-    assert visitor_context._hashed_field_path == expected
-
-
 _FIELD_1 = Mock()
 _FIELD_2 = Mock()
 
 
 @pytest.mark.parametrize(
-    "current_field_path,expected",
-    [([], None), (["field1"], _FIELD_1), (["rootField/field2"], _FIELD_2)],
+    "current_fields,expected",
+    [([], None), ([_FIELD_1], _FIELD_1), ([_FIELD_1, _FIELD_2], _FIELD_2)],
 )
-def test_visitor_context_current_field(current_field_path, expected):
+def test_visitor_context_current_field(current_fields, expected):
     visitor_context = InternalVisitorContext(
-        field_path=current_field_path,
-        fields={"field1": _FIELD_1, "rootField/field2": _FIELD_2},
+        field_path=["field"] * len(current_fields), fields=current_fields
     )
     assert visitor_context.current_field is expected
@@ -0,0 +1,70 @@
+import hashlib
+
+import pytest
+
+from tartiflette.persisted_queries import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    PersistedQueryStore,
+    compute_query_hash,
+)
+
+_QUERY = "query { a }"
+_QUERY_HASH = hashlib.sha256(_QUERY.encode("utf-8")).hexdigest()
+
+
+def test_compute_query_hash():
+    assert compute_query_hash(_QUERY) == _QUERY_HASH
+
+
+def test_persisted_query_store_abstract():
+    class GetOnlyStore(PersistedQueryStore):
+        async def get(self, query_hash):
+            return None
+
+    with pytest.raises(TypeError):
+        PersistedQueryStore()
+
+    # Incomplete stores fail when created rather than on the first request
+    with pytest.raises(TypeError):
+        GetOnlyStore()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_persisted_query_store():
+    store = InMemoryPersistedQueryStore(maxsize=1)
+
+    assert await store.get(_QUERY_HASH) is None
+
+    await store.set(_QUERY_HASH, _QUERY)
+
+    assert await store.get(_QUERY_HASH) == _QUERY
+
+    await store.set(compute_query_hash("query { b }"), "query { b }")
+
+    assert await store.get(_QUERY_HASH) is None
+    assert store.cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_file_persisted_query_store(tmpdir):
+    directory = str(tmpdir.join("queries"))
+    store = FilePersistedQueryStore(directory)
+
+    assert await store.get(_QUERY_HASH) is None
+
+    await store.set(_QUERY_HASH, _QUERY)
+
+    assert await store.get(_QUERY_HASH) == _QUERY
+    assert tmpdir.join("queries", "%s.graphql" % _QUERY_HASH).read() == _QUERY
+    assert await FilePersistedQueryStore(directory).get(_QUERY_HASH) == _QUERY
+
+
+@pytest.mark.asyncio
+async def test_file_persisted_query_store_invalid_hash(tmpdir):
+    store = FilePersistedQueryStore(str(tmpdir))
+
+    await store.set("../query", _QUERY)
+
+    assert await store.get("../query") is None
+    assert tmpdir.listdir() == []
@@ -96,7 +96,8 @@ async def test_default_subscription_resolver(parent_result):
     )
 
 
-_CUSTOM_DEFAULT_RESOLVER = lambda *args, **kwargs: {}
+async def _CUSTOM_DEFAULT_RESOLVER(*args, **kwargs):
+    return {}
 
 
 @pytest.mark.parametrize(
@@ -1,3 +1,5 @@
+import asyncio
+
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -80,6 +82,8 @@ async def test_resolver_factory__resolver_executor___call__(
     info = Mock()
     info.execution_ctx = Mock()
     info.execution_ctx.is_introspection = False
+    info.execution_ctx.scheduler = None
+    info.execution_ctx.deadline = None
 
     _resolver_executor_mock._coercer = FakeAsyncMock(return_value="LOL")
     _resolver_executor_mock._introspection = FakeAsyncMock(
@@ -233,3 +237,187 @@ def test_resolver_factory__resolver_executor_update_prop_contains_not_null(
         "A", gql_type=GraphQLList(gql_type="F")
     )
     assert not _resolver_executor_mock.contains_not_null
+
+
+def test_resolver_factory__resolver_executor_bake_resolves_synchronously(
+    _resolver_executor_mock
+):
+    from tartiflette.resolver.factory import default_resolver
+
+    _resolver_executor_mock._schema_field.subscribe = None
+    _resolver_executor_mock._schema_field.directives = []
+    _resolver_executor_mock._schema_field.name = "aField"
+
+    with patch(
+        "tartiflette.resolver.factory.get_sync_coercer", return_value=str
+    ) as get_sync_coercer_mock:
+        _resolver_executor_mock.bake(None)
+
+        assert not _resolver_executor_mock.resolves_synchronously
+        assert not get_sync_coercer_mock.called
+
+        _resolver_executor_mock.update_func(default_resolver)
+        _resolver_executor_mock.bake(None)
+
+        assert _resolver_executor_mock.resolves_synchronously
+        assert _resolver_executor_mock.resolve_sync({"aField": 1}) == "1"
+        assert _resolver_executor_mock.resolve_sync({}) == "None"
+
+        _resolver_executor_mock._schema_field.arguments = {"arg": Mock()}
+        _resolver_executor_mock.bake(None)
+
+        assert not _resolver_executor_mock.resolves_synchronously
+
+
+@pytest.mark.asyncio
+async def test_resolver_factory__resolver_executor_bake_sync_func(
+    _resolver_executor_mock
+):
+    from tartiflette.executors.types import ExecutionContext
+
+    def sync_resolver(parent_result, args, ctx, info):
+        return parent_result + 1
+
+    _resolver_executor_mock._schema_field.subscribe = None
+    _resolver_executor_mock._schema_field.directives = []
+    _resolver_executor_mock.update_func(sync_resolver)
+    _resolver_executor_mock.bake(None)
+
+    assert _resolver_executor_mock._sync_func is sync_resolver
+    assert (
+        await _resolver_executor_mock._directivated_func(1, {}, {}, None) == 2
+    )
+
+    info = Mock(execution_ctx=ExecutionContext())
+    with patch(
+        "tartiflette.resolver.factory.coerce_arguments",
+        new_callable=AsyncMock,
+        return_value={},
+    ):
+        _resolver_executor_mock._coercer = AsyncMock(return_value="coerced")
+
+        assert await _resolver_executor_mock(1, {}, {}, info, []) == (
+            2,
+            "coerced",
+        )
+
+    _resolver_executor_mock._schema_field.directives = [Mock()]
+    with patch("tartiflette.resolver.factory.wraps_with_directives"):
+        _resolver_executor_mock.bake(None)
+
+    assert _resolver_executor_mock._sync_func is None
+
+
+@pytest.mark.asyncio
+async def test_resolver_factory__resolver_executor_bake_run_in_executor(
+    _resolver_executor_mock
+):
+    import threading
+
+    def sync_resolver(parent_result, args, ctx, info):
+        return threading.current_thread()
+
+    _resolver_executor_mock._schema_field.subscribe = None
+    _resolver_executor_mock._schema_field.directives = []
+    _resolver_executor_mock.update_func(sync_resolver, run_in_executor=True)
+    _resolver_executor_mock.bake(None)
+
+    assert _resolver_executor_mock._sync_func is None
+    assert (
+        await _resolver_executor_mock._directivated_func(1, {}, {}, None)
+        is not threading.current_thread()
+    )
+
+
+@pytest.mark.parametrize(
+    "coroutine,run_in_executor", [(True, False), (False, False), (False, True)]
+)
+@pytest.mark.asyncio
+async def test_resolver_factory__resolver_executor_bake_batch(
+    _resolver_executor_mock, coroutine, run_in_executor
+):
+    from tartiflette.executors.types import ExecutionContext
+
+    calls = []
+
+    def sync_batch_resolver(parent_results, args, ctx, info):
+        calls.append((parent_results, args))
+        return [
+            parent_result * arguments["factor"]
+            for parent_result, arguments in zip(parent_results, args)
+        ]
+
+    async def batch_resolver(parent_results, args, ctx, info):
+        return sync_batch_resolver(parent_results, args, ctx, info)
+
+    _resolver_executor_mock._schema_field.subscribe = None
+    _resolver_executor_mock._schema_field.directives = []
+    _resolver_executor_mock.update_func(
+        batch_resolver if coroutine else sync_batch_resolver,
+        run_in_executor=run_in_executor,
+        batch=True,
+    )
+    _resolver_executor_mock.bake(None)
+
+    assert _resolver_executor_mock._sync_func is None
+
+    info = Mock()
+    info.execution_ctx = ExecutionContext()
+    other_info = Mock()
+    other_info.execution_ctx = info.execution_ctx
+
+    resolver = _resolver_executor_mock._directivated_func
+
+    assert await asyncio.gather(
+        resolver(1, {"factor": 2}, {}, info),
+        resolver(2, {"factor": 3}, {}, info),
+        resolver(3, {"factor": 4}, {}, other_info),
+    ) == [2, 6, 12]
+    # One call per field of the query
+    assert sorted(
+        sorted(
+            zip(parent_results, [arguments["factor"] for arguments in args])
+        )
+        for parent_results, args in calls
+    ) == [[(1, 2), (2, 3)], [(3, 4)]]
+
+
+@pytest.mark.asyncio
+async def test_resolver_factory__resolver_executor_call_scheduler(
+    _resolver_executor_mock
+):
+    from tartiflette.executors.types import ExecutionContext
+
+    events = []
+
+    async def resolver(parent_result, args, ctx, info):
+        events.append("resolve")
+        if parent_result == "fail":
+            raise ValueError("fail")
+        return parent_result
+
+    scheduler = Mock()
+    scheduler.acquire = AsyncMock(
+        side_effect=lambda info: events.append("acquire")
+    )
+    scheduler.release = Mock(side_effect=lambda: events.append("release"))
+
+    _resolver_executor_mock._schema_field.subscribe = None
+    _resolver_executor_mock._schema_field.directives = []
+    _resolver_executor_mock._schema_field.arguments = {}
+    _resolver_executor_mock.update_func(resolver)
+    _resolver_executor_mock.bake(None)
+    _resolver_executor_mock._coercer = AsyncMock(return_value="coerced")
+
+    info = Mock()
+    info.execution_ctx = ExecutionContext(scheduler=scheduler)
+
+    assert await _resolver_executor_mock("value", {}, {}, info, []) == (
+        "value",
+        "coerced",
+    )
+    result, _ = await _resolver_executor_mock("fail", {}, {}, info, [])
+
+    assert isinstance(result, ValueError)
+    assert events == ["acquire", "resolve", "release"] * 2
+    assert scheduler.acquire.call_args_list == [((info,),)] * 2
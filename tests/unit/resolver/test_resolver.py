@@ -46,7 +46,9 @@ def test_resolver_resolver_resolver_bake(a_resolver):
 
     assert a_resolver.bake(sch) is None
     assert sch.get_field_by_name.call_args_list == [(("a_resolver",),)]
-    assert a_field.resolver.update_func.call_args_list == [(("A",),)]
+    assert a_field.resolver.update_func.call_args_list == [
+        (("A",), {"run_in_executor": False, "batch": False})
+    ]
 
 
 def test_resolver_resolver_resolver___call__(a_resolver):
@@ -55,10 +57,13 @@ def test_resolver_resolver_resolver___call__(a_resolver):
     with pytest.raises(NonAwaitableResolver):
 
         def a():
-            pass
+            yield
 
         a_resolver(a)
 
+    with pytest.raises(NonAwaitableResolver):
+        a_resolver("a")
+
     async def b():
         pass
 
@@ -69,3 +74,14 @@ def test_resolver_resolver_resolver___call__(a_resolver):
         assert r is b
         assert mocked.call_args_list == [(("default", a_resolver),)]
         assert a_resolver._implementation is b
+
+    def c():
+        pass
+
+    with patch(
+        "tartiflette.schema.registry.SchemaRegistry.register_resolver"
+    ) as mocked:
+        r = a_resolver(c)
+        assert r is c
+        assert mocked.call_args_list == [(("default", a_resolver),)]
+        assert a_resolver._implementation is c
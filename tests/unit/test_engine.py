@@ -279,3 +279,346 @@ async def test_engine_subscribe_with_default_resolver_alias(clean_registry):
         "subscription { aliasCounter: counter(startAt: 4) }"
     ):
         assert result == {"data": {"aliasCounter": expected_values.pop()}}
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_document_cache(clean_registry):
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }", document_cache_size=1)
+
+    assert await e.execute("query { a }") == {"data": {"a": None}}
+    assert await e.execute("query { a }") == {"data": {"a": None}}
+    assert e.document_cache.hits == 1
+    assert e.document_cache.misses == 1
+
+    assert await e.execute("query { b }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "field `Query.b` was not found in GraphQL schema.",
+                "path": ["b"],
+                "locations": [{"line": 1, "column": 9}],
+            }
+        ],
+    }
+    assert e.document_cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_document_cache_syntax_error(clean_registry):
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }")
+
+    first = await e.execute("query { a ")
+    second = await e.execute("query { a ")
+
+    assert first == second
+    assert first["data"] is None
+    assert len(first["errors"]) == 1
+    assert e.document_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_document_cache_variables(clean_registry):
+    from tartiflette.engine import Engine
+    from tartiflette.resolver import Resolver
+
+    @Resolver("Query.hello", schema_name="test_engine_cache_variables")
+    async def resolver_hello(parent, args, *_args, **_kwargs):
+        return "hello " + args["name"]
+
+    e = Engine(
+        "type Query { hello(name: String!): String }",
+        schema_name="test_engine_cache_variables",
+    )
+
+    query = "query Hello($name: String!) { hello(name: $name) }"
+
+    assert await e.execute(query, variables={"name": "Bob"}) == {
+        "data": {"hello": "hello Bob"}
+    }
+    assert await e.execute(query, variables={"name": "Alice"}) == {
+        "data": {"hello": "hello Alice"}
+    }
+    assert e.document_cache.hits == 1
+    assert e.document_cache.misses == 1
+
+    result = await e.execute(query)
+
+    assert result["data"] is None
+    assert all(
+        error["message"] == "< name > is not known"
+        for error in result["errors"]
+    )
+    assert e.document_cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted_query(clean_registry):
+    from tartiflette.engine import Engine
+    from tartiflette.persisted_queries import compute_query_hash
+
+    e = Engine("type Query { a: String }")
+
+    query = "query { a }"
+    query_hash = compute_query_hash(query)
+
+    assert await e.execute(query_hash=query_hash) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+        ],
+    }
+
+    assert await e.execute(query, query_hash=query_hash) == {
+        "data": {"a": None}
+    }
+    assert await e.execute(query_hash=query_hash) == {"data": {"a": None}}
+    assert await e.persisted_query_store.get(query_hash) == query
+    assert e.document_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted_query_hash_mismatch(clean_registry):
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }")
+
+    result = await e.execute("query { a }", query_hash="0" * 64)
+
+    assert result["data"] is None
+    assert result["errors"][0]["extensions"] == {
+        "code": "PERSISTED_QUERY_HASH_MISMATCH"
+    }
+    assert await e.persisted_query_store.get("0" * 64) is None
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted_query_custom_store(clean_registry):
+    from tartiflette.engine import Engine
+    from tartiflette.persisted_queries import (
+        PersistedQueryStore,
+        compute_query_hash,
+    )
+
+    class FailingStore(PersistedQueryStore):
+        async def get(self, query_hash):
+            raise ConnectionError("store unavailable")
+
+        async def set(self, query_hash, query):
+            raise ConnectionError("store unavailable")
+
+    e = Engine(
+        "type Query { a: String }", persisted_query_store=FailingStore()
+    )
+
+    result = await e.execute(query_hash=compute_query_hash("query { a }"))
+
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == "Server encountered an error."
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_no_query_provided(clean_registry):
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }")
+
+    assert await e.execute() == {
+        "data": None,
+        "errors": [
+            {
+                "message": "No query provided",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "NO_QUERY_PROVIDED"},
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_prepare(clean_registry):
+    from tartiflette.engine import Engine, PreparedOperation
+    from tartiflette.resolver import Resolver
+
+    @Resolver("Query.hello", schema_name="test_engine_prepare")
+    async def resolver_hello(parent, args, ctx, *_args, **_kwargs):
+        return "%s %s" % (ctx["greeting"], args["name"])
+
+    e = Engine(
+        "type Query { hello(name: String!): String }",
+        schema_name="test_engine_prepare",
+    )
+
+    prepared = e.prepare(
+        "query Hello($name: String!) { hello(name: $name) }", "Hello"
+    )
+
+    assert isinstance(prepared, PreparedOperation)
+    assert prepared.errors is None
+    assert await prepared.execute(
+        variables={"name": "Bob"}, context={"greeting": "hello"}
+    ) == {"data": {"hello": "hello Bob"}}
+    assert await prepared.execute(
+        variables={"name": "Alice"}, context={"greeting": "bye"}
+    ) == {"data": {"hello": "bye Alice"}}
+    assert e.document_cache.misses == 1
+    assert e.document_cache.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_prepare_errors(clean_registry):
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }")
+
+    prepared = e.prepare("query { b }")
+
+    assert prepared.errors == [
+        {
+            "message": "field `Query.b` was not found in GraphQL schema.",
+            "path": ["b"],
+            "locations": [{"line": 1, "column": 9}],
+        }
+    ]
+    assert await prepared.execute() == {
+        "data": None,
+        "errors": prepared.errors,
+    }
+
+    prepared = e.prepare("query { a }", "Unknown")
+
+    assert prepared.errors == [
+        {
+            "message": "Unknown operation named < Unknown >.",
+            "path": None,
+            "locations": [],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_to_bytes(clean_registry):
+    from tartiflette.engine import Engine
+    from tartiflette.resolver import Resolver
+
+    @Resolver("Query.hello", schema_name="test_engine_execute_to_bytes")
+    async def resolver_hello(parent, args, *_args, **_kwargs):
+        return "héllo %s" % args["name"]
+
+    e = Engine(
+        "type Query { hello(name: String!): String }",
+        schema_name="test_engine_execute_to_bytes",
+    )
+
+    assert await e.execute_to_bytes(
+        "query Hello($name: String!) { hello(name: $name) }",
+        operation_name="Hello",
+        variables={"name": "Bob"},
+    ) == '{"data":{"hello":"héllo Bob"}}'.encode("utf-8")
+    assert await e.execute_to_bytes("query { a }") == (
+        b'{"data":null,"errors":[{"message":"field `Query.a` was not found '
+        b'in GraphQL schema.","path":["a"],"locations":[{"line":1,'
+        b'"column":9}]}]}'
+    )
+
+    prepared = e.prepare('query { hello(name: "Alice") }')
+    assert await prepared.execute_to_bytes() == (
+        '{"data":{"hello":"héllo Alice"}}'.encode("utf-8")
+    )
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_to_bytes_custom_encoder(clean_registry):
+    from tartiflette.engine import Engine
+
+    encoder = Mock(return_value=b"encoded")
+
+    e = Engine("type Query { a: String }", response_encoder=encoder)
+
+    assert (
+        await e.execute_to_bytes("query { a }", initial_value={"a": "b"})
+        == b"encoded"
+    )
+    encoder.assert_called_once_with({"data": {"a": "b"}})
+
+    # Prepared operations raising errors use the encoder of the engine too
+    assert await e.prepare("query { b }").execute_to_bytes() == b"encoded"
+    assert encoder.call_args[0][0]["data"] is None
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_offload_parsing(clean_registry):
+    import threading
+
+    from tartiflette.engine import Engine
+
+    e = Engine("type Query { a: String }", offload_parsing_threshold=20)
+
+    threads = []
+    parse_query = e._parse_query
+
+    def _parse_query(query):
+        threads.append(threading.current_thread())
+        return parse_query(query)
+
+    e._parse_query = _parse_query
+
+    assert await e.execute("{ a }") == {"data": {"a": None}}
+    assert threads == [threading.main_thread()]
+
+    query = "query LongEnough { a }"
+    assert await e.execute(query) == {"data": {"a": None}}
+    assert threads[-1] is not threading.main_thread()
+
+    # Cached documents aren't parsed again
+    assert await e.execute(query) == {"data": {"a": None}}
+    assert len(threads) == 3
+    assert threads[-1] is threading.main_thread()
+    assert e.document_cache.hits == 1
+
+    assert await e.execute("query LongEnough { b }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "field `Query.b` was not found in GraphQL schema.",
+                "path": ["b"],
+                "locations": [{"line": 1, "column": 20}],
+            }
+        ],
+    }
+
+
+def test_engine_parse_from_threads(clean_registry):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tartiflette.engine import Engine
+
+    e = Engine(
+        "type Query { a(n: Int): String }",
+        document_cache_size=0,
+        offload_parsing_threshold=0,
+    )
+
+    queries = [
+        "{ %s }" % " ".join("a%d: a(n: %d)" % (i, j) for i in range(50))
+        for j in range(20)
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(e._parse_query, queries * 5))
+
+    for (operations, errors), j in zip(results, list(range(20)) * 5):
+        assert errors is None
+        assert [
+            (node.alias, node.arguments["n"].value)
+            for node in operations[None].children
+        ] == [("a%d" % i, j) for i in range(50)]
@@ -85,8 +85,8 @@ async def test_resolver_decorator(clean_registry):
     with pytest.raises(NonAwaitableResolver):
 
         @Resolver("Test.simpleField")
-        def func_default_resolver(*args, **kwargs):
-            pass
+        async def func_default_resolver(*args, **kwargs):
+            yield
 
     generated_schema = SchemaBakery.bake("default")
 
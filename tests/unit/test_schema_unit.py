@@ -619,6 +619,8 @@ def test_schema_bake_schema_exclude_builtins_scalars(
                 "/dir/builtins/scalars/string.sdl",
                 "/dir/builtins/scalars/time.sdl",
                 "/dir/builtins/directives.sdl",
+                "/dir/builtins/incremental/defer.sdl",
+                "/dir/builtins/incremental/stream.sdl",
                 "/dir/builtins/introspection.sdl",
             ],
         ),
@@ -632,6 +634,8 @@ def test_schema_bake_schema_exclude_builtins_scalars(
                 "/dir/builtins/scalars/int.sdl",
                 "/dir/builtins/scalars/string.sdl",
                 "/dir/builtins/directives.sdl",
+                "/dir/builtins/incremental/defer.sdl",
+                "/dir/builtins/incremental/stream.sdl",
                 "/dir/builtins/introspection.sdl",
             ],
         ),
@@ -646,6 +650,8 @@ def test_schema_bake_schema_exclude_builtins_scalars(
                 "/dir/builtins/scalars/int.sdl",
                 "/dir/builtins/scalars/string.sdl",
                 "/dir/builtins/directives.sdl",
+                "/dir/builtins/incremental/defer.sdl",
+                "/dir/builtins/incremental/stream.sdl",
                 "/dir/builtins/introspection.sdl",
             ],
         ),
@@ -657,6 +663,23 @@ def test_schema_registry_get_builtins_sdl_files(
     assert _get_builtins_sdl_files(exclude_builtins_scalars) == expected
 
 
+@patch("tartiflette.schema.registry._DIR_PATH", "/dir")
+def test_schema_registry_get_builtins_sdl_files_exclude_directives():
+    assert _get_builtins_sdl_files(None, ["defer"]) == [
+        "/dir/builtins/scalars/boolean.sdl",
+        "/dir/builtins/scalars/date.sdl",
+        "/dir/builtins/scalars/datetime.sdl",
+        "/dir/builtins/scalars/float.sdl",
+        "/dir/builtins/scalars/id.sdl",
+        "/dir/builtins/scalars/int.sdl",
+        "/dir/builtins/scalars/string.sdl",
+        "/dir/builtins/scalars/time.sdl",
+        "/dir/builtins/directives.sdl",
+        "/dir/builtins/incremental/stream.sdl",
+        "/dir/builtins/introspection.sdl",
+    ]
+
+
 @pytest.mark.parametrize(
     "type_name,expected", [("Unknown", False), ("User", True)]
 )
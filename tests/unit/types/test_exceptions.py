@@ -169,3 +169,20 @@ def test_tartifletteerror_coerce_value(
 ):
     graphql_error = TartifletteError(message, **init_kwargs)
     assert graphql_error.coerce_value(**coerce_value_kwargs) == expected
+
+
+def test_tartifletteerror_slots():
+    class CustomError(TartifletteError):
+        def __init__(self, message, code):
+            super().__init__(message, extensions={"code": code})
+            self.code = code
+
+    error = TartifletteError("message")
+    custom_error = CustomError("message", 42)
+
+    # Neither the exception nor its location allocate a `__dict__` of
+    # attributes, those of subclasses are stored in theirs
+    assert error.__dict__ == {}
+    assert not hasattr(Location(1, 2), "__dict__")
+    assert custom_error.__dict__ == {"code": 42}
+    assert custom_error.coerce_value()["extensions"] == {"code": 42}
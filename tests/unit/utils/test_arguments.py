@@ -118,3 +118,48 @@ async def test_coerce_arguments():
         "mySecondArg": "customSecondArgValue",
         "myFourthArg": None,
     }
+
+
+@pytest.mark.asyncio
+async def test_coerce_arguments_errors():
+    import asyncio
+
+    from tartiflette.types.exceptions.tartiflette import (
+        GraphQLError,
+        MultipleException,
+    )
+
+    async def failing_coercer(*_args):
+        await asyncio.sleep(0)
+        raise ValueError("invalid")
+
+    async def multiple_failing_coercer(*_args):
+        raise MultipleException(
+            [GraphQLError("first"), GraphQLError("second")]
+        )
+
+    async def cancelled_coercer(*_args):
+        raise asyncio.CancelledError()
+
+    argument_definitions = {
+        "myFirstArg": _create_mock_def_arg("myFirstArg", "myFirstValue"),
+        "mySecondArg": Mock(coercer=failing_coercer),
+        "myThirdArg": Mock(coercer=multiple_failing_coercer),
+        "myFourthArg": Mock(coercer=failing_coercer),
+    }
+
+    with pytest.raises(MultipleException) as excinfo:
+        await coerce_arguments(argument_definitions, {}, {}, Mock())
+
+    # The errors of all the arguments are collected, in their order
+    assert [str(error) for error in excinfo.value.exceptions] == [
+        "invalid",
+        "first",
+        "second",
+        "invalid",
+    ]
+
+    with pytest.raises(asyncio.CancelledError):
+        await coerce_arguments(
+            {"myArg": Mock(coercer=cancelled_coercer)}, {}, {}, Mock()
+        )
@@ -0,0 +1,73 @@
+from tartiflette.utils.cache import LRUCache
+
+
+def test_lru_cache_get_set():
+    cache = LRUCache(2)
+
+    assert cache.get("a") is None
+    assert cache.get("a", 42) == 42
+
+    cache.set("a", 1)
+    assert "a" in cache
+    assert cache.get("a") == 1
+    assert len(cache) == 1
+
+    assert cache.info() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "size": 1,
+        "maxsize": 2,
+    }
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(0)
+
+    cache.set("a", 1)
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_lru_cache_clear():
+    cache = LRUCache()
+
+    cache.set("a", 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.maxsize == 128
+
+
+def test_lru_cache_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = LRUCache(10)
+
+    def _use_cache(index):
+        cache.set(index, index)
+        cache.get(index - 1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_use_cache, range(10000)))
+
+    assert len(cache) == 10
+    assert cache.hits + cache.misses == 10000
+    assert cache.evictions == 9990
@@ -1,3 +1,4 @@
+from functools import partial
 from unittest.mock import Mock, patch
 
 import pytest
@@ -350,3 +351,61 @@ def test_coercer_factory__set_typename(res, typename, expected):
 
     assert _set_typename(res, typename) is None
     assert get_typename(res) == expected
+
+
+def test_utils_coercers__sync_coercers():
+    from tartiflette.utils.coercer import (
+        _sync_enum_coercer,
+        _sync_list_coercer,
+        _sync_not_null_coercer,
+        _sync_scalar_coercer,
+    )
+
+    scalar_coercer = partial(_sync_scalar_coercer, str)
+    list_coercer = partial(_sync_list_coercer, scalar_coercer)
+    not_null_coercer = partial(_sync_not_null_coercer, list_coercer)
+
+    assert scalar_coercer(None) is None
+    assert scalar_coercer(1) == "1"
+    assert list_coercer(None) is None
+    assert list_coercer(1) == ["1"]
+    assert list_coercer([1, None]) == ["1", None]
+    assert not_null_coercer([1]) == ["1"]
+    with pytest.raises(ValueError):
+        not_null_coercer(None)
+
+    enum_coercer = partial(_sync_enum_coercer, ["A", "B"], str)
+
+    assert enum_coercer(None) is None
+    assert enum_coercer("A") == "A"
+    with pytest.raises(ValueError):
+        enum_coercer("C")
+
+
+def test_utils_coercers__get_sync_coercer(field_mock, enum_mock, scalar_mock):
+    from tartiflette.utils.coercer import _sync_enum_coercer, get_sync_coercer
+
+    for value in enum_mock.values:
+        value._directives = None
+    field_mock.schema.find_type = Mock(return_value=Mock(_directives=None))
+    coercer = get_sync_coercer(field_mock)
+
+    assert coercer.func is _sync_enum_coercer
+    assert coercer.args == (["A", "B"], scalar_mock.coerce_output)
+
+    enum_mock.values[0]._directives = ["a"]
+
+    assert get_sync_coercer(field_mock) is None
+
+    field_mock.schema.find_type = Mock(return_value=Mock(_directives=["a"]))
+
+    assert get_sync_coercer(field_mock) is None
+
+
+def test_utils_coercers__get_sync_coercer_no_schema():
+    from tartiflette.utils.coercer import get_sync_coercer
+
+    f = Mock()
+    f.schema = None
+
+    assert get_sync_coercer(f) is None
@@ -0,0 +1,32 @@
+import json
+
+from tartiflette.utils.encoder import encode_json
+
+
+def test_encode_json():
+    response = {
+        "data": {"items": [{"id": 1, "name": "café ☕"}, None], "ok": True},
+        "errors": [
+            {
+                "message": "boom",
+                "path": ["items", 1],
+                "locations": [{"line": 1, "column": 9}],
+            }
+        ],
+    }
+
+    encoded = encode_json(response)
+
+    assert isinstance(encoded, bytes)
+    assert encoded == json.dumps(
+        response, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    assert json.loads(encoded.decode("utf-8")) == response
+
+
+def test_encode_json_large_response():
+    response = {
+        "data": {"items": [{"id": i, "name": "é%d" % i} for i in range(50000)]}
+    }
+
+    assert json.loads(encode_json(response).decode("utf-8")) == response